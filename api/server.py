@@ -18,11 +18,11 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from voice_agents import (
+    async_stream_tts,
     format_text_for_speech,
     get_media_type_for_format,
     list_models,
     list_voices,
-    stream_tts,
 )
 
 
@@ -233,13 +233,12 @@ async def create_completion(request: CompletionRequest):
             # Default to PCM
             media_type = "audio/pcm"
 
-        # Prepare parameters for stream_tts
+        # Prepare parameters for async_stream_tts
         stream_params = {
             "text_chunks": text_chunks,
             "model": request.model,
             "voice": request.voice,
             "stream_mode": request.stream_mode,
-            "return_generator": True,
         }
 
         # Add provider-specific parameters
@@ -260,9 +259,9 @@ async def create_completion(request: CompletionRequest):
                     request.optimize_streaming_latency
                 )
 
-        # Generate audio stream
+        # Generate audio stream on the event loop (no worker thread per request)
         logger.info("Generating audio stream...")
-        audio_generator = stream_tts(**stream_params)
+        audio_generator = async_stream_tts(**stream_params)
 
         logger.info(f"Streaming audio with media type: {media_type}")
 
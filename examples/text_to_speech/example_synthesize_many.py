@@ -0,0 +1,32 @@
+import os
+
+from voice_agents import synthesize_many
+
+# Example: Render a set of IVR prompts to MP3 files, 8 requests at a time
+prompts = [
+    "Welcome to Acme support.",
+    "Press one for sales.",
+    "Press two for billing.",
+    "Press three for technical support.",
+    "Please hold while we connect your call.",
+]
+
+output_dir = "ivr_prompts"
+os.makedirs(output_dir, exist_ok=True)
+
+print(f"Synthesizing {len(prompts)} prompts...")
+for result in synthesize_many(
+    prompts,
+    model="openai/tts-1",
+    voice="nova",
+    response_format="mp3",
+    max_concurrency=8,
+    ordered=False,  # Save each file as soon as it is ready
+):
+    if result.ok:
+        path = os.path.join(output_dir, f"prompt_{result.index}.mp3")
+        with open(path, "wb") as f:
+            f.write(result.audio)
+        print(f"Saved {path} ({len(result.audio)} bytes)")
+    else:
+        print(f"Failed: {result.text!r}: {result.error}")
@@ -0,0 +1,98 @@
+"""
+Benchmark format_text_for_speech on large documents.
+
+Compares the single-pass segmenter behind format_text_for_speech with the
+previous approach (one re.sub per abbreviation to insert placeholders, a
+split, then a restore loop over every placeholder for every chunk) and
+checks that both produce the same chunks.
+
+Usage:
+    python examples/utilities/benchmark_format_text_for_speech.py
+"""
+
+import random
+import re
+import time
+
+from voice_agents import ABBREVIATIONS, format_text_for_speech
+
+WORDS = (
+    "the model streams tokens to the speaker while the listener waits "
+    "for audio and latency matters more than anything else in a call"
+).split()
+ABBREVIATIONS_EN = ABBREVIATIONS["en"]
+
+
+def placeholder_baseline(text):
+    """The previous implementation, kept here for comparison."""
+    if not text or not text.strip():
+        return []
+    protected_text = text
+    abbrev_map = {}
+    for i, abbrev in enumerate(ABBREVIATIONS_EN):
+        placeholder = f"__ABBREV_{i}__"
+        protected_text = re.sub(
+            r"\b" + re.escape(abbrev), placeholder, protected_text
+        )
+        abbrev_map[placeholder] = abbrev
+    chunks = re.split(
+        r"(?<=[.!?])\s+|(?<=[.!?])$|\n+|(?<=;)\s+|(?<=:\s)",
+        protected_text,
+    )
+    result = []
+    for chunk in chunks:
+        if not chunk or not chunk.strip():
+            continue
+        for placeholder, abbrev in abbrev_map.items():
+            chunk = chunk.replace(placeholder, abbrev)
+        if chunk.strip():
+            result.append(chunk.strip())
+    return result
+
+
+def make_document(num_sentences, seed=0):
+    """Build an LLM-style document with abbreviations, lists and numbers."""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(num_sentences):
+        words = rng.choices(WORDS, k=rng.randint(6, 24))
+        if rng.random() < 0.3:
+            words.insert(
+                rng.randrange(len(words)),
+                rng.choice(ABBREVIATIONS_EN),
+            )
+        if rng.random() < 0.1:
+            words.append(f"{rng.random() * 100:.2f}")
+        end = rng.choice([".", ".", ".", "!", "?", ";", ":"])
+        sentences.append(" ".join(words).capitalize() + end)
+        if rng.random() < 0.1:
+            sentences.append("\n- item")
+    return " ".join(sentences)
+
+
+def measure(function, text, repeat=3):
+    """Best wall time of `repeat` runs, and the chunks produced."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = function(text)
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+if __name__ == "__main__":
+    print(
+        f"{'sentences':>10} {'size':>9} {'chunks':>8} "
+        f"{'segmenter':>14} {'baseline':>14} {'speedup':>8}"
+    )
+    for num_sentences in (100, 1_000, 10_000, 50_000):
+        text = make_document(num_sentences)
+        new_time, new_chunks = measure(format_text_for_speech, text)
+        old_time, old_chunks = measure(placeholder_baseline, text)
+        assert new_chunks == old_chunks, "outputs differ"
+        megabytes = len(text.encode()) / 1e6
+        print(
+            f"{num_sentences:>10} {megabytes:>7.2f}MB {len(new_chunks):>8} "
+            f"{megabytes / new_time:>10.1f}MB/s {megabytes / old_time:>10.1f}MB/s "
+            f"{old_time / new_time:>7.1f}x"
+        )
@@ -19,32 +19,194 @@ from voice_agents.utils import (
     # Constants
     SAMPLE_RATE,
     # Functions
+    async_play_pcm_stream,
     format_text_for_speech,
     get_media_type_for_format,
+    iter_pcm_samples,
     play_audio,
+    play_pcm_samples,
+    play_pcm_stream,
     record_audio,
 )
 
+# Import the shared audio output engine from audio_engine
+from voice_agents.audio_engine import (
+    # Functions
+    configure_audio_engine,
+    get_audio_engine,
+    # Classes
+    AudioEngine,
+)
+
+# Import sentence segmentation from segmenter
+from voice_agents.segmenter import (
+    # Constants
+    ABBREVIATIONS,
+    # Functions
+    get_segmenter,
+    # Classes
+    SentenceSegmenter,
+    StreamingSegmenter,
+)
+
+# Import audio sinks from sinks
+from voice_agents.sinks import (
+    # Functions
+    get_default_sink,
+    set_default_sink,
+    # Classes
+    AudioSink,
+    CallbackSink,
+    DeviceSink,
+    NullSink,
+    NumpySink,
+    WAVFileSink,
+)
+
+# Import sentence stitching from stitch
+from voice_agents.stitch import (
+    # Functions
+    configure_stitching,
+    get_stitch_stats,
+    reset_stitch_stats,
+    stitch_utterances,
+    # Classes
+    SentenceStitcher,
+    StitchSettings,
+    StitchStats,
+)
+
+# Import TTS chunk planning from planner
+from voice_agents.planner import (
+    # Constants
+    CONJUNCTIONS,
+    # Functions
+    plan_chunks,
+    # Classes
+    ChunkPlanner,
+)
+
+# Import cancellation from cancel
+from voice_agents.cancel import (
+    # Classes
+    CancelToken,
+    TTSCancelled,
+)
+
+# Import streaming MP3 decoding from mp3
+from voice_agents.mp3 import (
+    # Functions
+    iter_mp3_samples,
+    streaming_mp3_available,
+    # Classes
+    MP3StreamDecoder,
+)
+
+# Import the G.711 codec from g711
+from voice_agents.g711 import (
+    alaw_to_pcm,
+    pcm_to_alaw,
+    pcm_to_ulaw,
+    ulaw_to_pcm,
+)
+
+# Import incremental WAV parsing from wav
+from voice_agents.wav import (
+    # Functions
+    iter_wav_samples,
+    # Classes
+    WAVStreamParser,
+)
+
+# Import streaming resampling from resample
+from voice_agents.resample import (
+    # Functions
+    resample,
+    # Classes
+    Resampler,
+)
+
 # Import TTS functions and classes from main
 from voice_agents.main import (
     # Functions
+    async_stream_tts,
+    async_stream_tts_elevenlabs,
+    async_stream_tts_groq,
+    async_stream_tts_openai,
     list_models,
     list_voices,
     stream_tts,
     stream_tts_elevenlabs,
+    stream_tts_elevenlabs_ws,
     stream_tts_groq,
     stream_tts_openai,
     # Classes
     StreamingTTSCallback,
 )
 
+# Import audio cache from cache
+from voice_agents.cache import (
+    # Functions
+    make_cache_key,
+    # Classes
+    CacheBackend,
+    DiskCache,
+    MemoryCache,
+    TTSCache,
+)
+
+# Import batch synthesis from batch
+from voice_agents.batch import (
+    # Functions
+    synthesize_many,
+    # Classes
+    SynthesisResult,
+)
+
+# Import retry and circuit breaker controls from resilience
+from voice_agents.resilience import (
+    # Functions
+    configure_resilience,
+    get_resilience_stats,
+    reset_resilience_stats,
+    # Classes
+    CircuitOpenError,
+    ResilienceStats,
+    RetryPolicy,
+)
+
+# Import STT upload preprocessing from upload
+from voice_agents.upload import (
+    # Functions
+    configure_upload,
+    encode_audio,
+    get_upload_stats,
+    reset_upload_stats,
+    # Classes
+    UploadSettings,
+    UploadStats,
+)
+
 # Import STT functions from speech_to_text
 from voice_agents.speech_to_text import (
+    async_speech_to_text,
+    async_speech_to_text_elevenlabs,
+    async_speech_to_text_groq,
     speech_to_text,
     speech_to_text_elevenlabs,
     speech_to_text_groq,
 )
 
+# Import long-audio transcription from long_audio
+from voice_agents.long_audio import (
+    # Functions
+    split_on_silence,
+    transcribe_long_audio,
+    # Classes
+    LongTranscript,
+    TranscriptSegment,
+)
+
 __all__ = [
     # Constants from models_and_voices
     "ELEVENLABS_TTS_MODELS",
@@ -61,21 +223,109 @@ __all__ = [
     # Constants from utils
     "SAMPLE_RATE",
     # Functions from utils
+    "async_play_pcm_stream",
     "format_text_for_speech",
     "get_media_type_for_format",
+    "iter_pcm_samples",
     "play_audio",
+    "play_pcm_samples",
+    "play_pcm_stream",
     "record_audio",
+    # Audio output engine
+    "configure_audio_engine",
+    "get_audio_engine",
+    "AudioEngine",
+    # Sentence segmentation
+    "ABBREVIATIONS",
+    "get_segmenter",
+    "SentenceSegmenter",
+    "StreamingSegmenter",
+    # Audio sinks
+    "get_default_sink",
+    "set_default_sink",
+    "AudioSink",
+    "CallbackSink",
+    "DeviceSink",
+    "NullSink",
+    "NumpySink",
+    "WAVFileSink",
+    # Sentence stitching
+    "configure_stitching",
+    "get_stitch_stats",
+    "reset_stitch_stats",
+    "stitch_utterances",
+    "SentenceStitcher",
+    "StitchSettings",
+    "StitchStats",
+    # TTS chunk planning
+    "CONJUNCTIONS",
+    "plan_chunks",
+    "ChunkPlanner",
+    # Cancellation
+    "CancelToken",
+    "TTSCancelled",
+    # Streaming MP3 decoding
+    "iter_mp3_samples",
+    "streaming_mp3_available",
+    "MP3StreamDecoder",
+    # Incremental WAV parsing
+    "iter_wav_samples",
+    "WAVStreamParser",
+    # G.711 codec
+    "alaw_to_pcm",
+    "pcm_to_alaw",
+    "pcm_to_ulaw",
+    "ulaw_to_pcm",
+    # Streaming resampling
+    "resample",
+    "Resampler",
     # Functions from main (TTS)
+    "async_stream_tts",
+    "async_stream_tts_elevenlabs",
+    "async_stream_tts_groq",
+    "async_stream_tts_openai",
     "list_models",
     "list_voices",
     "stream_tts",
     "stream_tts_elevenlabs",
+    "stream_tts_elevenlabs_ws",
     "stream_tts_groq",
     "stream_tts_openai",
     # Classes from main
     "StreamingTTSCallback",
+    # Audio cache
+    "make_cache_key",
+    "CacheBackend",
+    "DiskCache",
+    "MemoryCache",
+    "TTSCache",
+    # Batch synthesis
+    "synthesize_many",
+    "SynthesisResult",
+    # Resilience
+    "configure_resilience",
+    "get_resilience_stats",
+    "reset_resilience_stats",
+    "CircuitOpenError",
+    "ResilienceStats",
+    "RetryPolicy",
+    # STT upload preprocessing
+    "configure_upload",
+    "encode_audio",
+    "get_upload_stats",
+    "reset_upload_stats",
+    "UploadSettings",
+    "UploadStats",
     # Functions from speech_to_text (STT)
+    "async_speech_to_text",
+    "async_speech_to_text_elevenlabs",
+    "async_speech_to_text_groq",
     "speech_to_text",
     "speech_to_text_elevenlabs",
     "speech_to_text_groq",
+    # Long-audio transcription
+    "split_on_silence",
+    "transcribe_long_audio",
+    "LongTranscript",
+    "TranscriptSegment",
 ]
@@ -0,0 +1,346 @@
+import atexit
+import threading
+import time
+from typing import Optional, Union
+
+import numpy as np
+
+from voice_agents.resample import Resampler
+
+# Used when nothing has been played yet (OpenAI PCM rate)
+_DEFAULT_SAMPLE_RATE = 24000
+
+
+class AudioEngine:
+    """
+    Long-lived, callback-driven audio output.
+
+    One `sounddevice.OutputStream` stays open and is drained by the PortAudio callback
+    from a float32 ring buffer that producers fill with `write`. Consecutive
+    chunks and sentences therefore play back to back, without reopening the
+    device (and paying its start-up latency) for every buffer as
+    `sd.play` + `sd.wait` does.
+
+    The device is opened lazily on the first write. Use `get_audio_engine`
+    rather than creating engines directly so every playback path shares one
+    device stream. Audio written at another rate is converted to the device
+    rate with a streaming polyphase `Resampler` (one per source rate, whose
+    state carries over between writes of the same utterance).
+
+    Args:
+        sample_rate (int): Output sample rate in Hz.
+        blocksize (int): Frames per callback. 0 lets PortAudio choose the
+            optimal (often variable) size. Default is 0.
+        latency (Union[str, float]): Device latency, "low", "high" or seconds. Default is "low".
+        buffer_seconds (float): Ring buffer capacity. Writers block while it is full. Default is 5.0.
+        device (Optional[Union[int, str]]): Output device; None uses the system default.
+
+    Attributes:
+        underruns (int): Callbacks that ran out of audio in the middle of an
+            utterance (the producer fell behind real time) and played silence.
+        device_underflows (int): Output underflows reported by PortAudio itself.
+        frames_written (int): Frames accepted by `write`.
+        frames_played (int): Frames handed to the device.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        blocksize: int = 0,
+        latency: Union[str, float] = "low",
+        buffer_seconds: float = 5.0,
+        device: Optional[Union[int, str]] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
+        self.latency = latency
+        self.device = device
+        self._ring = np.zeros(
+            max(1, int(buffer_seconds * sample_rate)),
+            dtype=np.float32,
+        )
+        # Absolute frame positions; the ring index is position % capacity
+        self._read = 0
+        self._write = 0
+        self._active = False
+        self._cond = threading.Condition()
+        self._stream = None
+        self._resamplers = {}
+
+        self.underruns = 0
+        self.device_underflows = 0
+        self.frames_written = 0
+        self.frames_played = 0
+
+    def _callback(self, outdata, frames, time_info, status) -> None:
+        if status.output_underflow:
+            self.device_underflows += 1
+        out = outdata[:, 0]
+        with self._cond:
+            count = min(frames, self._write - self._read)
+            if count:
+                capacity = len(self._ring)
+                start = self._read % capacity
+                first = min(count, capacity - start)
+                out[:first] = self._ring[start : start + first]
+                out[first:count] = self._ring[: count - first]
+                self._read += count
+                self.frames_played += count
+            if count < frames:
+                out[count:] = 0
+                if self._active:
+                    self.underruns += 1
+            self._cond.notify_all()
+
+    def _ensure_stream(self) -> None:
+        if self._stream is None:
+            # Imported here so headless machines without PortAudio can still
+            # import the library and use the other audio sinks
+            try:
+                import sounddevice as sd
+            except (ImportError, OSError) as e:
+                raise ValueError(
+                    f"Audio playback requires sounddevice and PortAudio ({e}). "
+                    "Install them, or pass another sink (e.g. WAVFileSink, "
+                    "NumpySink, NullSink) or call set_default_sink()."
+                )
+            self._stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype="float32",
+                blocksize=self.blocksize,
+                latency=self.latency,
+                device=self.device,
+                callback=self._callback,
+            )
+            self._stream.start()
+
+    def write(
+        self, samples: np.ndarray, sample_rate: Optional[int] = None
+    ) -> int:
+        """
+        Queue mono samples for playback, blocking while the ring buffer is full.
+
+        Args:
+            samples (np.ndarray): int16 samples, or float samples in [-1, 1].
+            sample_rate (Optional[int]): Rate of `samples`. None (or the
+                engine's rate) plays them as is; any other rate is resampled.
+
+        Returns:
+            int: Number of frames queued (at the device rate).
+        """
+        if sample_rate not in (None, self.sample_rate):
+            resampler = self._resamplers.get(sample_rate)
+            if resampler is None:
+                resampler = self._resamplers[sample_rate] = Resampler(
+                    sample_rate, self.sample_rate
+                )
+            samples = resampler.push(samples)
+        return self._write_frames(samples)
+
+    def _write_frames(self, samples: np.ndarray) -> int:
+        if len(samples) == 0:
+            return 0
+        if samples.dtype == np.int16:
+            samples = samples.astype(np.float32) / 32768.0
+        else:
+            samples = samples.astype(np.float32, copy=False)
+
+        self._ensure_stream()
+        capacity = len(self._ring)
+        offset = 0
+        with self._cond:
+            self._active = True
+            while offset < len(samples):
+                free = capacity - (self._write - self._read)
+                if free == 0:
+                    if (
+                        self._stream is None
+                        or not self._stream.active
+                    ):
+                        # Closed or stopped device: nothing will drain the ring
+                        break
+                    self._cond.wait(timeout=0.5)
+                    continue
+                count = min(free, len(samples) - offset)
+                start = self._write % capacity
+                first = min(count, capacity - start)
+                self._ring[start : start + first] = samples[
+                    offset : offset + first
+                ]
+                self._ring[: count - first] = samples[
+                    offset + first : offset + count
+                ]
+                self._write += count
+                offset += count
+            self.frames_written += offset
+        return offset
+
+    def drain(self) -> None:
+        """
+        Mark the end of the current utterance and wait until it has been played.
+
+        Running out of audio after `drain` is not counted as an underrun.
+        """
+        # Play the tails held back by the resamplers; the next utterance
+        # starts from fresh filter state
+        resamplers, self._resamplers = self._resamplers, {}
+        for resampler in resamplers.values():
+            self._write_frames(resampler.flush())
+        with self._cond:
+            self._active = False
+            while (
+                self._read < self._write and self._stream is not None
+            ):
+                if not self._stream.active:
+                    break
+                self._cond.wait(timeout=0.5)
+        if self._stream is not None:
+            # Let the samples already handed to the device finish playing
+            latency = getattr(self._stream, "latency", 0) or 0
+            time.sleep(float(latency))
+
+    def play(
+        self, samples: np.ndarray, sample_rate: Optional[int] = None
+    ) -> None:
+        """Write samples (at `sample_rate`, see `write`) and wait until they have been played."""
+        self.write(samples, sample_rate)
+        self.drain()
+
+    def clear(self) -> None:
+        """Discard queued audio that has not been played yet."""
+        self._resamplers = {}
+        with self._cond:
+            self._read = self._write
+            self._active = False
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Stop and close the device stream. The engine reopens it on the next write."""
+        self._resamplers = {}
+        with self._cond:
+            stream, self._stream = self._stream, None
+            self._read = self._write
+            self._active = False
+            self._cond.notify_all()
+        if stream is not None:
+            stream.stop()
+            stream.close()
+
+    @property
+    def buffered_frames(self) -> int:
+        """Frames written but not yet handed to the device."""
+        return self._write - self._read
+
+    def stats(self) -> dict:
+        """Return the engine's counters and configuration as a dict."""
+        return {
+            "sample_rate": self.sample_rate,
+            "blocksize": self.blocksize,
+            "latency": self.latency,
+            "underruns": self.underruns,
+            "device_underflows": self.device_underflows,
+            "frames_written": self.frames_written,
+            "frames_played": self.frames_played,
+            "buffered_frames": self.buffered_frames,
+        }
+
+
+_engine: Optional[AudioEngine] = None
+_engine_config: dict = {}
+_fixed_sample_rate: Optional[int] = None
+_engine_lock = threading.Lock()
+
+
+def configure_audio_engine(
+    blocksize: int = 0,
+    latency: Union[str, float] = "low",
+    buffer_seconds: float = 5.0,
+    device: Optional[Union[int, str]] = None,
+    sample_rate: Optional[int] = None,
+) -> None:
+    """
+    Configure the shared output engine used by every playback function.
+
+    Any open engine is drained and closed; the next playback opens the device
+    with the new settings.
+
+    Args:
+        blocksize (int): Frames per callback; 0 lets PortAudio choose. Default is 0.
+        latency (Union[str, float]): "low", "high" or seconds. Default is "low".
+        buffer_seconds (float): Ring buffer capacity in seconds. Default is 5.0.
+        device (Optional[Union[int, str]]): Output device; None uses the system default.
+        sample_rate (Optional[int]): Fixed device rate. Audio at other rates
+            (e.g. 22.05/44.1 kHz provider streams on a 48 kHz device) is
+            resampled instead of reopening the device. None follows each
+            stream's rate. Default is None.
+
+    Example:
+        >>> configure_audio_engine(blocksize=480, latency=0.02)
+        >>> configure_audio_engine(sample_rate=48000)
+    """
+    global _engine, _fixed_sample_rate
+    with _engine_lock:
+        _fixed_sample_rate = sample_rate
+        _engine_config.clear()
+        _engine_config.update(
+            blocksize=blocksize,
+            latency=latency,
+            buffer_seconds=buffer_seconds,
+            device=device,
+        )
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.drain()
+        engine.close()
+
+
+def get_audio_engine(
+    sample_rate: Optional[int] = None,
+) -> AudioEngine:
+    """
+    Return the shared output engine, opened at the requested sample rate.
+
+    If the current engine runs at a different rate, its queued audio is played
+    out and it is replaced by an engine at the new rate, so each stream plays
+    at its native rate without resampling. When a fixed device rate has been
+    set with `configure_audio_engine(sample_rate=...)`, that engine is always
+    returned; pass the stream's rate to `write`/`play` to have it resampled.
+
+    Args:
+        sample_rate (Optional[int]): Required sample rate. None returns the
+            current engine whatever its rate (24 kHz if none exists yet).
+
+    Returns:
+        AudioEngine: The shared engine.
+
+    Example:
+        >>> engine = get_audio_engine()
+        >>> engine.stats()["underruns"]
+        0
+    """
+    global _engine
+    with _engine_lock:
+        previous = None
+        if _fixed_sample_rate is not None:
+            sample_rate = _fixed_sample_rate
+        if _engine is not None and sample_rate not in (
+            None,
+            _engine.sample_rate,
+        ):
+            previous, _engine = _engine, None
+        if _engine is None:
+            _engine = AudioEngine(
+                sample_rate or _DEFAULT_SAMPLE_RATE, **_engine_config
+            )
+        engine = _engine
+    if previous is not None:
+        previous.drain()
+        previous.close()
+    return engine
+
+
+@atexit.register
+def _close_audio_engine() -> None:
+    if _engine is not None:
+        _engine.close()
@@ -0,0 +1,241 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Generator, Iterable, List, Optional, Union
+
+from loguru import logger
+
+from voice_agents.cache import CacheBackend
+from voice_agents.main import (
+    _TTSRequest,
+    _iter_tts_response,
+    _prepare_tts_request,
+    _resolve_tts_route,
+    _verbose_logging_enabled,
+)
+
+
+@dataclass
+class SynthesisResult:
+    """
+    Outcome of one text in a `synthesize_many` batch.
+
+    Attributes:
+        index (int): Position of the text in the input sequence.
+        text (str): The text that was synthesized.
+        audio (Optional[bytes]): Complete audio in the requested format, or None on failure.
+        error (Optional[Exception]): The error raised for this item, or None on success.
+    """
+
+    index: int
+    text: str
+    audio: Optional[bytes] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the item was synthesized successfully."""
+        return self.error is None
+
+
+def _synthesize_one(
+    request: _TTSRequest, index: int, text: str
+) -> SynthesisResult:
+    """Synthesize a single text, capturing any error in the result."""
+    try:
+        audio = b"".join(
+            _iter_tts_response(request, request.build_payload(text))
+        )
+        if not audio:
+            raise ValueError(
+                "No audio data received from the TTS API."
+            )
+        return SynthesisResult(index=index, text=text, audio=audio)
+    except Exception as e:
+        return SynthesisResult(index=index, text=text, error=e)
+
+
+def _run_batch(
+    request: _TTSRequest,
+    texts: Iterable[str],
+    max_concurrency: int,
+    ordered: bool,
+    verbose_logging: bool,
+) -> Generator[SynthesisResult, None, None]:
+    """
+    Run the batch on a thread pool and yield results as they become available.
+
+    Texts are pulled lazily and at most `2 * max_concurrency` items are
+    pending at once, so arbitrarily long inputs use bounded memory while the
+    workers always have the next request ready.
+    """
+    window = 2 * max_concurrency
+    items = enumerate(texts)
+    pending: "deque[Future]" = deque()
+    completed = 0
+    failed = 0
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency,
+        thread_name_prefix="voice-agents-batch",
+    )
+
+    def submit_next() -> bool:
+        for index, text in items:
+            pending.append(
+                executor.submit(_synthesize_one, request, index, text)
+            )
+            return True
+        return False
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                # Results are yielded strictly in input order
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(f for f in pending if f in done)
+                pending.remove(future)
+
+            result = future.result()
+            submit_next()
+
+            completed += 1
+            if not result.ok:
+                failed += 1
+                if verbose_logging:
+                    logger.warning(
+                        f"⚠️  Item {result.index} failed: {result.error}"
+                    )
+            elif verbose_logging:
+                logger.debug(
+                    f"   ✅ Item {result.index}: {len(result.audio)} bytes"
+                )
+            yield result
+    finally:
+        # If the consumer stopped early, drop queued items instead of
+        # waiting for them; requests already running finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if verbose_logging:
+        logger.info(
+            f"📊 Batch complete: {completed} items, {failed} failed"
+        )
+        logger.info("=" * 80)
+
+
+def synthesize_many(
+    texts: Union[List[str], Iterable[str]],
+    model: str = "openai/tts-1",
+    voice: Optional[str] = None,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+    # OpenAI/Groq-specific parameters
+    response_format: Optional[str] = None,
+    # ElevenLabs-specific parameters
+    voice_id: Optional[str] = None,
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    output_format: Optional[str] = None,
+    optimize_streaming_latency: Optional[int] = None,
+    enable_logging: bool = True,
+    verbose: Optional[bool] = None,
+    cache: Optional[CacheBackend] = None,
+) -> Generator[SynthesisResult, None, None]:
+    """
+    Synthesize many independent texts with bounded concurrency.
+
+    Each text becomes one TTS request. Up to `max_concurrency` requests run at
+    once on worker threads, multiplexed over the shared HTTP/2 client, and each
+    complete audio file is returned as a `SynthesisResult`. A failing item is
+    reported in its result (`error`) and does not abort the rest of the batch.
+
+    Arguments are validated and the API key is read before the generator is
+    returned; requests start when iteration begins.
+
+    Args:
+        texts (Union[List[str], Iterable[str]]): Texts to synthesize, one audio file per text.
+            Iterables are consumed lazily.
+        model (str): The model name in format "provider/model_name". See `stream_tts`.
+        voice (Optional[str]): Voice identifier. See `stream_tts`.
+        max_concurrency (int): Maximum number of requests in flight at once. Default is 8.
+        ordered (bool): If True, yield results in input order. If False, yield each
+            result as soon as it completes. Default is True.
+        response_format (Optional[str]): OpenAI/Groq audio format. Defaults to the provider default.
+        voice_id (Optional[str]): ElevenLabs-specific voice ID.
+        stability (float): ElevenLabs-specific stability setting. Default is 0.5.
+        similarity_boost (float): ElevenLabs-specific similarity boost. Default is 0.75.
+        output_format (Optional[str]): ElevenLabs-specific output format.
+        optimize_streaming_latency (Optional[int]): ElevenLabs-specific latency optimization (0-4).
+        enable_logging (bool): ElevenLabs-specific logging setting. Default is True.
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Texts already in the
+            cache are returned without a request. Default is None (no caching).
+
+    Returns:
+        Generator[SynthesisResult, None, None]: One result per input text.
+
+    Raises:
+        ValueError: If max_concurrency is less than 1, the provider is unknown,
+            a required voice is missing, or the API key is not set.
+
+    Example:
+        >>> prompts = ["Press one for sales.", "Press two for support."]
+        >>> for result in synthesize_many(prompts, model="openai/tts-1", voice="nova",
+        ...                               response_format="mp3", max_concurrency=16):
+        ...     if result.ok:
+        ...         with open(f"prompt_{result.index}.mp3", "wb") as f:
+        ...             f.write(result.audio)
+        ...     else:
+        ...         print(f"{result.text!r} failed: {result.error}")
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
+
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency must be at least 1, got {max_concurrency}."
+        )
+
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting Batch TTS Synthesis")
+        logger.info(
+            f"   Model: {model} | Voice: {voice or voice_id} | "
+            f"Max Concurrency: {max_concurrency} | Ordered: {ordered}"
+        )
+
+    provider, provider_kwargs = _resolve_tts_route(
+        model,
+        voice=voice,
+        response_format=response_format,
+        voice_id=voice_id,
+        stability=stability,
+        similarity_boost=similarity_boost,
+        output_format=output_format,
+        optimize_streaming_latency=optimize_streaming_latency,
+        enable_logging=enable_logging,
+        verbose_logging=verbose_logging,
+    )
+    request = _prepare_tts_request(
+        provider,
+        provider_kwargs,
+        playback=False,
+        verbose_logging=verbose_logging,
+    )
+    request.cache = cache
+
+    return _run_batch(
+        request, texts, max_concurrency, ordered, verbose_logging
+    )
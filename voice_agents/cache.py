@@ -0,0 +1,293 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from loguru import logger
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    voice: str,
+    audio_format: str,
+    text: str,
+    stability: Optional[float] = None,
+    similarity_boost: Optional[float] = None,
+) -> str:
+    """
+    Build the content address of a synthesized utterance.
+
+    Everything that changes the audio is part of the key. Whitespace in the
+    text is collapsed so "Hello  world " and "Hello world" share an entry;
+    case and punctuation are kept because they change the prosody.
+
+    Args:
+        provider: Provider name ("openai", "elevenlabs" or "groq").
+        model: Provider model name.
+        voice: Voice name or voice ID.
+        audio_format: Response/output format (e.g. "pcm", "mp3_44100_128").
+        text: Text being synthesized.
+        stability: ElevenLabs stability setting, if any.
+        similarity_boost: ElevenLabs similarity boost setting, if any.
+
+    Returns:
+        str: Hex SHA-256 digest identifying the audio.
+    """
+    identity = json.dumps(
+        [
+            provider,
+            model,
+            voice,
+            audio_format,
+            stability,
+            similarity_boost,
+            " ".join(text.split()),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class CacheBackend:
+    """
+    Interface for TTS audio cache storage.
+
+    Implement `get` and `set` (and optionally `clear`) to plug in another
+    store, e.g. Redis or an object store. Implementations must be thread-safe
+    and should never raise on storage errors; a failed lookup is a miss.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the audio stored under key, or None on a miss."""
+        raise NotImplementedError
+
+    def set(self, key: str, audio: bytes) -> None:
+        """Store audio under key."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache bounded by total audio size.
+
+    Args:
+        max_bytes (int): Maximum total size of cached audio. Default is 64 MB.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+            return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = audio
+            self._size += len(audio)
+            # Evict least recently used entries
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """
+    On-disk LRU cache bounded by total file size.
+
+    Each entry is one file named after its key. Writes are atomic (temporary
+    file + rename), and recency is tracked through file modification times so
+    the LRU order survives restarts.
+
+    Args:
+        directory (str): Directory to store audio files in. Created if missing.
+        max_bytes (int): Maximum total size of cached files. Default is 1 GB.
+    """
+
+    _SUFFIX = ".audio"
+
+    def __init__(
+        self, directory: str, max_bytes: int = 1024 * 1024 * 1024
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        # Rebuild the LRU index from what is already on disk
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        existing = []
+        for name in os.listdir(directory):
+            if not name.endswith(self._SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue
+            existing.append(
+                (
+                    stat.st_mtime,
+                    name[: -len(self._SUFFIX)],
+                    stat.st_size,
+                )
+            )
+        for _, key, size in sorted(existing):
+            self._entries[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self._SUFFIX)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                size = self._entries.pop(key, None)
+                if size is not None:
+                    self._size -= size
+            return None
+        return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.directory, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logger.warning(
+                f"⚠️  Could not write TTS cache entry: {e}"
+            )
+            return
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous
+            self._entries[key] = len(audio)
+            self._size += len(audio)
+            # Evict least recently used files
+            while self._size > self.max_bytes:
+                old_key, size = self._entries.popitem(last=False)
+                self._size -= size
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.unlink(self._path(old_key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._size = 0
+        for key in keys:
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTSCache(CacheBackend):
+    """
+    Tiered TTS audio cache: in-memory LRU in front of an optional disk LRU.
+
+    Lookups try each tier in order and promote hits into the faster tiers;
+    stores write through to every tier. Pass `backends` to use custom tiers
+    (any `CacheBackend`), e.g. a memory tier in front of a shared Redis store.
+
+    Args:
+        directory (Optional[str]): Directory for the disk tier. If None, only memory is used.
+        max_memory_bytes (int): Size cap of the memory tier. Default is 64 MB.
+        max_disk_bytes (int): Size cap of the disk tier. Default is 1 GB.
+        backends (Optional[List[CacheBackend]]): Explicit tiers, fastest first.
+            Overrides the other arguments.
+
+    Example:
+        >>> cache = TTSCache(directory="~/.cache/voice_agents")
+        >>> stream_tts(["Thanks for calling!"], model="openai/tts-1", cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+        backends: Optional[List[CacheBackend]] = None,
+    ):
+        if backends is None:
+            backends = [MemoryCache(max_memory_bytes)]
+            if directory is not None:
+                backends.append(
+                    DiskCache(
+                        os.path.expanduser(directory), max_disk_bytes
+                    )
+                )
+        self.backends = backends
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        for tier, backend in enumerate(self.backends):
+            audio = backend.get(key)
+            if audio is not None:
+                # Promote into the faster tiers
+                for faster in self.backends[:tier]:
+                    faster.set(key, audio)
+                self.hits += 1
+                return audio
+        self.misses += 1
+        return None
+
+    def set(self, key: str, audio: bytes) -> None:
+        for backend in self.backends:
+            backend.set(key, audio)
+
+    def clear(self) -> None:
+        for backend in self.backends:
+            backend.clear()
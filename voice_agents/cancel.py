@@ -0,0 +1,178 @@
+import functools
+import threading
+from typing import Callable, Generator, Iterable, Optional
+
+import numpy as np
+
+from voice_agents.sinks import AudioSink, _resolve_sink
+
+
+class TTSCancelled(BaseException):
+    """
+    Raised inside a TTS call whose `CancelToken` has been cancelled.
+
+    Like `asyncio.CancelledError` it derives from BaseException, so the
+    `except Exception` error handling along the playback path lets it
+    through; the `stream_tts*` functions catch it and return normally.
+    """
+
+
+class CancelToken:
+    """
+    Stop a running TTS call from another thread (barge-in).
+
+    Pass the token as `cancel=` to `stream_tts` (or a provider function) or
+    `StreamingTTSCallback`, and call `cancel()` when the user interrupts.
+    In-flight HTTP responses are closed, prefetched requests are dropped,
+    no further text is requested, and audio still queued in the sink is
+    discarded right away, so the device stops within one audio block. The
+    call then returns as if it had finished.
+
+    A token cancels once; use a new token for the next utterance.
+
+    Attributes:
+        played_seconds (float): Audio delivered to the sink and not discarded,
+            i.e. how much of the response the user actually heard.
+
+    Example:
+        >>> token = CancelToken()
+        >>> threading.Thread(target=stream_tts, args=(chunks,), kwargs={"cancel": token}).start()
+        >>> ...  # the user starts talking
+        >>> token.cancel()
+        >>> token.played_seconds
+        2.35
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = {}
+        self._next_id = 0
+        self._written_seconds = 0.0
+        self._discarded_seconds = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether `cancel()` has been called."""
+        return self._event.is_set()
+
+    @property
+    def played_seconds(self) -> float:
+        with self._lock:
+            return max(
+                0.0, self._written_seconds - self._discarded_seconds
+            )
+
+    def cancel(self) -> None:
+        """Abort the call: close its responses and discard queued audio."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks = {}
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # Best effort: the aborted resource may already be closed
+                pass
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the token is cancelled. Returns False on timeout."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise `TTSCancelled` if the token has been cancelled."""
+        if self._event.is_set():
+            raise TTSCancelled()
+
+    def on_cancel(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Run `callback` when the token is cancelled (at once if it already is).
+
+        Args:
+            callback (Callable[[], None]): Releases a resource, e.g. `response.close`.
+
+        Returns:
+            Callable[[], None]: Removes the callback again.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                key = self._next_id
+                self._next_id += 1
+                self._callbacks[key] = callback
+                return lambda: self._callbacks.pop(key, None)
+        callback()
+        return lambda: None
+
+    def _add_written(self, seconds: float) -> None:
+        with self._lock:
+            self._written_seconds += seconds
+
+    def _add_discarded(self, seconds: float) -> None:
+        with self._lock:
+            self._discarded_seconds += seconds
+
+
+class _CancellableSink(AudioSink):
+    """Sink wrapper that stops writing, and empties the sink, on cancellation."""
+
+    def __init__(self, sink: AudioSink, token: CancelToken):
+        self.sink = sink
+        self.token = token
+        token.on_cancel(self.clear)
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        self.token.raise_if_cancelled()
+        frames = self.sink.write(samples, sample_rate)
+        self.token._add_written(len(samples) / sample_rate)
+        # A write blocked on a full buffer returns once cancel() clears it
+        self.token.raise_if_cancelled()
+        return frames
+
+    def drain(self) -> None:
+        self.sink.drain()
+        self.token.raise_if_cancelled()
+
+    @property
+    def buffered_seconds(self) -> float:
+        return self.sink.buffered_seconds
+
+    def clear(self) -> None:
+        self.token._add_discarded(self.sink.buffered_seconds)
+        self.sink.clear()
+
+
+def _cancellable_sink(
+    sink: Optional[AudioSink], token: Optional[CancelToken]
+) -> Optional[AudioSink]:
+    """Wrap the sink a call plays to so `token` can stop it."""
+    if token is None or isinstance(sink, _CancellableSink):
+        return sink
+    return _CancellableSink(_resolve_sink(sink), token)
+
+
+def _stop_on_cancel(function: Callable) -> Callable:
+    """Make a TTS entry point return None when its call is cancelled."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        except TTSCancelled:
+            return None
+
+    return wrapper
+
+
+def _stop_iteration_on_cancel(
+    chunks: Iterable[bytes],
+) -> Generator[bytes, None, None]:
+    """Yield from a returned audio generator, ending quietly when its call is cancelled."""
+    try:
+        yield from chunks
+    except TTSCancelled:
+        return
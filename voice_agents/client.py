@@ -1,19 +1,60 @@
+import asyncio
+import weakref
+
 import httpx
 
+# Connection settings shared by the sync client and the per-loop async clients
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,  # Increased for better connection reuse
+    max_connections=60,  # Increased for higher concurrency
+    keepalive_expiry=60.0,  # Longer expiry to reduce connection setup overhead
+)
+_CLIENT_TIMEOUT = httpx.Timeout(
+    30.0,  # Read timeout
+    connect=5.0,  # Faster connect timeout for quicker failure detection
+    write=10.0,  # Write timeout
+    pool=5.0,  # Pool timeout for getting connection from pool
+)
+_CLIENT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br",  # Request compressed responses
+}
+
 _http_client = httpx.Client(
-    limits=httpx.Limits(
-        max_keepalive_connections=20,  # Increased for better connection reuse
-        max_connections=60,  # Increased for higher concurrency
-        keepalive_expiry=60.0,  # Longer expiry to reduce connection setup overhead
-    ),
-    timeout=httpx.Timeout(
-        30.0,  # Read timeout
-        connect=5.0,  # Faster connect timeout for quicker failure detection
-        write=10.0,  # Write timeout
-        pool=5.0,  # Pool timeout for getting connection from pool
-    ),
+    limits=_CLIENT_LIMITS,
+    timeout=_CLIENT_TIMEOUT,
     http2=True,  # Enable HTTP/2 for multiplexing (requires httpcore[h2])
-    headers={
-        "Accept-Encoding": "gzip, deflate, br",  # Request compressed responses
-    },
+    headers=_CLIENT_HEADERS,
+)
+
+# httpx.AsyncClient connections are bound to the event loop that opened them,
+# so one pooled client is kept per running loop and dropped with the loop.
+_async_http_clients: weakref.WeakKeyDictionary = (
+    weakref.WeakKeyDictionary()
 )
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled HTTP/2 AsyncClient for the running event loop.
+
+    The client is created on first use in each loop with the same limits,
+    timeouts and headers as the sync `_http_client`, and reused by every
+    async TTS/STT call made from that loop.
+
+    Returns:
+        httpx.AsyncClient: The shared async client for the current loop.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=_CLIENT_LIMITS,
+            timeout=_CLIENT_TIMEOUT,
+            http2=True,
+            headers=_CLIENT_HEADERS,
+        )
+        _async_http_clients[loop] = client
+    return client
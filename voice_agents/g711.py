@@ -0,0 +1,133 @@
+from typing import Union
+
+import numpy as np
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    """ITU-T G.711 mu-law byte -> int16, bit-exact with audioop.ulaw2lin."""
+    u = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = ((u & 0x0F) << 3) + 0x84
+    t <<= (u & 0x70) >> 4
+    return np.where(u & 0x80, 0x84 - t, t - 0x84).astype(np.int16)
+
+
+def _build_alaw_decode_table() -> np.ndarray:
+    """ITU-T G.711 A-law byte -> int16, bit-exact with audioop.alaw2lin."""
+    a = np.arange(256, dtype=np.int32) ^ 0x55
+    t = (a & 0x0F) << 4
+    seg = (a & 0x70) >> 4
+    t = np.where(seg == 0, t + 8, t + 0x108)
+    t = np.where(seg > 1, t << np.maximum(seg - 1, 0), t)
+    return np.where(a & 0x80, t, -t).astype(np.int16)
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    """int16 (indexed as uint16) -> mu-law byte, bit-exact with audioop.lin2ulaw."""
+    pcm = np.arange(65536, dtype=np.int32).astype(np.uint16)
+    pcm = pcm.view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    pcm = np.minimum(np.abs(pcm), 8159) + (0x84 >> 2)
+    seg_end = np.array(
+        [0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]
+    )
+    seg = np.searchsorted(seg_end, pcm)
+    uval = (seg << 4) | ((pcm >> (seg + 1)) & 0x0F)
+    uval = np.where(seg >= 8, 0x7F, uval)
+    return (uval ^ mask).astype(np.uint8)
+
+
+def _build_alaw_encode_table() -> np.ndarray:
+    """int16 (indexed as uint16) -> A-law byte, bit-exact with audioop.lin2alaw."""
+    pcm = np.arange(65536, dtype=np.int32).astype(np.uint16)
+    pcm = pcm.view(np.int16).astype(np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    pcm = np.where(pcm >= 0, pcm, -pcm - 1)
+    seg_end = np.array(
+        [0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]
+    )
+    seg = np.searchsorted(seg_end, pcm)
+    shift = np.where(seg < 2, 1, seg)
+    aval = (seg << 4) | ((pcm >> shift) & 0x0F)
+    aval = np.where(seg >= 8, 0x7F, aval)
+    return (aval ^ mask).astype(np.uint8)
+
+
+# 256-entry decode and 64K-entry encode lookup tables, built once at import
+_ULAW_TO_PCM = _build_ulaw_decode_table()
+_ALAW_TO_PCM = _build_alaw_decode_table()
+_PCM_TO_ULAW = _build_ulaw_encode_table()
+_PCM_TO_ALAW = _build_alaw_encode_table()
+
+
+def _as_pcm_indices(
+    samples: Union[np.ndarray, BytesLike],
+) -> np.ndarray:
+    """View int16 samples (array or raw little-endian bytes) as uint16 table indices."""
+    if not isinstance(samples, np.ndarray):
+        samples = np.frombuffer(samples, dtype=np.int16)
+    elif samples.dtype != np.int16:
+        samples = samples.astype(np.int16)
+    return samples.view(np.uint16)
+
+
+def ulaw_to_pcm(data: BytesLike) -> np.ndarray:
+    """
+    Decode G.711 mu-law bytes to int16 samples.
+
+    The input is read in place (bytes, bytearray or memoryview, e.g. a slice of
+    a network buffer); the only allocation is the output array.
+
+    Args:
+        data: mu-law encoded bytes, one byte per sample.
+
+    Returns:
+        np.ndarray: int16 samples.
+
+    Example:
+        >>> samples = ulaw_to_pcm(memoryview(packet)[12:])  # RTP payload
+    """
+    return _ULAW_TO_PCM[np.frombuffer(data, dtype=np.uint8)]
+
+
+def alaw_to_pcm(data: BytesLike) -> np.ndarray:
+    """
+    Decode G.711 A-law bytes to int16 samples.
+
+    Args:
+        data: A-law encoded bytes, one byte per sample.
+
+    Returns:
+        np.ndarray: int16 samples.
+    """
+    return _ALAW_TO_PCM[np.frombuffer(data, dtype=np.uint8)]
+
+
+def pcm_to_ulaw(samples: Union[np.ndarray, BytesLike]) -> np.ndarray:
+    """
+    Encode int16 samples to G.711 mu-law.
+
+    Args:
+        samples: int16 samples, or raw little-endian 16-bit PCM bytes.
+
+    Returns:
+        np.ndarray: uint8 mu-law bytes (use `.tobytes()` or `memoryview()` to send).
+
+    Example:
+        >>> payload = pcm_to_ulaw(audio_int16).tobytes()
+    """
+    return _PCM_TO_ULAW[_as_pcm_indices(samples)]
+
+
+def pcm_to_alaw(samples: Union[np.ndarray, BytesLike]) -> np.ndarray:
+    """
+    Encode int16 samples to G.711 A-law.
+
+    Args:
+        samples: int16 samples, or raw little-endian 16-bit PCM bytes.
+
+    Returns:
+        np.ndarray: uint8 A-law bytes.
+    """
+    return _PCM_TO_ALAW[_as_pcm_indices(samples)]
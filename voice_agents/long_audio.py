@@ -0,0 +1,480 @@
+import os
+import re
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from voice_agents.speech_to_text import (
+    _audio_upload,
+    _prepare_groq_stt,
+    _prepare_openai_stt,
+    _send_stt_request,
+)
+from voice_agents.upload import (
+    _BLOCK_SECONDS,
+    _mono_blocks,
+    _read_mono,
+)
+
+# Long audio is split and uploaded at this rate (what Whisper transcribes)
+_SAMPLE_RATE = 16000
+
+# Energy is measured on 20 ms frames and smoothed over 300 ms when
+# looking for a pause to cut at
+_FRAME_SECONDS = 0.02
+_PAUSE_SECONDS = 0.3
+
+# A cut is placed in the last quarter of the maximum segment length
+_SEARCH_FRACTION = 0.25
+
+# Whisper reads at most 224 prompt tokens, roughly this many characters
+_PROMPT_CHARS = 800
+
+_DEFAULT_MODELS = {
+    "groq": "whisper-large-v3-turbo",
+    "openai": "whisper-1",
+}
+
+
+@dataclass
+class TranscriptSegment:
+    """
+    One transcribed piece of a long recording.
+
+    Attributes:
+        index (int): Position of the segment in the recording.
+        start (float): Start of the segment in the recording, in seconds
+            (without the overlap that was uploaded with it).
+        end (float): End of the segment in the recording, in seconds.
+        text (str): The segment's transcript as returned by the provider.
+        prompt (Optional[str]): The prompt the segment was transcribed with.
+    """
+
+    index: int
+    start: float
+    end: float
+    text: str
+    prompt: Optional[str] = None
+
+
+@dataclass
+class LongTranscript:
+    """
+    Result of `transcribe_long_audio`.
+
+    Attributes:
+        text (str): The stitched transcript.
+        words (List[dict]): Word timestamps (`word`, `start`, `end`) relative to
+            the start of the recording, with overlap duplicates removed.
+        segments (List[TranscriptSegment]): The segments in recording order.
+    """
+
+    text: str
+    words: List[dict] = field(default_factory=list)
+    segments: List[TranscriptSegment] = field(default_factory=list)
+
+
+def _load_mono(
+    audio_file_path: Optional[str],
+    audio_data: Optional[np.ndarray],
+    sample_rate: int,
+) -> Tuple[np.ndarray, int]:
+    """
+    Load the recording as mono samples at no more than 16 kHz.
+
+    Files are decoded, and numpy audio downmixed, and both resampled block
+    by block, so an hour of 48 kHz stereo is never converted in one piece.
+    """
+    if audio_file_path:
+        return _read_mono(audio_file_path, _SAMPLE_RATE)
+    if audio_data is None:
+        raise ValueError(
+            "Either audio_file_path or audio_data must be provided."
+        )
+    block = int(sample_rate) * _BLOCK_SECONDS
+    return _mono_blocks(
+        (
+            audio_data[first : first + block]
+            for first in range(0, len(audio_data), block)
+        ),
+        int(sample_rate),
+        _SAMPLE_RATE,
+    )
+
+
+def _frame_energy(samples: np.ndarray, frame: int) -> np.ndarray:
+    """Mean square of each `frame`-sample frame, in bounded-size blocks."""
+    count = len(samples) // frame
+    energy = np.empty(count, dtype=np.float32)
+    block = 8192
+    for first in range(0, count, block):
+        last = min(count, first + block)
+        frames = samples[first * frame : last * frame].reshape(
+            -1, frame
+        )
+        frames = frames.astype(np.float32)
+        energy[first:last] = np.einsum("ij,ij->i", frames, frames)
+    return energy / frame
+
+
+def split_on_silence(
+    samples: np.ndarray,
+    sample_rate: int,
+    max_segment_seconds: float = 60.0,
+) -> List[Tuple[int, int]]:
+    """
+    Split a recording into segments that end at pauses.
+
+    Each cut is placed at the quietest 300 ms of the last quarter of the
+    allowed segment length, so segments stay under `max_segment_seconds`
+    and are rarely cut mid-word.
+
+    Args:
+        samples (np.ndarray): Mono int16 or float samples.
+        sample_rate (int): Sample rate in Hz.
+        max_segment_seconds (float): Longest segment. Default is 60.0.
+
+    Returns:
+        List[Tuple[int, int]]: Contiguous (start, end) sample ranges covering
+            the whole recording; empty for an empty recording.
+
+    Raises:
+        ValueError: If max_segment_seconds is not positive.
+
+    Example:
+        >>> split_on_silence(recording, 16000, max_segment_seconds=30.0)
+        [(0, 452160), (452160, 901440), (901440, 1180000)]
+    """
+    if max_segment_seconds <= 0:
+        raise ValueError(
+            f"max_segment_seconds must be positive, got {max_segment_seconds}"
+        )
+    total = len(samples)
+    if total == 0:
+        return []
+    longest = int(max_segment_seconds * sample_rate)
+    if total <= longest:
+        return [(0, total)]
+
+    frame = max(1, int(_FRAME_SECONDS * sample_rate))
+    energy = _frame_energy(samples, frame)
+    pause = max(1, int(_PAUSE_SECONDS / _FRAME_SECONDS))
+    # Energy of each pause-length window of frames, by its first frame
+    totals = np.concatenate(
+        ([0.0], np.cumsum(energy, dtype=np.float64))
+    )
+    windows = totals[pause:] - totals[:-pause]
+
+    ranges = []
+    start = 0
+    while total - start > longest:
+        first = (
+            start + int(longest * (1 - _SEARCH_FRACTION))
+        ) // frame
+        last = (start + longest) // frame - pause
+        if last > first and last < len(windows):
+            quietest = first + int(np.argmin(windows[first:last]))
+            cut = (quietest + pause // 2) * frame
+        else:
+            cut = start + longest
+        ranges.append((start, cut))
+        start = cut
+    ranges.append((start, total))
+    return ranges
+
+
+def _carry_prompt(
+    prompt: Optional[str], previous: Optional[str]
+) -> Optional[str]:
+    """The user prompt followed by as much of the previous text as fits."""
+    if not previous:
+        return prompt
+    room = _PROMPT_CHARS - (len(prompt) + 1 if prompt else 0)
+    if room <= 0:
+        return prompt
+    tail = previous.strip()[-room:]
+    if len(previous.strip()) > room and " " in tail:
+        # Start on a whole word
+        tail = tail.split(" ", 1)[1]
+    return f"{prompt} {tail}" if prompt else tail
+
+
+def _normalize(token: str) -> str:
+    return re.sub(r"\W+", "", token.lower())
+
+
+def _overlap_length(
+    previous: List[str], following: List[str], limit: int
+) -> int:
+    """Longest run of words that ends `previous` and starts `following`."""
+    for size in range(
+        min(limit, len(previous), len(following)), 0, -1
+    ):
+        head = [_normalize(t) for t in following[:size]]
+        if any(head) and head == [
+            _normalize(t) for t in previous[-size:]
+        ]:
+            return size
+    return 0
+
+
+def _transcribe_segment(
+    provider: str,
+    model: str,
+    language: Optional[str],
+    prompt: Optional[str],
+    temperature: float,
+    samples: np.ndarray,
+    sample_rate: int,
+) -> dict:
+    """Upload one segment and return the provider's verbose_json result."""
+    if provider == "groq":
+        request = _prepare_groq_stt(
+            model,
+            language,
+            prompt,
+            "verbose_json",
+            temperature,
+            ["word", "segment"],
+            False,
+        )
+    else:
+        request = _prepare_openai_stt(
+            model, language, prompt, "verbose_json", temperature
+        )
+        request.data["timestamp_granularities[]"] = [
+            "word",
+            "segment",
+        ]
+    with _audio_upload(
+        None, samples, sample_rate, request.content_type
+    ) as file_field:
+        response = _send_stt_request(request, file_field)
+    return response.json()
+
+
+def transcribe_long_audio(
+    audio_file_path: Optional[str] = None,
+    audio_data: Optional[np.ndarray] = None,
+    sample_rate: int = 16000,
+    provider: Literal["groq", "openai"] = "groq",
+    model: Optional[str] = None,
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+    temperature: float = 0.0,
+    max_segment_seconds: float = 60.0,
+    overlap_seconds: float = 0.5,
+    max_concurrency: int = 4,
+    carry_prompt: bool = True,
+) -> LongTranscript:
+    """
+    Transcribe a long recording in parallel segments with Whisper.
+
+    The recording is downmixed to 16 kHz mono and split at pauses into
+    segments of at most `max_segment_seconds`. Each segment is uploaded with
+    `overlap_seconds` of audio on either side, so words at a cut are heard
+    whole, and up to `max_concurrency` segments are transcribed at once.
+    Word timestamps are shifted to the start of the recording, and words
+    the overlaps transcribed twice are dropped when the text is stitched.
+
+    With `carry_prompt`, a segment is prompted with the transcript of the
+    segment before it if that has finished when the segment is sent, which
+    keeps spelling and style consistent across cuts. The first
+    `max_concurrency` segments start together without it; use
+    `max_concurrency=1` to give every segment its predecessor's text.
+
+    Args:
+        audio_file_path (Optional[str]): Path to an audio file libsndfile can
+            decode (wav, flac, ogg, mp3, ...). If provided, audio_data is ignored.
+        audio_data (Optional[np.ndarray]): Samples, (frames,) or (frames, channels).
+        sample_rate (int): Sample rate of audio_data. Default is 16000.
+        provider (Literal["groq", "openai"]): Whisper provider. Default is "groq".
+        model (Optional[str]): Model to use. Default is "whisper-large-v3-turbo"
+            for Groq and "whisper-1" for OpenAI.
+        language (Optional[str]): ISO-639-1 language code, or None to detect it.
+        prompt (Optional[str]): Text that guides every segment (names, terms).
+        temperature (float): Sampling temperature. Default is 0.0.
+        max_segment_seconds (float): Longest segment. Default is 60.0.
+        overlap_seconds (float): Audio shared with each neighbouring segment.
+            Default is 0.5.
+        max_concurrency (int): Segments transcribed at the same time. Default is 4.
+        carry_prompt (bool): Prompt each segment with the previous segment's
+            text. Default is True.
+
+    Returns:
+        LongTranscript: Stitched text, word timestamps and the segments.
+
+    Raises:
+        ValueError: If no audio is given or it is empty, the provider or a
+            parameter is invalid, the API key is missing, or a segment's
+            request fails.
+        IOError: If audio_file_path does not exist.
+
+    Example:
+        >>> result = transcribe_long_audio("call_recording.mp3", max_concurrency=8)
+        >>> result.text[:60]
+        'Thanks for calling, this is Dana. How can I help you today?'
+        >>> result.words[0]
+        {'word': 'Thanks', 'start': 0.42, 'end': 0.71}
+    """
+    if provider not in _DEFAULT_MODELS:
+        raise ValueError(
+            f"Invalid provider '{provider}'. Supported providers: {', '.join(_DEFAULT_MODELS)}"
+        )
+    if max_concurrency < 1:
+        raise ValueError(
+            f"max_concurrency must be at least 1, got {max_concurrency}"
+        )
+    if overlap_seconds < 0:
+        raise ValueError(
+            f"overlap_seconds must not be negative, got {overlap_seconds}"
+        )
+    if audio_file_path and not os.path.exists(audio_file_path):
+        raise IOError(f"Audio file not found: {audio_file_path}")
+    model = model or _DEFAULT_MODELS[provider]
+    # Fail on a missing key or bad model before any audio is processed
+    if provider == "groq":
+        _prepare_groq_stt(
+            model,
+            language,
+            prompt,
+            "verbose_json",
+            temperature,
+            None,
+            False,
+        )
+    else:
+        _prepare_openai_stt(
+            model, language, prompt, "verbose_json", temperature
+        )
+
+    samples, rate = _load_mono(
+        audio_file_path, audio_data, sample_rate
+    )
+    if len(samples) == 0:
+        raise ValueError(
+            f"No audio to transcribe: {audio_file_path or 'audio_data'} is empty"
+        )
+    ranges = split_on_silence(samples, rate, max_segment_seconds)
+    overlap = int(overlap_seconds * rate)
+    logger.debug(
+        f"✂️ Transcribing {len(samples) / rate:.1f}s in {len(ranges)} segments"
+    )
+
+    results: Dict[int, dict] = {}
+    prompts: Dict[int, Optional[str]] = {}
+    running: Dict[Future, int] = {}
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency,
+        thread_name_prefix="voice-agents-stt",
+    )
+    try:
+        for index, (start, end) in enumerate(ranges):
+            if len(running) >= max_concurrency:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+            previous = results.get(index - 1)
+            prompts[index] = (
+                _carry_prompt(prompt, previous.get("text"))
+                if carry_prompt and previous
+                else prompt
+            )
+            future = executor.submit(
+                _transcribe_segment,
+                provider,
+                model,
+                language,
+                prompts[index],
+                temperature,
+                samples[max(0, start - overlap) : end + overlap],
+                rate,
+            )
+            running[future] = index
+        for future in running:
+            results[running[future]] = future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return _stitch(ranges, results, prompts, rate, overlap_seconds)
+
+
+def _stitch(
+    ranges: List[Tuple[int, int]],
+    results: Dict[int, dict],
+    prompts: Dict[int, Optional[str]],
+    rate: int,
+    overlap_seconds: float,
+) -> LongTranscript:
+    """Join segment results into one transcript on the recording's timeline."""
+    # Whisper rarely produces more than 4 words a second
+    limit = int(8 * overlap_seconds) + 2
+    tokens: List[str] = []
+    words: List[dict] = []
+    segments = []
+    # Words of the previous segment timed after its end
+    trailing = 0
+    previous_timed = True
+    for index, (start, end) in enumerate(ranges):
+        result = results[index]
+        text = (result.get("text") or "").strip()
+        offset = max(0, start - int(overlap_seconds * rate)) / rate
+        segments.append(
+            TranscriptSegment(
+                index=index,
+                start=start / rate,
+                end=end / rate,
+                text=text,
+                prompt=prompts.get(index),
+            )
+        )
+
+        # Keep each word in the segment whose own range holds its midpoint,
+        # counting those heard in the overlaps on either side
+        kept = []
+        leading = 0
+        last = index == len(ranges) - 1
+        for word in result.get("words") or []:
+            shifted = dict(
+                word,
+                start=round(word["start"] + offset, 3),
+                end=round(word["end"] + offset, 3),
+            )
+            middle = (shifted["start"] + shifted["end"]) / 2
+            if index and middle < start / rate:
+                leading += 1
+            elif last or middle < end / rate:
+                kept.append(shifted)
+        words.extend(kept)
+
+        # Both texts contain the words timed inside the overlap around the
+        # cut: drop leading words that repeat the end of the text so far,
+        # at most that many (the text match alone is the fallback when no
+        # word timestamps came back)
+        following = text.split()
+        timed = bool(result.get("words")) and previous_timed
+        tokens.extend(
+            following[
+                _overlap_length(
+                    tokens,
+                    following,
+                    leading + trailing if timed else limit,
+                ) :
+            ]
+        )
+        previous_timed = bool(result.get("words"))
+        trailing = (
+            len(result.get("words") or []) - leading - len(kept)
+        )
+
+    return LongTranscript(
+        text=" ".join(tokens), words=words, segments=segments
+    )
@@ -1,14 +1,41 @@
+import asyncio
+import itertools
+import json
 import os
-import re
-from typing import Iterable, List, Optional, Union
+import queue
+import threading
+from dataclasses import dataclass, replace
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 import numpy as np
-import sounddevice as sd
 from dotenv import load_dotenv
 from loguru import logger
 
-from voice_agents.client import _http_client
+from voice_agents.cache import CacheBackend, make_cache_key
+from voice_agents.cancel import (
+    CancelToken,
+    TTSCancelled,
+    _cancellable_sink,
+    _stop_iteration_on_cancel,
+    _stop_on_cancel,
+)
+from voice_agents.client import _get_async_http_client, _http_client
+from voice_agents.g711 import alaw_to_pcm, ulaw_to_pcm
+from voice_agents.mp3 import iter_mp3_samples
+from voice_agents.wav import WAVStreamParser
 from voice_agents.models_and_voices import (
     ELEVENLABS_TTS_MODELS,
     ELEVENLABS_VOICES,
@@ -19,9 +46,25 @@ from voice_agents.models_and_voices import (
     VOICES,
     VoiceType,
 )
+from voice_agents.planner import ChunkPlanner
+from voice_agents.segmenter import (
+    StreamingSegmenter,
+    get_segmenter,
+)
+from voice_agents.sinks import AudioSink
+from voice_agents.stitch import stitch_utterances
+from voice_agents.resilience import (
+    CircuitOpenError,
+    acall_with_retry,
+    call_with_retry,
+    is_retryable_error,
+)
 from voice_agents.utils import (
+    SAMPLE_RATE,
     format_text_for_speech,
     get_api_key,
+    iter_pcm_samples,
+    play_pcm_samples,
     process_and_play_audio_buffer,
     process_audio_buffer,
 )
@@ -74,75 +117,640 @@ def _safe_get_response_text(response: httpx.Response) -> str:
             return f"(Unable to read response body: {type(read_error).__name__})"
 
 
-def stream_tts_openai(
-    text_chunks: Union[List[str], Iterable[str]],
-    voice: VoiceType = "alloy",
-    model: str = "tts-1",
-    stream_mode: bool = False,
-    response_format: str = "pcm",
-    verbose: Optional[bool] = None,
-) -> None:
+def _read_error_text(response: httpx.Response) -> str:
+    """Read the body of an error response for inclusion in error messages."""
+    error_text = "No additional error details available"
+    try:
+        error_bytes = response.read()
+        if error_bytes:
+            error_text = error_bytes.decode("utf-8", errors="ignore")
+    except Exception as e:
+        error_text = f"Could not read error response: {str(e)}"
+    return error_text
+
+
+def _check_openai_response(response: httpx.Response) -> None:
     """
-    Stream text-to-speech using OpenAI TTS API, processing chunks and playing the resulting audio stream.
+    Raise a descriptive ValueError for a failed OpenAI TTS response.
 
     Args:
-        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
-            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
-        voice (VoiceType): Which voice to use for the TTS synthesis. Default is "alloy".
-        model (str): The model to use for TTS. Default is "tts-1".
-        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
-            and process as a single request. Default is False.
-        response_format (str): Audio format to request from OpenAI. Options: "pcm", "mp3", "opus", "aac", "flac".
-            Default is "pcm" (16-bit PCM at 24kHz).
-        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        response: The (streaming) response returned by the OpenAI TTS endpoint.
+
+    Raises:
+        ValueError: If authentication failed.
+        httpx.HTTPStatusError: For any other 4xx/5xx status.
+    """
+    if response.status_code == 401:
+        raise ValueError(
+            f"Authentication failed (401). Please check your OPENAI_API_KEY.\n"
+            f"The API key may be invalid, expired, or not set correctly.\n"
+            f"Error details: {_read_error_text(response)}\n"
+            f"Get your API key from: https://platform.openai.com/api-keys"
+        )
+    response.raise_for_status()
+
+
+def _check_groq_response(response: httpx.Response) -> None:
+    """
+    Raise a descriptive ValueError for a failed Groq TTS response.
+
+    Args:
+        response: The (streaming) response returned by the Groq TTS endpoint.
+
+    Raises:
+        ValueError: If authentication failed.
+        httpx.HTTPStatusError: For any other 4xx/5xx status.
+    """
+    if response.status_code == 401:
+        raise ValueError(
+            f"Authentication failed (401). Please check your GROQ_API_KEY.\n"
+            f"The API key may be invalid, expired, or not set correctly.\n"
+            f"Error details: {_read_error_text(response)}\n"
+            f"Get your API key from: https://console.groq.com/keys"
+        )
+    response.raise_for_status()
+
+
+def _make_elevenlabs_response_check(
+    url: str,
+    headers: dict,
+    voice_id: str,
+    actual_voice_id: str,
+    output_format: str,
+    model_id: str,
+) -> Callable[[httpx.Response], None]:
+    """
+    Build a response checker for ElevenLabs TTS requests.
+
+    The checker needs the request context (voice, format, model) to produce
+    helpful error messages, so it is built once per stream_tts_elevenlabs call.
 
     Returns:
-        None: Plays audio to system output.
+        Callable[[httpx.Response], None]: Raises ValueError for any error status,
+            chained from `httpx.HTTPStatusError` except for 401 and 404.
+    """
 
-    Details:
-        - This function uses the OpenAI TTS API's streaming capabilities via httpx.
-        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
-        - When stream_mode is True, each chunk is processed individually as it arrives.
-        - Audio is streamed, buffered, and played using the `play_audio` helper.
-        - Handles incomplete PCM audio samples by only processing complete 16-bit samples.
-        - Useful for real-time output, agent system narration, or API streaming.
+    def check(response: httpx.Response) -> None:
+        if response.status_code == 401:
+            # Debug information
+            debug_info = (
+                f"Request URL: {url}\n"
+                f"Voice ID used: {actual_voice_id}\n"
+                f"Output format: {output_format}\n"
+                f"Model ID: {model_id}\n"
+                f"Headers sent: {dict((k, v if k != 'xi-api-key' else '***REDACTED***') for k, v in headers.items())}"
+            )
+            raise ValueError(
+                f"Authentication failed (401). Please check your ELEVENLABS_API_KEY.\n"
+                f"The API key may be invalid, expired, or not set correctly.\n"
+                f"Error details: {_read_error_text(response)}\n"
+                f"Debug info:\n{debug_info}\n"
+                f"Get your API key from: https://elevenlabs.io/app/settings/api-keys"
+            )
+        elif response.status_code == 404:
+            raise ValueError(
+                f"Voice ID '{actual_voice_id}' not found. Please check if the voice ID is correct.\n"
+                f"If you used a friendly name like '{voice_id}', verify it exists in ELEVENLABS_VOICES."
+            )
+        elif response.status_code >= 400:
+            error_text = _read_error_text(response)
 
-    Example:
-        >>> # Play audio locally
-        >>> stream_tts_openai(["Hello world"], voice="alloy")
-        >>>
-        >>> # With verbose logging
-        >>> stream_tts_openai(["Hello world"], voice="alloy", verbose=True)
+            # Try to parse JSON error for better error messages
+            error_detail = None
+            try:
+                error_json = json.loads(error_text)
+                if "detail" in error_json:
+                    error_detail = error_json["detail"]
+            except Exception:
+                pass
+
+            # Provide helpful suggestions for common errors
+            suggestion = ""
+            if error_detail and isinstance(error_detail, dict):
+                status = error_detail.get("status", "")
+
+                if (
+                    "output_format_not_allowed" in status
+                    or "output_format_not_allowed"
+                    in str(error_detail)
+                ):
+                    suggestion = (
+                        "\n\n💡 Suggestion: The requested output format requires a Pro tier subscription. "
+                        "Try using one of these free tier formats instead:\n"
+                        "  - mp3_44100_128 (MP3, 44.1kHz, 128kbps) - Recommended\n"
+                        "  - mp3_44100_192 (MP3, 44.1kHz, 192kbps)\n"
+                        "  - pcm_16000 (PCM, 16kHz)\n"
+                        "  - pcm_22050 (PCM, 22.05kHz)\n"
+                        "  - pcm_24000 (PCM, 24kHz)\n"
+                        "Example: stream_tts(..., output_format='mp3_44100_128')"
+                    )
+
+            # Chain the status error so retries, the circuit breaker and
+            # hedging can tell 429/5xx apart from request errors
+            raise ValueError(
+                f"HTTP error {response.status_code}: {error_text}{suggestion}\n"
+                f"URL: {response.request.url}"
+            ) from httpx.HTTPStatusError(
+                f"HTTP error {response.status_code}",
+                request=response.request,
+                response=response,
+            )
+
+    return check
+
+
+@dataclass
+class _TTSRequest:
     """
-    # Determine if verbose logging is enabled
-    verbose_logging = (
-        verbose if verbose is not None else _verbose_logging_enabled
+    A fully prepared provider TTS configuration.
+
+    Built once per call by the `_prepare_*_tts` helpers (which validate the
+    arguments and read the API key) and shared by the sync, generator and
+    async code paths.
+    """
+
+    provider: str
+    url: str
+    headers: dict
+    build_payload: Callable[[str], dict]
+    check_response: Callable[[httpx.Response], None]
+    audio_format: str
+    sample_rate: Optional[int] = None
+    params: Optional[dict] = None
+    # Everything except the text that identifies the audio (see make_cache_key)
+    cache_fields: Optional[dict] = None
+    # Payload field holding the text to synthesize
+    text_field: str = "input"
+    cache: Optional[CacheBackend] = None
+    # Aborts the call's requests (see CancelToken)
+    cancel: Optional[CancelToken] = None
+
+    def cache_key(self, payload: dict) -> str:
+        """Content address of the audio a payload produces."""
+        return make_cache_key(
+            provider=self.provider,
+            text=payload[self.text_field],
+            **self.cache_fields,
+        )
+
+
+def _http_status_error_to_value_error(
+    e: httpx.HTTPStatusError,
+) -> ValueError:
+    """Convert an httpx status error into the ValueError raised by this library."""
+    return ValueError(
+        f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
+        f"URL: {e.request.url}"
     )
 
-    if verbose_logging:
-        logger.info("=" * 80)
-        logger.info("🎙️  Starting OpenAI TTS Request")
-        logger.info(
-            f"   Model: {model} | Voice: {voice} | Format: {response_format} | Stream Mode: {stream_mode}"
+
+def _iter_tts_response(
+    request: _TTSRequest, payload: dict
+) -> Generator[bytes, None, None]:
+    """
+    Issue a single streaming TTS request and yield audio bytes as they arrive.
+
+    Args:
+        request: The prepared provider configuration.
+        payload: JSON request body.
+
+    When the request has a cache, a hit is yielded as a single chunk without
+    touching the network, and a miss is stored once fully received.
+
+    Yields:
+        bytes: Raw audio chunks exactly as returned by `response.iter_bytes()`.
+
+    Raises:
+        ValueError: If the provider returns an error status.
+        TTSCancelled: If the request's cancel token is cancelled.
+    """
+    if request.cancel is not None:
+        request.cancel.raise_if_cancelled()
+    cache_key = None
+    received = None
+    if request.cache is not None:
+        cache_key = request.cache_key(payload)
+        audio = request.cache.get(cache_key)
+        if audio is not None:
+            yield audio
+            return
+        received = bytearray()
+
+    def open_response() -> httpx.Response:
+        response = _http_client.send(
+            _http_client.build_request(
+                "POST",
+                request.url,
+                headers=request.headers,
+                params=request.params,
+                json=payload,
+            ),
+            stream=True,
         )
-        if isinstance(text_chunks, (list, tuple)):
-            logger.debug(
-                f"   Text chunks: {len(text_chunks)} chunks, "
-                f"Total length: {sum(len(str(c)) for c in text_chunks)} characters"
-            )
-            for i, chunk in enumerate(
-                text_chunks[:3]
-            ):  # Log first 3 chunks
-                logger.debug(
-                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
+        try:
+            request.check_response(response)
+        except BaseException:
+            response.close()
+            raise
+        return response
+
+    # Retries happen before the first byte; once audio flows it is not replayed
+    try:
+        response = call_with_retry(request.provider, open_response)
+    except httpx.HTTPStatusError as e:
+        raise _http_status_error_to_value_error(e) from e
+
+    # cancel() closes the response from its own thread
+    remove_callback = (
+        request.cancel.on_cancel(response.close)
+        if request.cancel is not None
+        else None
+    )
+    try:
+        for audio_chunk in response.iter_bytes():
+            if audio_chunk:
+                if received is not None:
+                    received.extend(audio_chunk)
+                yield audio_chunk
+    except Exception as e:
+        if request.cancel is not None and request.cancel.cancelled:
+            raise TTSCancelled() from e
+        raise
+    finally:
+        if remove_callback is not None:
+            remove_callback()
+        response.close()
+
+    # A closed response can also end early without an error; never cache it
+    if request.cancel is not None:
+        request.cancel.raise_if_cancelled()
+    if received:
+        request.cache.set(cache_key, bytes(received))
+
+
+def _iter_text_payloads(
+    text_chunks: Union[List[str], Iterable[str]],
+    stream_mode: bool,
+    build_payload: Callable[[str], dict],
+) -> Generator[dict, None, None]:
+    """
+    Turn text chunks into request payloads.
+
+    When stream_mode is False all chunks are joined into a single request,
+    otherwise one request is built per non-empty chunk, lazily, as chunks arrive.
+    """
+    if not stream_mode:
+        yield build_payload(" ".join(list(text_chunks)))
+        return
+
+    for chunk in text_chunks:
+        if not chunk or not chunk.strip():
+            continue
+        yield build_payload(chunk.strip())
+
+
+# Sentence requests kept in flight when splicing cached and fresh audio
+_SENTENCE_PREFETCH = 3
+
+
+def _splices_sentences(
+    request: _TTSRequest, stream_mode: bool
+) -> bool:
+    """
+    Whether a joined (non-stream_mode) request is served sentence by sentence.
+
+    Headerless PCM from separate requests concatenates sample-exactly, so with
+    a cache each sentence is cached on its own and only sentences that were
+    never synthesized before cost a request.
+    """
+    return (
+        not stream_mode
+        and request.cache is not None
+        and request.audio_format.startswith("pcm")
+    )
+
+
+def _iter_request_payloads(
+    text_chunks: Union[List[str], Iterable[str]],
+    stream_mode: bool,
+    request: _TTSRequest,
+) -> Generator[dict, None, None]:
+    """
+    Build the payloads for a call: one per sentence when splicing
+    (see `_splices_sentences`), otherwise as `_iter_text_payloads`.
+    """
+    if not _splices_sentences(request, stream_mode):
+        yield from _iter_text_payloads(
+            text_chunks, stream_mode, request.build_payload
+        )
+        return
+
+    for chunk in text_chunks:
+        for sentence in format_text_for_speech(chunk or ""):
+            yield request.build_payload(sentence)
+
+
+def _effective_prefetch(
+    request: _TTSRequest, stream_mode: bool, prefetch: int
+) -> int:
+    """
+    Requests to keep in flight for a call.
+
+    When splicing, cache misses are synthesized in parallel while cached
+    sentences are played, so at least `_SENTENCE_PREFETCH` run ahead.
+    """
+    if _splices_sentences(request, stream_mode):
+        return max(prefetch, _SENTENCE_PREFETCH)
+    return prefetch if stream_mode else 0
+
+
+class _StreamError:
+    """Carries an exception raised on a worker thread back to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_STREAM_END = object()
+
+
+class _BackgroundAudioStream:
+    """
+    Drain one TTS response on a worker thread.
+
+    The response starts downloading as soon as the object is created, so the
+    request for an upcoming text chunk is already in flight (multiplexed over
+    the shared HTTP/2 client) while the current chunk is playing. Iterating
+    the object yields the audio bytes in order and re-raises any error from
+    the request on the consumer's thread.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(chunks,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, chunks: Iterator[bytes]) -> None:
+        try:
+            for audio_chunk in chunks:
+                if self._cancelled.is_set():
+                    break
+                self._queue.put(audio_chunk)
+        except BaseException as e:
+            self._queue.put(_StreamError(e))
+        finally:
+            # Closing the generator closes the underlying HTTP response
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            self._queue.put(_STREAM_END)
+
+    def cancel(self) -> None:
+        """Stop downloading and release the underlying response."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        while True:
+            item = self._queue.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield item
+
+
+def _pipeline_tts_responses(
+    payloads: Iterable[dict],
+    open_response: Callable[[dict], Iterator[bytes]],
+    prefetch: int,
+) -> Generator[_BackgroundAudioStream, None, None]:
+    """
+    Yield per-chunk audio streams in order while keeping later requests in flight.
+
+    A feeder thread pulls payloads (so a slow, live text iterator never blocks
+    playback of the current chunk) and starts up to `prefetch` requests ahead
+    of the chunk currently being consumed. A slot is only released once the
+    consumer asks for the next stream, so playback order stays strict and at
+    most `prefetch + 1` responses are ever open at once.
+
+    Args:
+        payloads: Request payloads, one per text chunk.
+        open_response: Callable that returns the (lazy) audio byte iterator for a payload.
+        prefetch: Number of requests to keep in flight ahead of the current chunk.
+
+    Yields:
+        _BackgroundAudioStream: One stream per payload, in payload order.
+    """
+    slots = threading.Semaphore(prefetch + 1)
+    ready: "queue.Queue" = queue.Queue()
+    stopped = threading.Event()
+    lock = threading.Lock()
+
+    def feed() -> None:
+        try:
+            for payload in payloads:
+                slots.acquire()
+                if stopped.is_set():
+                    break
+                stream = _BackgroundAudioStream(
+                    open_response(payload)
                 )
-            if len(text_chunks) > 3:
-                logger.debug(
-                    f"   ... and {len(text_chunks) - 3} more chunks"
+                # The consumer may have stopped while the request was
+                # opening; never enqueue a stream nobody will cancel
+                with lock:
+                    if not stopped.is_set():
+                        ready.put(stream)
+                        continue
+                stream.cancel()
+                break
+        except BaseException as e:
+            ready.put(_StreamError(e))
+        finally:
+            ready.put(_STREAM_END)
+
+    threading.Thread(target=feed, daemon=True).start()
+
+    current = None
+    try:
+        while True:
+            item = ready.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+            current = item
+            yield current
+            slots.release()
+    finally:
+        # Drop anything still downloading if the consumer stopped early
+        with lock:
+            stopped.set()
+        slots.release()
+        if current is not None:
+            current.cancel()
+        while True:
+            try:
+                item = ready.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _BackgroundAudioStream):
+                item.cancel()
+
+
+def _iter_chunk_audio(
+    payloads: Iterable[dict],
+    request: _TTSRequest,
+    prefetch: int = 0,
+) -> Iterator[Iterable[bytes]]:
+    """
+    Yield one audio byte iterator per payload, in order.
+
+    With prefetch <= 0 each request is only sent once the previous chunk has
+    been fully consumed. With prefetch > 0 requests are pipelined through
+    `_pipeline_tts_responses`.
+    """
+
+    def open_response(payload: dict) -> Iterator[bytes]:
+        return _iter_tts_response(request, payload)
+
+    if prefetch > 0:
+        return _pipeline_tts_responses(
+            payloads, open_response, prefetch
+        )
+    return (open_response(payload) for payload in payloads)
+
+
+def _generate_tts_audio(
+    payloads: Iterable[dict],
+    request: _TTSRequest,
+    prefetch: int = 0,
+) -> Generator[bytes, None, None]:
+    """
+    Yield audio bytes for every payload in order, as soon as each chunk lands.
+
+    This is the generator returned by the stream_tts* functions when
+    `return_generator=True`. Nothing is buffered and no audio device is touched.
+    It ends early if the request's cancel token is cancelled.
+    """
+    try:
+        for audio_stream in _iter_chunk_audio(
+            payloads, request, prefetch=prefetch
+        ):
+            yield from audio_stream
+    except TTSCancelled:
+        return
+
+
+def _play_pcm_responses(
+    audio_streams: Iterable[Iterable[bytes]],
+    sample_rate: int,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Play 16-bit PCM responses incrementally through one output stream.
+
+    Each response is sample-aligned on its own (a dangling byte never leaks
+    into the next text chunk) and all of them share a single device stream,
+    so audio starts with the first few KB of the first response. Silence
+    padding between responses is trimmed (see `stitch_utterances`).
+
+    Returns:
+        int: Total number of samples played.
+    """
+    return play_pcm_samples(
+        stitch_utterances(
+            (
+                iter_pcm_samples(audio_stream)
+                for audio_stream in audio_streams
+            ),
+            sample_rate,
+        ),
+        sample_rate,
+        sink,
+    )
+
+
+def _play_mp3_responses(
+    audio_streams: Iterable[Iterable[bytes]],
+    sample_rate: int,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Decode MP3 responses as they arrive and play them through one output stream.
+
+    Each response is decoded on its own (see `iter_mp3_samples`), so with PyAV
+    installed MP3 audio starts as soon as PCM would, without an ffmpeg process
+    per utterance. Silence padding between responses is trimmed.
+
+    Returns:
+        int: Total number of samples played.
+    """
+    return play_pcm_samples(
+        stitch_utterances(
+            (
+                iter_mp3_samples(audio_stream, sample_rate)
+                for audio_stream in audio_streams
+            ),
+            sample_rate,
+        ),
+        sample_rate,
+        sink,
+    )
+
+
+def _play_g711_responses(
+    audio_streams: Iterable[Iterable[bytes]],
+    audio_format: str,
+    sample_rate: int,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Play G.711 (ulaw_*/alaw_*) responses as they arrive.
+
+    G.711 has one byte per sample, so every network chunk is decoded on its
+    own with the lookup-table codec in `voice_agents.g711`. Silence padding
+    between responses is trimmed.
+
+    Returns:
+        int: Total number of samples played.
+    """
+    decode = (
+        ulaw_to_pcm
+        if audio_format.startswith("ulaw_")
+        else alaw_to_pcm
+    )
+    return play_pcm_samples(
+        stitch_utterances(
+            (
+                (
+                    decode(audio_chunk)
+                    for audio_chunk in audio_stream
+                    if audio_chunk
                 )
-        else:
-            logger.debug("   Text chunks: iterable (unknown size)")
+                for audio_stream in audio_streams
+            ),
+            sample_rate,
+        ),
+        sample_rate,
+        sink,
+    )
+
+
+def _prepare_openai_tts(
+    voice: str,
+    model: str,
+    response_format: str,
+    verbose_logging: bool = False,
+) -> _TTSRequest:
+    """
+    Validate OpenAI TTS arguments and build the request configuration.
 
+    Raises:
+        ValueError: If OPENAI_API_KEY is missing or the model has a provider prefix.
+    """
     # Get API key from environment variable
     api_key = get_api_key(
         "OPENAI_API_KEY",
@@ -182,278 +790,559 @@ def stream_tts_openai(
             f"📋 Request headers prepared (Authorization: Bearer {api_key[:20]}...)"
         )
 
-    # If stream_mode is False, process all chunks at once (backward compatible)
-    if not stream_mode:
-        if verbose_logging:
-            logger.info(
-                "📦 Processing all chunks at once (non-streaming mode)"
-            )
-
-        # Convert iterable to list if needed
-        if isinstance(text_chunks, (list, tuple)):
-            chunks_list = list(text_chunks)
-        else:
-            chunks_list = list(text_chunks)
-
-        # Join all text chunks into a single string
-        text = " ".join(chunks_list)
-
-        if verbose_logging:
-            logger.debug(f"📝 Combined text: {len(text)} characters")
-            logger.debug(
-                f"   Preview: {text[:150]}{'...' if len(text) > 150 else ''}"
-            )
-
-        # Payload
-        payload = {
+    def build_payload(text: str) -> dict:
+        return {
             "model": model,
             "voice": voice,
             "input": text,
             "response_format": response_format,
         }
 
-        if verbose_logging:
-            logger.debug(
-                f"📤 Request payload: {list(payload.keys())} (input length: {len(text)} chars)"
-            )
-
-        # Buffer to handle incomplete chunks (int16 = 2 bytes per sample)
-        buffer = bytearray()
+    return _TTSRequest(
+        provider="openai",
+        url=url,
+        headers=headers,
+        build_payload=build_payload,
+        check_response=_check_openai_response,
+        audio_format=response_format,
+        sample_rate=SAMPLE_RATE if response_format == "pcm" else None,
+        cache_fields={
+            "model": model,
+            "voice": voice,
+            "audio_format": response_format,
+        },
+    )
 
-        # Make streaming request to OpenAI TTS API
-        try:
-            if verbose_logging:
-                logger.info(
-                    "🚀 Sending HTTP POST request to OpenAI TTS API..."
-                )
 
-            with _http_client.stream(
-                "POST",
-                url,
-                headers=headers,
-                json=payload,
-            ) as response:
-                if verbose_logging:
-                    logger.debug(
-                        f"📡 Response received: Status {response.status_code}"
-                    )
-                    logger.debug(
-                        f"   Response headers: {dict(response.headers)}"
-                    )
+# Sample rates of the ElevenLabs output formats
+_ELEVENLABS_SAMPLE_RATES = {
+    "pcm_8000": 8000,
+    "pcm_16000": 16000,
+    "pcm_22050": 22050,
+    "pcm_24000": 24000,
+    "pcm_32000": 32000,
+    "pcm_44100": 44100,
+    "pcm_48000": 48000,
+    "ulaw_8000": 8000,
+    "alaw_8000": 8000,
+    "mp3_22050_32": 22050,
+    "mp3_24000_48": 24000,
+    "mp3_44100_32": 44100,
+    "mp3_44100_64": 44100,
+    "mp3_44100_96": 44100,
+    "mp3_44100_128": 44100,
+    "mp3_44100_192": 44100,
+    "opus_48000_32": 48000,
+    "opus_48000_64": 48000,
+    "opus_48000_96": 48000,
+    "opus_48000_128": 48000,
+    "opus_48000_192": 48000,
+}
+
+
+def _prepare_elevenlabs_tts(
+    voice_id: str,
+    model_id: str,
+    stability: float,
+    similarity_boost: float,
+    output_format: str,
+    optimize_streaming_latency: Optional[int],
+    enable_logging: bool,
+    playback: bool = True,
+    verbose_logging: bool = False,
+) -> _TTSRequest:
+    """
+    Validate ElevenLabs TTS arguments and build the request configuration.
 
-                # Check for authentication errors
-                if response.status_code == 401:
-                    error_text = (
-                        "No additional error details available"
-                    )
-                    try:
-                        error_bytes = b""
-                        for chunk in response.iter_bytes():
-                            error_bytes += chunk
-                        if error_bytes:
-                            error_text = error_bytes.decode(
-                                "utf-8", errors="ignore"
-                            )
-                    except Exception as e:
-                        error_text = (
-                            f"Could not read error response: {str(e)}"
-                        )
+    Args:
+        playback: Whether the audio will be decoded locally. Opus output can be
+            forwarded as raw bytes but cannot be played, so it is rejected when True.
 
-                    error_msg = (
-                        f"Authentication failed (401). Please check your OPENAI_API_KEY.\n"
-                        f"The API key may be invalid, expired, or not set correctly.\n"
-                        f"Error details: {error_text}\n"
-                        f"Get your API key from: https://platform.openai.com/api-keys"
-                    )
-                    if verbose_logging:
-                        logger.error(f"❌ {error_msg}")
-                    raise ValueError(error_msg)
+    Raises:
+        ValueError: If ELEVENLABS_API_KEY is missing or the format can't be played.
+    """
+    # Get API key from parameter or environment variable
+    api_key = get_api_key(
+        "ELEVENLABS_API_KEY",
+        "https://elevenlabs.io/app/settings/api-keys",
+    )
 
-                response.raise_for_status()
+    if verbose_logging:
+        logger.debug("✅ API key retrieved successfully")
 
-                if verbose_logging:
-                    logger.info(
-                        "✅ Response successful, streaming audio chunks..."
-                    )
+    # Check if voice_id is a friendly name and look it up in ELEVENLABS_VOICES
+    # If it's not found, assume it's already a voice ID
+    actual_voice_id = ELEVENLABS_VOICES.get(
+        voice_id.lower(), voice_id
+    )
 
-                # Stream audio chunks
-                chunk_count = 0
-                for audio_chunk in response.iter_bytes():
-                    if audio_chunk:
-                        buffer.extend(audio_chunk)
-                        chunk_count += 1
-                        if verbose_logging and chunk_count % 20 == 0:
-                            logger.debug(
-                                f"   📥 Received {chunk_count} chunks, "
-                                f"buffer: {len(buffer)} bytes ({len(buffer) / 1024:.2f} KB)"
-                            )
+    # Extract sample rate from format or use default
+    if output_format.startswith("pcm_"):
+        sample_rate = _ELEVENLABS_SAMPLE_RATES.get(
+            output_format, 44100
+        )
+    elif output_format.startswith(
+        "ulaw_"
+    ) or output_format.startswith("alaw_"):
+        sample_rate = _ELEVENLABS_SAMPLE_RATES.get(
+            output_format, 8000
+        )
+    elif output_format.startswith("mp3_"):
+        # For MP3 formats, extract sample rate from map
+        sample_rate = _ELEVENLABS_SAMPLE_RATES.get(
+            output_format, 44100
+        )
+    elif output_format.startswith("opus_"):
+        # Opus bytes can be forwarded as-is, but we can't decode them for playback
+        if playback:
+            raise ValueError(
+                f"Opus format '{output_format}' not yet supported. Please use PCM format (e.g., 'pcm_44100')."
+            )
+        sample_rate = _ELEVENLABS_SAMPLE_RATES.get(
+            output_format, 48000
+        )
+    else:
+        sample_rate = 44100  # Default fallback
 
-                if verbose_logging:
-                    logger.info(
-                        f"📊 Audio streaming complete: {chunk_count} chunks, "
-                        f"total: {len(buffer)} bytes ({len(buffer) / 1024:.2f} KB)"
-                    )
+    # Build URL with query parameters
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{actual_voice_id}/stream"
 
-                # Check if we received any audio data
-                if len(buffer) == 0:
-                    error_msg = (
-                        "No audio data received from OpenAI TTS API. "
-                        "This might indicate an API error or network issue."
-                    )
-                    if verbose_logging:
-                        logger.error(f"❌ {error_msg}")
-                    raise ValueError(error_msg)
+    # Build query parameters
+    params = {
+        "output_format": output_format,
+        "enable_logging": str(enable_logging).lower(),
+    }
 
-                # Process all buffered data at once
-                if verbose_logging:
-                    logger.info(
-                        f"🎵 Processing audio buffer: {len(buffer)} bytes"
-                    )
-                process_and_play_audio_buffer(buffer, response_format)
-                if verbose_logging:
-                    logger.info(
-                        "✅ Audio playback completed successfully"
-                    )
-                    logger.info("=" * 80)
-        except httpx.HTTPStatusError as e:
-            # Re-raise ValueError if we already converted it
-            if isinstance(e, ValueError):
-                raise
-            # Otherwise, provide a generic error message
+    if optimize_streaming_latency is not None:
+        params["optimize_streaming_latency"] = str(
+            optimize_streaming_latency
+        )
+
+    # Headers matching the Eleven Labs API specification
+    # Note: Accept header is optional for streaming endpoint, but can help with content negotiation
+    headers = {
+        "xi-api-key": api_key,  # Already stripped above
+        "Content-Type": "application/json",
+    }
+
+    # Optionally add Accept header for better content negotiation
+    # For streaming, the API will return the format specified in output_format query param
+    if output_format.startswith("pcm_"):
+        headers["Accept"] = "audio/pcm"
+    elif output_format.startswith("mp3_"):
+        headers["Accept"] = "audio/mpeg"
+    elif output_format.startswith("opus_"):
+        headers["Accept"] = "audio/opus"
+    # For ulaw/alaw, we can omit Accept or use audio/basic, but it's optional
+
+    def build_payload(text: str) -> dict:
+        return {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": stability,
+                "similarity_boost": similarity_boost,
+            },
+        }
+
+    return _TTSRequest(
+        provider="elevenlabs",
+        url=url,
+        headers=headers,
+        build_payload=build_payload,
+        check_response=_make_elevenlabs_response_check(
+            url,
+            headers,
+            voice_id,
+            actual_voice_id,
+            output_format,
+            model_id,
+        ),
+        audio_format=output_format,
+        sample_rate=sample_rate,
+        params=params,
+        cache_fields={
+            "model": model_id,
+            "voice": actual_voice_id,
+            "audio_format": output_format,
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+        },
+        text_field="text",
+    )
+
+
+def _prepare_groq_tts(
+    voice: str,
+    model: str,
+    response_format: str,
+    verbose_logging: bool = False,
+) -> _TTSRequest:
+    """
+    Validate Groq TTS arguments and build the request configuration.
+
+    Raises:
+        ValueError: If GROQ_API_KEY is missing or the model/voice is invalid.
+    """
+    # Get API key from environment variable
+    api_key = get_api_key(
+        "GROQ_API_KEY",
+        "https://console.groq.com/keys",
+    )
+
+    if verbose_logging:
+        logger.debug("✅ API key retrieved successfully")
+
+    # Validate model
+    if model not in GROQ_TTS_MODELS:
+        raise ValueError(
+            f"Invalid model '{model}'. Supported models: {', '.join(GROQ_TTS_MODELS)}"
+        )
+
+    # Validate voice based on model
+    if model == "canopylabs/orpheus-v1-english":
+        if voice not in GROQ_ORPHEUS_ENGLISH_VOICES:
             raise ValueError(
-                f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                f"URL: {e.request.url}"
-            ) from e
-    else:
-        # Stream mode: process each chunk as it arrives
+                f"Invalid voice '{voice}' for English model. "
+                f"Supported voices: {', '.join(GROQ_ORPHEUS_ENGLISH_VOICES)}"
+            )
+    elif model == "canopylabs/orpheus-arabic-saudi":
+        if voice not in GROQ_ORPHEUS_ARABIC_VOICES:
+            raise ValueError(
+                f"Invalid voice '{voice}' for Arabic model. "
+                f"Supported voices: {', '.join(GROQ_ORPHEUS_ARABIC_VOICES)}"
+            )
+
+    # Groq TTS API endpoint
+    url = "https://api.groq.com/openai/v1/audio/speech"
+
+    # Headers
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    def build_payload(text: str) -> dict:
+        return {
+            "model": model,
+            "voice": voice,
+            "input": text,
+            "response_format": response_format,
+        }
+
+    return _TTSRequest(
+        provider="groq",
+        url=url,
+        headers=headers,
+        build_payload=build_payload,
+        check_response=_check_groq_response,
+        audio_format=response_format,
+        cache_fields={
+            "model": model,
+            "voice": voice,
+            "audio_format": response_format,
+        },
+    )
+
+
+@_stop_on_cancel
+def stream_tts_openai(
+    text_chunks: Union[List[str], Iterable[str]],
+    voice: VoiceType = "alloy",
+    model: str = "tts-1",
+    stream_mode: bool = False,
+    response_format: str = "pcm",
+    verbose: Optional[bool] = None,
+    return_generator: bool = False,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+    sink: Optional[AudioSink] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Optional[Generator[bytes, None, None]]:
+    """
+    Stream text-to-speech using OpenAI TTS API, processing chunks and playing the resulting audio stream.
+
+    Args:
+        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
+            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
+        voice (VoiceType): Which voice to use for the TTS synthesis. Default is "alloy".
+        model (str): The model to use for TTS. Default is "tts-1".
+        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
+            and process as a single request. Default is False.
+        response_format (str): Audio format to request from OpenAI. Options: "pcm", "mp3", "opus", "aac", "flac".
+            Default is "pcm" (16-bit PCM at 24kHz).
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        return_generator (bool): If True, return a generator that yields raw audio bytes as they arrive
+            from the API instead of playing them. No audio device is required. Default is False.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight on the shared HTTP/2 client while the current chunk plays,
+            hiding the per-chunk network round trip. Playback order is unchanged. Default is 0 (sequential).
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
+        sink (Optional[AudioSink]): Where to play the audio when return_generator is False
+            (e.g. `WAVFileSink`, `NumpySink`, `CallbackSink`, `NullSink`). Default is None
+            (the default sink, normally the sound card; see `set_default_sink`).
+        cancel (Optional[CancelToken]): Aborts the call from another thread (barge-in): open
+            responses are closed, queued requests dropped and unplayed audio discarded, and the
+            function returns None (a returned generator ends). Default is None.
+
+    Returns:
+        Optional[Generator[bytes, None, None]]: None when playing audio to system output, or a generator
+            of raw audio bytes in `response_format` when return_generator is True.
+
+    Details:
+        - This function uses the OpenAI TTS API's streaming capabilities via httpx.
+        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
+        - When stream_mode is True, each chunk is processed individually as it arrives.
+        - Audio is streamed, buffered, and played using the `play_audio` helper.
+        - Handles incomplete PCM audio samples by only processing complete 16-bit samples.
+        - Useful for real-time output, agent system narration, or API streaming.
+
+    Example:
+        >>> # Play audio locally
+        >>> stream_tts_openai(["Hello world"], voice="alloy")
+        >>>
+        >>> # Stream raw audio bytes (e.g., to a FastAPI StreamingResponse)
+        >>> for audio_chunk in stream_tts_openai(["Hello world"], return_generator=True):
+        ...     send(audio_chunk)
+        >>>
+        >>> # With verbose logging
+        >>> stream_tts_openai(["Hello world"], voice="alloy", verbose=True)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
+
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting OpenAI TTS Request")
+        logger.info(
+            f"   Model: {model} | Voice: {voice} | Format: {response_format} | Stream Mode: {stream_mode}"
+        )
+        if isinstance(text_chunks, (list, tuple)):
+            logger.debug(
+                f"   Text chunks: {len(text_chunks)} chunks, "
+                f"Total length: {sum(len(str(c)) for c in text_chunks)} characters"
+            )
+            for i, chunk in enumerate(
+                text_chunks[:3]
+            ):  # Log first 3 chunks
+                logger.debug(
+                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
+                )
+            if len(text_chunks) > 3:
+                logger.debug(
+                    f"   ... and {len(text_chunks) - 3} more chunks"
+                )
+        else:
+            logger.debug("   Text chunks: iterable (unknown size)")
+
+    request = _prepare_openai_tts(
+        voice, model, response_format, verbose_logging
+    )
+    request.cache = cache
+    request.cancel = cancel
+    sink = _cancellable_sink(sink, cancel)
+
+    # Generator mode: yield audio bytes as they arrive, no playback
+    if return_generator:
+        if verbose_logging:
+            logger.info("🔁 Returning audio generator (no playback)")
+        return _generate_tts_audio(
+            _iter_request_payloads(text_chunks, stream_mode, request),
+            request,
+            prefetch=_effective_prefetch(
+                request, stream_mode, prefetch
+            ),
+        )
+
+    # PCM needs no decoding, so play it incrementally: audio starts with the
+    # first few KB instead of after the whole response has been downloaded
+    if response_format == "pcm":
+        if verbose_logging:
+            logger.info("🔊 Playing PCM audio as it arrives")
+        frames = _play_pcm_responses(
+            _iter_chunk_audio(
+                _iter_request_payloads(
+                    text_chunks, stream_mode, request
+                ),
+                request,
+                prefetch=_effective_prefetch(
+                    request, stream_mode, prefetch
+                ),
+            ),
+            request.sample_rate,
+            sink,
+        )
+        if frames == 0 and not stream_mode:
+            error_msg = (
+                "No audio data received from OpenAI TTS API. "
+                "This might indicate an API error or network issue."
+            )
+            if verbose_logging:
+                logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
         if verbose_logging:
             logger.info(
-                "🔄 Processing chunks in stream mode (real-time)"
+                f"✅ Audio playback completed successfully ({frames} samples)"
             )
+            logger.info("=" * 80)
+        return None
 
-        chunk_index = 0
-        for chunk in text_chunks:
-            chunk_index += 1
-            if not chunk or not chunk.strip():
-                if verbose_logging:
-                    logger.debug(
-                        f"   ⏭️  Skipping empty chunk {chunk_index}"
-                    )
-                continue
+    # MP3 is decoded frame by frame while it downloads
+    if response_format == "mp3":
+        if verbose_logging:
+            logger.info(
+                "🔊 Decoding and playing MP3 audio as it arrives"
+            )
+        frames = _play_mp3_responses(
+            _iter_chunk_audio(
+                _iter_request_payloads(
+                    text_chunks, stream_mode, request
+                ),
+                request,
+                prefetch=_effective_prefetch(
+                    request, stream_mode, prefetch
+                ),
+            ),
+            SAMPLE_RATE,
+            sink,
+        )
+        if frames == 0 and not stream_mode:
+            error_msg = (
+                "No audio data received from OpenAI TTS API. "
+                "This might indicate an API error or network issue."
+            )
             if verbose_logging:
-                logger.info(
-                    f"📦 Processing chunk {chunk_index}: {len(chunk.strip())} characters"
-                )
+                logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
+        if verbose_logging:
+            logger.info(
+                f"✅ Audio playback completed successfully ({frames} samples)"
+            )
+            logger.info("=" * 80)
+        return None
+
+    # If stream_mode is False, process all chunks at once (backward compatible)
+    if not stream_mode:
+        if verbose_logging:
+            logger.info(
+                "📦 Processing all chunks at once (non-streaming mode)"
+            )
+
+        # Join all text chunks into a single string
+        text = " ".join(list(text_chunks))
+
+        if verbose_logging:
+            logger.debug(f"📝 Combined text: {len(text)} characters")
+            logger.debug(
+                f"   Preview: {text[:150]}{'...' if len(text) > 150 else ''}"
+            )
+            logger.info(
+                "🚀 Sending HTTP POST request to OpenAI TTS API..."
+            )
+
+        # Buffer to handle incomplete chunks (int16 = 2 bytes per sample)
+        buffer = bytearray()
+
+        # Stream audio chunks
+        chunk_count = 0
+        for audio_chunk in _iter_tts_response(
+            request, request.build_payload(text)
+        ):
+            buffer.extend(audio_chunk)
+            chunk_count += 1
+            if verbose_logging and chunk_count % 20 == 0:
                 logger.debug(
-                    f"   Preview: {chunk.strip()[:100]}{'...' if len(chunk.strip()) > 100 else ''}"
+                    f"   📥 Received {chunk_count} chunks, "
+                    f"buffer: {len(buffer)} bytes ({len(buffer) / 1024:.2f} KB)"
                 )
 
-            # Payload for this chunk
-            payload = {
-                "model": model,
-                "voice": voice,
-                "input": chunk.strip(),
-                "response_format": response_format,
-            }
+        if verbose_logging:
+            logger.info(
+                f"📊 Audio streaming complete: {chunk_count} chunks, "
+                f"total: {len(buffer)} bytes ({len(buffer) / 1024:.2f} KB)"
+            )
+
+        # Check if we received any audio data
+        if len(buffer) == 0:
+            error_msg = (
+                "No audio data received from OpenAI TTS API. "
+                "This might indicate an API error or network issue."
+            )
+            if verbose_logging:
+                logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
+
+        # Process all buffered data at once
+        if verbose_logging:
+            logger.info(
+                f"🎵 Processing audio buffer: {len(buffer)} bytes"
+            )
+        process_and_play_audio_buffer(
+            buffer, response_format, sink=sink
+        )
+        if verbose_logging:
+            logger.info("✅ Audio playback completed successfully")
+            logger.info("=" * 80)
+    else:
+        # Stream mode: process each chunk as it arrives
+        if verbose_logging:
+            logger.info(
+                "🔄 Processing chunks in stream mode (real-time)"
+            )
+
+        if verbose_logging and prefetch > 0:
+            logger.info(
+                f"⏩ Pipelining requests: {prefetch} chunk(s) prefetched ahead of playback"
+            )
+
+        chunk_index = 0
+        for audio_stream in _iter_chunk_audio(
+            _iter_text_payloads(
+                text_chunks, True, request.build_payload
+            ),
+            request,
+            prefetch=prefetch,
+        ):
+            chunk_index += 1
 
             # Buffer to handle incomplete chunks (int16 = 2 bytes per sample)
             buffer = bytearray()
 
-            # Make streaming request to OpenAI TTS API for this chunk
             try:
+                for audio_chunk in audio_stream:
+                    buffer.extend(audio_chunk)
+
                 if verbose_logging:
                     logger.debug(
-                        f"🚀 Sending request for chunk {chunk_index}..."
+                        f"📥 Chunk {chunk_index}: buffer: {len(buffer)} bytes"
                     )
 
-                with _http_client.stream(
-                    "POST",
-                    url,
-                    headers=headers,
-                    json=payload,
-                ) as response:
+                # Process and play audio for this chunk immediately
+                if len(buffer) > 0:
                     if verbose_logging:
-                        logger.debug(
-                            f"📡 Chunk {chunk_index} response: Status {response.status_code}"
+                        logger.info(
+                            f"🎵 Playing audio for chunk {chunk_index}..."
                         )
-                    # Check for authentication errors
-                    if response.status_code == 401:
-                        error_text = (
-                            "No additional error details available"
-                        )
-                        try:
-                            error_bytes = b""
-                            for audio_chunk in response.iter_bytes():
-                                error_bytes += audio_chunk
-                            if error_bytes:
-                                error_text = error_bytes.decode(
-                                    "utf-8", errors="ignore"
-                                )
-                        except Exception as e:
-                            error_text = f"Could not read error response: {str(e)}"
-
-                        raise ValueError(
-                            f"Authentication failed (401). Please check your OPENAI_API_KEY.\n"
-                            f"The API key may be invalid, expired, or not set correctly.\n"
-                            f"Error details: {error_text}\n"
-                            f"Get your API key from: https://platform.openai.com/api-keys"
-                        )
-
-                    response.raise_for_status()
-
+                    process_and_play_audio_buffer(
+                        buffer,
+                        response_format,
+                        warn_on_empty=True,
+                        sink=sink,
+                    )
                     if verbose_logging:
                         logger.debug(
-                            f"✅ Chunk {chunk_index} response successful, streaming audio..."
+                            f"✅ Chunk {chunk_index} playback completed"
                         )
-
-                    # Stream audio chunks for this text chunk
-                    audio_chunk_count = 0
-                    for audio_chunk in response.iter_bytes():
-                        if audio_chunk:
-                            buffer.extend(audio_chunk)
-                            audio_chunk_count += 1
-
+                else:
+                    warning_msg = f"No audio data received for chunk {chunk_index}"
                     if verbose_logging:
-                        logger.debug(
-                            f"📥 Chunk {chunk_index}: Received {audio_chunk_count} audio chunks, "
-                            f"buffer: {len(buffer)} bytes"
-                        )
-
-                    # Process and play audio for this chunk immediately
-                    if len(buffer) > 0:
-                        if verbose_logging:
-                            logger.info(
-                                f"🎵 Playing audio for chunk {chunk_index}..."
-                            )
-                        process_and_play_audio_buffer(
-                            buffer,
-                            response_format,
-                            warn_on_empty=True,
-                        )
-                        if verbose_logging:
-                            logger.debug(
-                                f"✅ Chunk {chunk_index} playback completed"
-                            )
+                        logger.warning(f"⚠️  {warning_msg}")
                     else:
-                        warning_msg = f"No audio data received for chunk: '{chunk[:50]}...'"
-                        if verbose_logging:
-                            logger.warning(f"⚠️  {warning_msg}")
-                        else:
-                            print(f"Warning: {warning_msg}")
-            except httpx.HTTPStatusError as e:
-                # Re-raise ValueError if we already converted it
-                if isinstance(e, ValueError):
-                    raise
-                # Otherwise, provide a generic error message
-                error_msg = (
-                    f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                    f"URL: {e.request.url}"
-                )
-                if verbose_logging:
-                    logger.error(
-                        f"❌ HTTP Error for chunk {chunk_index}: {error_msg}"
-                    )
-                raise ValueError(error_msg) from e
+                        print(f"Warning: {warning_msg}")
             except Exception as e:
                 if verbose_logging:
                     logger.error(
@@ -601,44 +1490,473 @@ def list_voices() -> List[dict[str, Union[str, None]]]:
             }
         )
 
-    # Add Groq Orpheus English voices
-    groq_english_descriptions = {
-        "austin": "Male English voice",
-        "hannah": "Female English voice",
-        "troy": "Male English voice",
-    }
-    for voice_name in GROQ_ORPHEUS_ENGLISH_VOICES:
-        voices.append(
-            {
-                "voice": voice_name,
-                "provider": "groq",
-                "voice_id": None,
-                "description": groq_english_descriptions.get(
-                    voice_name
-                ),
-            }
-        )
+    # Add Groq Orpheus English voices
+    groq_english_descriptions = {
+        "austin": "Male English voice",
+        "hannah": "Female English voice",
+        "troy": "Male English voice",
+    }
+    for voice_name in GROQ_ORPHEUS_ENGLISH_VOICES:
+        voices.append(
+            {
+                "voice": voice_name,
+                "provider": "groq",
+                "voice_id": None,
+                "description": groq_english_descriptions.get(
+                    voice_name
+                ),
+            }
+        )
+
+    # Add Groq Orpheus Arabic voices
+    groq_arabic_descriptions = {
+        "salma": "Female Arabic (Saudi) voice",
+        "omar": "Male Arabic (Saudi) voice",
+    }
+    for voice_name in GROQ_ORPHEUS_ARABIC_VOICES:
+        voices.append(
+            {
+                "voice": voice_name,
+                "provider": "groq",
+                "voice_id": None,
+                "description": groq_arabic_descriptions.get(
+                    voice_name
+                ),
+            }
+        )
+
+    return voices
+
+
+def _resolve_tts_route(
+    model: str,
+    voice: Optional[str] = None,
+    response_format: Optional[str] = None,
+    voice_id: Optional[str] = None,
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    output_format: Optional[str] = None,
+    optimize_streaming_latency: Optional[int] = None,
+    enable_logging: bool = True,
+    verbose_logging: bool = False,
+) -> Tuple[str, dict]:
+    """
+    Resolve a unified "provider/model_name" request to a provider and its arguments.
+
+    Applies the provider defaults used by stream_tts (voice, response/output format)
+    and validates that the required provider-specific arguments are present.
+
+    Returns:
+        Tuple[str, dict]: The provider name ("openai", "elevenlabs" or "groq") and the
+            keyword arguments for that provider's stream_tts_* function (excluding
+            text_chunks and the mode flags).
+
+    Raises:
+        ValueError: If the provider is unknown or a required voice is missing.
+    """
+    # Parse model name to extract provider and model
+    provider = None
+    model_name = model
+
+    # Check if model is in provider/model_name format
+    if "/" in model:
+        parts = model.split("/", 1)
+        if len(parts) == 2:
+            provider = parts[0].lower()
+            model_name = parts[1]
+
+    # If no provider prefix, try to infer from model name (backward compatibility)
+    if provider is None:
+        model_lower = model_name.lower()
+
+        # Check if it's an OpenAI model
+        if model_lower.startswith("tts-1"):
+            provider = "openai"
+        # Check if it's an ElevenLabs model
+        elif model_lower.startswith("eleven_"):
+            provider = "elevenlabs"
+        # Check if it's a Groq model
+        elif model_lower.startswith(
+            "canopylabs/"
+        ) or model_lower.startswith("whisper-"):
+            provider = "groq"
+        else:
+            # Default to OpenAI for backward compatibility
+            provider = "openai"
+
+    # Route to appropriate provider
+    if provider == "openai":
+        if verbose_logging:
+            logger.info(
+                f"🔀 Routing to OpenAI provider (model: {model_name})"
+            )
+
+        # Use OpenAI
+        if voice is None:
+            voice = "alloy"  # Default OpenAI voice
+            if verbose_logging:
+                logger.debug(f"   Using default voice: {voice}")
+
+        # Set default response_format for OpenAI if not provided
+        if response_format is None:
+            response_format = "pcm"
+            if verbose_logging:
+                logger.debug(
+                    f"   Using default response_format: {response_format}"
+                )
+
+        return provider, {
+            "voice": voice,
+            "model": model_name,
+            "response_format": response_format,
+        }
+
+    elif provider == "elevenlabs":
+        if verbose_logging:
+            logger.info(
+                f"🔀 Routing to ElevenLabs provider (model: {model_name})"
+            )
+
+        # Use ElevenLabs
+        # Determine voice_id: use voice_id parameter if provided, otherwise use voice parameter
+        if voice_id is None:
+            if voice is None:
+                error_msg = (
+                    "Either 'voice' or 'voice_id' must be provided for ElevenLabs models. "
+                    "Use a friendly name like 'rachel' or a voice ID."
+                )
+                if verbose_logging:
+                    logger.error(f"❌ {error_msg}")
+                raise ValueError(error_msg)
+            voice_id = voice
+            if verbose_logging:
+                logger.debug(
+                    f"   Using voice parameter as voice_id: {voice_id}"
+                )
+        else:
+            # voice_id was explicitly provided, use it
+            if verbose_logging:
+                logger.debug(
+                    f"   Using provided voice_id: {voice_id}"
+                )
+
+        # Set default output_format for ElevenLabs if not provided
+        # Use mp3_44100_128 as default (works on free tier, pcm_44100 requires Pro tier)
+        if output_format is None:
+            output_format = "mp3_44100_128"
+            if verbose_logging:
+                logger.debug(
+                    f"   Using default output_format: {output_format}"
+                )
+
+        return provider, {
+            "voice_id": voice_id,
+            "model_id": model_name,
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+            "output_format": output_format,
+            "optimize_streaming_latency": optimize_streaming_latency,
+            "enable_logging": enable_logging,
+        }
+
+    elif provider == "groq":
+        if verbose_logging:
+            logger.info(
+                f"🔀 Routing to Groq provider (model: {model_name})"
+            )
+
+        # Use Groq
+        if voice is None:
+            error_msg = (
+                "Voice must be provided for Groq models. "
+                "For English model: 'austin', 'hannah', or 'troy'. "
+                "For Arabic model: 'salma' or 'omar'."
+            )
+            if verbose_logging:
+                logger.error(f"❌ {error_msg}")
+            raise ValueError(error_msg)
+
+        # Set default response_format for Groq if not provided
+        if response_format is None:
+            response_format = "wav"
+            if verbose_logging:
+                logger.debug(
+                    f"   Using default response_format: {response_format}"
+                )
+
+        return provider, {
+            "voice": voice,
+            "model": model_name,
+            "response_format": response_format,
+        }
+
+    else:
+        error_msg = (
+            f"Unknown provider: {provider}. Supported providers are 'openai', 'elevenlabs', and 'groq'. "
+            f"Use format 'provider/model_name' (e.g., 'openai/tts-1', 'elevenlabs/eleven_multilingual_v2', or 'groq/canopylabs/orpheus-v1-english')."
+        )
+        if verbose_logging:
+            logger.error(f"❌ {error_msg}")
+        raise ValueError(error_msg)
+
+
+def _prepare_tts_request(
+    provider: str,
+    provider_kwargs: dict,
+    playback: bool = True,
+    verbose_logging: bool = False,
+) -> _TTSRequest:
+    """
+    Build the request configuration for a route returned by `_resolve_tts_route`.
+
+    Args:
+        provider: Provider name ("openai", "elevenlabs" or "groq").
+        provider_kwargs: Provider keyword arguments from `_resolve_tts_route`.
+        playback: Whether the audio will be decoded locally (see `_prepare_elevenlabs_tts`).
+        verbose_logging: Enable verbose logging.
+
+    Returns:
+        _TTSRequest: The prepared provider configuration.
+    """
+    if provider == "openai":
+        return _prepare_openai_tts(
+            provider_kwargs["voice"],
+            provider_kwargs["model"],
+            provider_kwargs["response_format"],
+            verbose_logging,
+        )
+    if provider == "elevenlabs":
+        return _prepare_elevenlabs_tts(
+            provider_kwargs["voice_id"],
+            provider_kwargs["model_id"],
+            provider_kwargs["stability"],
+            provider_kwargs["similarity_boost"],
+            provider_kwargs["output_format"],
+            provider_kwargs["optimize_streaming_latency"],
+            provider_kwargs["enable_logging"],
+            playback=playback,
+            verbose_logging=verbose_logging,
+        )
+    return _prepare_groq_tts(
+        provider_kwargs["voice"],
+        provider_kwargs["model"],
+        provider_kwargs["response_format"],
+        verbose_logging,
+    )
+
+
+def _audio_encoding(
+    request: _TTSRequest,
+) -> Tuple[str, Optional[int]]:
+    """Codec and sample rate of a request's audio ("pcm_24000" and OpenAI "pcm" match)."""
+    return request.audio_format.split("_")[0], request.sample_rate
+
+
+def _hedged_tts_response(
+    primary: _TTSRequest,
+    hedge: _TTSRequest,
+    text: str,
+    hedge_after: Optional[float],
+    verbose_logging: bool = False,
+) -> Tuple[_TTSRequest, Iterator[bytes]]:
+    """
+    Race a text between two providers on time to first audio byte.
+
+    The primary request starts immediately. The hedge request starts if the
+    primary has not produced audio within `hedge_after` seconds (never, if
+    None) or as soon as the primary fails hard (timeout, connection error, 429/5xx or open circuit).
+    Whichever yields audio first wins. Each request gets its own cancel token,
+    chained to the caller's, and the loser's is cancelled as soon as a winner
+    is chosen, which closes its in-flight response.
+
+    Returns:
+        Tuple[_TTSRequest, Iterator[bytes]]: The winning request (its format
+            decides how the audio is played) and its audio, first chunk included.
+
+    Raises:
+        ValueError: The primary's error if both requests fail, or a non-hard
+            primary failure that the hedge cannot fix.
+    """
+    results: "queue.Queue" = queue.Queue()
+    lock = threading.Lock()
+    winner: List[int] = []
+    tokens = [CancelToken(), CancelToken()]
+    unlinks = [
+        (
+            request.cancel.on_cancel(token.cancel)
+            if request.cancel is not None
+            else lambda: None
+        )
+        for request, token in zip((primary, hedge), tokens)
+    ]
+
+    def contend(index: int, request: _TTSRequest) -> None:
+        chunks = _iter_tts_response(
+            request, request.build_payload(text)
+        )
+        try:
+            first = next(chunks, b"")
+            error = None
+        except (Exception, TTSCancelled) as e:
+            first, error = None, e
+        with lock:
+            lost = bool(winner) and winner[0] != index
+            if error is None and not winner:
+                winner.append(index)
+        if lost:
+            # Cancel the loser: closing the generator closes the response
+            chunks.close()
+            return
+        results.put((index, first, chunks, error))
+
+    contenders = [
+        replace(primary, cancel=tokens[0]),
+        replace(hedge, cancel=tokens[1]),
+    ]
+    started = 0
+
+    def winning_audio(
+        index: int, first: bytes, chunks: Iterator[bytes]
+    ) -> Generator[bytes, None, None]:
+        try:
+            yield first
+            yield from chunks
+        finally:
+            unlinks[index]()
+
+    def start_next() -> None:
+        nonlocal started
+        threading.Thread(
+            target=contend,
+            args=(started, contenders[started]),
+            daemon=True,
+        ).start()
+        started += 1
+
+    start_next()
+    errors: dict = {}
+    while True:
+        try:
+            timeout = hedge_after if started == 1 else None
+            index, first, chunks, error = results.get(timeout=timeout)
+        except queue.Empty:
+            if verbose_logging:
+                logger.warning(
+                    f"⏱️  No audio from {primary.provider} after {hedge_after}s, "
+                    f"hedging to {hedge.provider}"
+                )
+            start_next()
+            continue
+
+        if error is None:
+            if verbose_logging and index == 1:
+                logger.info(
+                    f"🏁 Hedge ({hedge.provider}) delivered audio first"
+                )
+            tokens[1 - index].cancel()
+            unlinks[1 - index]()
+            return contenders[index], winning_audio(
+                index, first, chunks
+            )
+
+        errors[index] = error
+        if (
+            index == 0
+            and started == 1
+            and (
+                isinstance(error, CircuitOpenError)
+                or is_retryable_error(error)
+            )
+        ):
+            if verbose_logging:
+                logger.warning(
+                    f"⚠️  {primary.provider} failed ({error}), failing over to {hedge.provider}"
+                )
+            start_next()
+            continue
+        if len(errors) == started:
+            for unlink in unlinks:
+                unlink()
+            raise errors.get(0, error)
+
+
+def _play_request_audio(
+    request: _TTSRequest,
+    audio: Iterable[bytes],
+    sink: Optional[AudioSink] = None,
+) -> None:
+    """Play one response in the request's format, as its provider function would."""
+    if request.audio_format.startswith("pcm"):
+        _play_pcm_responses([audio], request.sample_rate, sink)
+        return
+    if request.audio_format.startswith("mp3"):
+        _play_mp3_responses(
+            [audio], request.sample_rate or SAMPLE_RATE, sink
+        )
+        return
+    if request.audio_format == "wav":
+        _play_wav_responses([audio], sink)
+        return
+
+    buffer = bytearray(b"".join(audio))
+    if request.provider == "elevenlabs":
+        process_audio_buffer(
+            buffer, request.audio_format, request.sample_rate, sink
+        )
+    elif request.provider == "groq":
+        logger.warning(
+            f"⚠️  {request.audio_format} format not supported for direct playback. Only 'wav' format is supported."
+        )
+    else:
+        process_and_play_audio_buffer(
+            buffer, request.audio_format, sink=sink
+        )
+
 
-    # Add Groq Orpheus Arabic voices
-    groq_arabic_descriptions = {
-        "salma": "Female Arabic (Saudi) voice",
-        "omar": "Male Arabic (Saudi) voice",
-    }
-    for voice_name in GROQ_ORPHEUS_ARABIC_VOICES:
-        voices.append(
-            {
-                "voice": voice_name,
-                "provider": "groq",
-                "voice_id": None,
-                "description": groq_arabic_descriptions.get(
-                    voice_name
-                ),
-            }
+def _stream_hedged_tts(
+    text_chunks: Union[List[str], Iterable[str]],
+    stream_mode: bool,
+    primary: _TTSRequest,
+    hedge: _TTSRequest,
+    hedge_after: Optional[float],
+    return_generator: bool,
+    verbose_logging: bool = False,
+    sink: Optional[AudioSink] = None,
+) -> Optional[Generator[bytes, None, None]]:
+    """
+    stream_tts with a hedge provider: every request (the joined text, or each
+    chunk in stream_mode) is raced through `_hedged_tts_response`.
+    """
+
+    def iter_texts() -> Generator[str, None, None]:
+        if not stream_mode:
+            yield " ".join(list(text_chunks))
+            return
+        for chunk in text_chunks:
+            if chunk and chunk.strip():
+                yield chunk.strip()
+
+    def iter_responses() -> (
+        Generator[Tuple[_TTSRequest, Iterator[bytes]], None, None]
+    ):
+        for text in iter_texts():
+            yield _hedged_tts_response(
+                primary, hedge, text, hedge_after, verbose_logging
+            )
+
+    if return_generator:
+        return _stop_iteration_on_cancel(
+            audio_chunk
+            for _, audio in iter_responses()
+            for audio_chunk in audio
         )
 
-    return voices
+    for request, audio in iter_responses():
+        _play_request_audio(request, audio, sink)
+    return None
 
 
+@_stop_on_cancel
 def stream_tts(
     text_chunks: Union[List[str], Iterable[str]],
     model: str = "openai/tts-1",
@@ -654,7 +1972,15 @@ def stream_tts(
     optimize_streaming_latency: Optional[int] = None,
     enable_logging: bool = True,
     verbose: Optional[bool] = None,
-) -> None:
+    return_generator: bool = False,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+    sink: Optional[AudioSink] = None,
+    cancel: Optional[CancelToken] = None,
+    hedge_model: Optional[str] = None,
+    hedge_voice: Optional[str] = None,
+    hedge_after: Optional[float] = 1.0,
+) -> Optional[Generator[bytes, None, None]]:
     """
     Unified text-to-speech streaming function that supports OpenAI, ElevenLabs, and Groq providers.
 
@@ -684,9 +2010,36 @@ def stream_tts(
         optimize_streaming_latency (Optional[int]): ElevenLabs-specific latency optimization (0-4). Ignored for OpenAI.
         enable_logging (bool): ElevenLabs-specific logging setting. Default is True. Ignored for ElevenLabs.
         verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        return_generator (bool): If True, return a generator that yields raw audio bytes as they arrive
+            from the provider instead of playing them. Useful for FastAPI StreamingResponse and headless
+            servers without an audio device. Default is False.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight on the shared HTTP/2 client while the current chunk plays,
+            hiding the per-chunk network round trip. Playback order is unchanged. Default is 0 (sequential).
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
+        sink (Optional[AudioSink]): Where to play the audio when return_generator is False
+            (e.g. `WAVFileSink`, `NumpySink`, `CallbackSink`, `NullSink`). Default is None
+            (the default sink, normally the sound card; see `set_default_sink`).
+        cancel (Optional[CancelToken]): Aborts the call from another thread (barge-in): open
+            responses are closed, queued requests dropped and unplayed audio discarded, and the
+            function returns None (a returned generator ends). Default is None.
+        hedge_model (Optional[str]): Backup model in "provider/model_name" format, usually on another
+            provider. Each request is also sent to the backup if the primary has produced no audio
+            after `hedge_after` seconds, or fails with a timeout, connection error, 429 or 5xx; the
+            first to return audio is played and the other is cancelled. response_format and
+            output_format apply to the backup too. With return_generator=True both models must
+            produce the same format and sample rate. `prefetch` is ignored.
+            Default is None (no hedging).
+        hedge_voice (Optional[str]): Voice for the backup model. Required for ElevenLabs and Groq.
+        hedge_after (Optional[float]): Seconds to wait for the primary's first audio byte before
+            sending the hedge request. If None, the backup is only used when the primary fails.
+            Default is 1.0.
 
     Returns:
-        None: Plays audio to system output.
+        Optional[Generator[bytes, None, None]]: None when playing audio to system output, or a generator
+            of raw audio bytes when return_generator is True.
 
     Example:
         >>> # Using OpenAI with new format
@@ -701,6 +2054,16 @@ def stream_tts(
         >>> # Backward compatible (old format still works)
         >>> stream_tts(["Hello world"], model="tts-1", voice="alloy")
         >>>
+        >>> # Generator mode for web streaming
+        >>> audio = stream_tts(["Hello world"], model="openai/tts-1", return_generator=True)
+        >>> for audio_chunk in audio:
+        ...     send(audio_chunk)
+        >>>
+        >>> # Fall back to Groq if OpenAI is slow or down
+        >>> stream_tts(["Hello world"], model="openai/tts-1", voice="alloy",
+        ...            hedge_model="groq/canopylabs/orpheus-v1-english", hedge_voice="austin",
+        ...            hedge_after=0.8)
+        >>>
         >>> # With verbose logging
         >>> stream_tts(["Hello world"], model="openai/tts-1", voice="alloy", verbose=True)
     """
@@ -716,210 +2079,677 @@ def stream_tts(
             f"   Model: {model} | Voice: {voice} | Stream Mode: {stream_mode}"
         )
 
-    # Parse model name to extract provider and model
-    provider = None
-    model_name = model
+    provider, provider_kwargs = _resolve_tts_route(
+        model,
+        voice=voice,
+        response_format=response_format,
+        voice_id=voice_id,
+        stability=stability,
+        similarity_boost=similarity_boost,
+        output_format=output_format,
+        optimize_streaming_latency=optimize_streaming_latency,
+        enable_logging=enable_logging,
+        verbose_logging=verbose_logging,
+    )
 
-    # Check if model is in provider/model_name format
-    if "/" in model:
-        parts = model.split("/", 1)
-        if len(parts) == 2:
-            provider = parts[0].lower()
-            model_name = parts[1]
+    if hedge_model is not None:
+        hedge_provider, hedge_kwargs = _resolve_tts_route(
+            hedge_model,
+            voice=hedge_voice,
+            response_format=response_format,
+            output_format=output_format,
+            stability=stability,
+            similarity_boost=similarity_boost,
+            optimize_streaming_latency=optimize_streaming_latency,
+            enable_logging=enable_logging,
+            verbose_logging=verbose_logging,
+        )
+        requests = [
+            _prepare_tts_request(
+                route_provider,
+                route_kwargs,
+                playback=not return_generator,
+                verbose_logging=verbose_logging,
+            )
+            for route_provider, route_kwargs in (
+                (provider, provider_kwargs),
+                (hedge_provider, hedge_kwargs),
+            )
+        ]
+        if return_generator and _audio_encoding(
+            requests[0]
+        ) != _audio_encoding(requests[1]):
+            raise ValueError(
+                f"hedge_model '{hedge_model}' returns {requests[1].audio_format} audio but "
+                f"'{model}' returns {requests[0].audio_format}; with return_generator=True "
+                "both must produce the same format and sample rate. Set response_format / "
+                "output_format so they match."
+            )
+        for request in requests:
+            request.cache = cache
+            request.cancel = cancel
+        if verbose_logging:
+            logger.info(
+                f"🛡️  Hedging with {hedge_model} "
+                + (
+                    f"after {hedge_after}s"
+                    if hedge_after is not None
+                    else "on failure only"
+                )
+            )
+        return _stream_hedged_tts(
+            text_chunks,
+            stream_mode,
+            requests[0],
+            requests[1],
+            hedge_after,
+            return_generator,
+            verbose_logging,
+            _cancellable_sink(sink, cancel),
+        )
 
-    # If no provider prefix, try to infer from model name (backward compatibility)
-    if provider is None:
-        model_lower = model_name.lower()
+    # Route to appropriate provider
+    provider_function = {
+        "openai": stream_tts_openai,
+        "elevenlabs": stream_tts_elevenlabs,
+        "groq": stream_tts_groq,
+    }[provider]
+
+    return provider_function(
+        text_chunks=text_chunks,
+        stream_mode=stream_mode,
+        verbose=verbose_logging,
+        return_generator=return_generator,
+        prefetch=prefetch,
+        cache=cache,
+        sink=sink,
+        cancel=cancel,
+        **provider_kwargs,
+    )
 
-        # Check if it's an OpenAI model
-        if model_lower.startswith("tts-1"):
-            provider = "openai"
-        # Check if it's an ElevenLabs model
-        elif model_lower.startswith("eleven_"):
-            provider = "elevenlabs"
-        # Check if it's a Groq model
-        elif model_lower.startswith(
-            "canopylabs/"
-        ) or model_lower.startswith("whisper-"):
-            provider = "groq"
-        else:
-            # Default to OpenAI for backward compatibility
-            provider = "openai"
 
-    # Route to appropriate provider
-    if provider == "openai":
-        if verbose_logging:
-            logger.info(
-                f"🔀 Routing to OpenAI provider (model: {model_name})"
+@_stop_on_cancel
+def stream_tts_elevenlabs(
+    text_chunks: Union[List[str], Iterable[str]],
+    voice_id: str,
+    model_id: str = "eleven_multilingual_v2",
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    output_format: str = "mp3_44100_128",
+    optimize_streaming_latency: Optional[int] = None,
+    enable_logging: bool = True,
+    stream_mode: bool = False,
+    verbose: Optional[bool] = None,
+    return_generator: bool = False,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+    sink: Optional[AudioSink] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Optional[Generator[bytes, None, None]]:
+    """
+    Stream text-to-speech using Eleven Labs TTS API, processing chunks and playing the resulting audio stream.
+
+    Args:
+        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
+            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
+        voice_id (str): The Eleven Labs voice ID or friendly name (e.g., "rachel", "domi") to use for TTS synthesis.
+        model_id (str): The model ID to use. Default is "eleven_multilingual_v2".
+        stability (float): Stability setting for voice (0.0 to 1.0). Default is 0.5.
+        similarity_boost (float): Similarity boost setting (0.0 to 1.0). Default is 0.75.
+        output_format (str): Output audio format. Options include:
+            - Free tier: "mp3_44100_128" (default), "mp3_44100_192", "pcm_16000", "pcm_22050", "pcm_24000"
+            - Pro tier: "pcm_8000", "pcm_32000", "pcm_44100", "pcm_48000", "ulaw_8000", "alaw_8000"
+            Default is "mp3_44100_128" (works on free tier accounts). Note: "pcm_44100" requires Pro tier subscription.
+        optimize_streaming_latency (Optional[int]): Latency optimization (0-4). Default is None.
+        enable_logging (bool): Enable logging for the request. Default is True.
+        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
+            and process as a single request. Default is False.
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        return_generator (bool): If True, return a generator that yields raw audio bytes as they arrive
+            from the API instead of playing them. No audio device is required. Default is False.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight on the shared HTTP/2 client while the current chunk plays,
+            hiding the per-chunk network round trip. Playback order is unchanged. Default is 0 (sequential).
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
+        sink (Optional[AudioSink]): Where to play the audio when return_generator is False
+            (e.g. `WAVFileSink`, `NumpySink`, `CallbackSink`, `NullSink`). Default is None
+            (the default sink, normally the sound card; see `set_default_sink`).
+        cancel (Optional[CancelToken]): Aborts the call from another thread (barge-in): open
+            responses are closed, queued requests dropped and unplayed audio discarded, and the
+            function returns None (a returned generator ends). Default is None.
+
+    Returns:
+        Optional[Generator[bytes, None, None]]: None when playing audio to system output, or a generator
+            of raw audio bytes in `output_format` when return_generator is True.
+
+    Details:
+        - This function uses the Eleven Labs TTS API streaming endpoint via httpx.
+        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
+        - When stream_mode is True, each chunk is processed individually as it arrives.
+        - Audio is streamed, buffered, and played using the `play_audio` helper.
+        - For PCM formats, handles audio data as int16 samples.
+        - Useful for real-time output, agent system narration, or API streaming.
+
+    Example:
+        >>> # Play audio locally
+        >>> stream_tts_elevenlabs(["Hello world"], voice_id="rachel")
+        >>>
+        >>> # Stream raw MP3 bytes (e.g., to a FastAPI StreamingResponse)
+        >>> for audio_chunk in stream_tts_elevenlabs(["Hello world"], voice_id="rachel", return_generator=True):
+        ...     send(audio_chunk)
+        >>>
+        >>> # With verbose logging
+        >>> stream_tts_elevenlabs(["Hello world"], voice_id="rachel", verbose=True)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
+
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting ElevenLabs TTS Request")
+        logger.info(
+            f"   Model: {model_id} | Voice ID: {voice_id} | Format: {output_format} | "
+            f"Stream Mode: {stream_mode} | Stability: {stability} | Similarity: {similarity_boost}"
+        )
+        if isinstance(text_chunks, (list, tuple)):
+            logger.debug(f"   Text chunks: {len(text_chunks)} chunks")
+            for i, chunk in enumerate(text_chunks[:3]):
+                logger.debug(
+                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
+                )
+
+    request = _prepare_elevenlabs_tts(
+        voice_id,
+        model_id,
+        stability,
+        similarity_boost,
+        output_format,
+        optimize_streaming_latency,
+        enable_logging,
+        playback=not return_generator,
+        verbose_logging=verbose_logging,
+    )
+    request.cache = cache
+    request.cancel = cancel
+    sink = _cancellable_sink(sink, cancel)
+
+    # Generator mode: yield audio bytes as they arrive, no playback
+    if return_generator:
+        return _generate_tts_audio(
+            _iter_request_payloads(text_chunks, stream_mode, request),
+            request,
+            prefetch=_effective_prefetch(
+                request, stream_mode, prefetch
+            ),
+        )
+
+    # PCM needs no decoding, so play it incrementally as it arrives
+    if output_format.startswith("pcm_"):
+        _play_pcm_responses(
+            _iter_chunk_audio(
+                _iter_request_payloads(
+                    text_chunks, stream_mode, request
+                ),
+                request,
+                prefetch=_effective_prefetch(
+                    request, stream_mode, prefetch
+                ),
+            ),
+            request.sample_rate,
+            sink,
+        )
+        return None
+
+    # MP3 (the default format) is decoded frame by frame while it downloads
+    if output_format.startswith("mp3_"):
+        _play_mp3_responses(
+            _iter_chunk_audio(
+                _iter_request_payloads(
+                    text_chunks, stream_mode, request
+                ),
+                request,
+                prefetch=_effective_prefetch(
+                    request, stream_mode, prefetch
+                ),
+            ),
+            request.sample_rate,
+            sink,
+        )
+        return None
+
+    # G.711 is decoded chunk by chunk as it arrives
+    if output_format.startswith(("ulaw_", "alaw_")):
+        _play_g711_responses(
+            _iter_chunk_audio(
+                _iter_request_payloads(
+                    text_chunks, stream_mode, request
+                ),
+                request,
+                prefetch=_effective_prefetch(
+                    request, stream_mode, prefetch
+                ),
+            ),
+            output_format,
+            request.sample_rate,
+            sink,
+        )
+        return None
+
+    # If stream_mode is False, process all chunks at once (backward compatible)
+    if not stream_mode:
+        # Join all text chunks into a single string
+        text = " ".join(list(text_chunks))
+
+        # Buffer to accumulate audio data
+        buffer = bytearray()
+
+        # Stream audio chunks
+        for audio_chunk in _iter_tts_response(
+            request, request.build_payload(text)
+        ):
+            buffer.extend(audio_chunk)
+
+        # Process buffered audio data
+        process_audio_buffer(
+            buffer, output_format, request.sample_rate, sink
+        )
+    else:
+        # Stream mode: process each chunk as it arrives, optionally with
+        # the next `prefetch` requests already in flight
+        for audio_stream in _iter_chunk_audio(
+            _iter_text_payloads(
+                text_chunks, True, request.build_payload
+            ),
+            request,
+            prefetch=prefetch,
+        ):
+            # Buffer to accumulate audio data for this chunk
+            buffer = bytearray()
+
+            # Stream audio chunks for this text chunk
+            for audio_chunk in audio_stream:
+                buffer.extend(audio_chunk)
+
+            # Process and play audio for this chunk immediately
+            process_audio_buffer(
+                buffer, output_format, request.sample_rate, sink
             )
 
-        # Use OpenAI
-        if voice is None:
-            voice = "alloy"  # Default OpenAI voice
-            if verbose_logging:
-                logger.debug(f"   Using default voice: {voice}")
 
-        # Set default response_format for OpenAI if not provided
-        if response_format is None:
-            response_format = "pcm"
-            if verbose_logging:
+def _play_wav_responses(
+    audio_streams: Iterable[Iterable[bytes]],
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Parse WAV responses incrementally and play their PCM as it arrives.
+
+    Each response gets its own `WAVStreamParser`, so playback starts once its
+    header has been received instead of after the whole file. Consecutive
+    responses with the same sample rate share one run of the output engine.
+
+    Returns:
+        int: Total number of samples played.
+
+    Raises:
+        ValueError: If a response is not a playable WAV file.
+    """
+
+    def iter_blocks() -> (
+        Generator[Tuple[int, int, np.ndarray], None, None]
+    ):
+        for index, audio_stream in enumerate(audio_streams):
+            parser = WAVStreamParser()
+            for audio_chunk in audio_stream:
+                samples = parser.push(audio_chunk)
+                if samples is not None:
+                    yield parser.sample_rate, index, samples
+
+    frames = 0
+    for sample_rate, blocks in itertools.groupby(
+        iter_blocks(), key=lambda block: block[0]
+    ):
+        # Stitch the consecutive responses that share a sample rate
+        utterances = (
+            (samples for _, _, samples in response_blocks)
+            for _, response_blocks in itertools.groupby(
+                blocks, key=lambda block: block[1]
+            )
+        )
+        frames += play_pcm_samples(
+            stitch_utterances(utterances, sample_rate),
+            sample_rate,
+            sink,
+        )
+    return frames
+
+
+@_stop_on_cancel
+def stream_tts_groq(
+    text_chunks: Union[List[str], Iterable[str]],
+    voice: str,
+    model: str = "canopylabs/orpheus-v1-english",
+    stream_mode: bool = False,
+    response_format: str = "wav",
+    verbose: Optional[bool] = None,
+    return_generator: bool = False,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+    sink: Optional[AudioSink] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Optional[Generator[bytes, None, None]]:
+    """
+    Stream text-to-speech using Groq's fast TTS API, processing chunks and playing the resulting audio stream.
+
+    Args:
+        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
+            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
+        voice (str): The voice to use for TTS synthesis.
+            For English model (canopylabs/orpheus-v1-english): "austin", "hannah", "troy"
+            For Arabic model (canopylabs/orpheus-arabic-saudi): "salma", "omar"
+        model (str): The model to use for TTS.
+            Options: "canopylabs/orpheus-v1-english", "canopylabs/orpheus-arabic-saudi"
+            Default is "canopylabs/orpheus-v1-english".
+        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
+            and process as a single request. Default is False.
+        response_format (str): Audio format to request from Groq. Options: "wav", "mp3", "opus", "aac", "flac".
+            Default is "wav". Note: Only "wav" format is supported for direct playback.
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        return_generator (bool): If True, return a generator that yields raw audio bytes as they arrive
+            from the API instead of playing them. In stream_mode each text chunk produces its own
+            complete audio file (e.g. its own WAV header). Default is False.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight on the shared HTTP/2 client while the current chunk plays,
+            hiding the per-chunk network round trip. Playback order is unchanged. Default is 0 (sequential).
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
+        sink (Optional[AudioSink]): Where to play the audio when return_generator is False
+            (e.g. `WAVFileSink`, `NumpySink`, `CallbackSink`, `NullSink`). Default is None
+            (the default sink, normally the sound card; see `set_default_sink`).
+        cancel (Optional[CancelToken]): Aborts the call from another thread (barge-in): open
+            responses are closed, queued requests dropped and unplayed audio discarded, and the
+            function returns None (a returned generator ends). Default is None.
+
+    Returns:
+        Optional[Generator[bytes, None, None]]: None when playing audio to system output, or a generator
+            of raw audio bytes in `response_format` when return_generator is True.
+
+    Details:
+        - This function uses the Groq TTS API's streaming capabilities via httpx.
+        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
+        - When stream_mode is True, each chunk is processed individually as it arrives.
+        - Audio is streamed, buffered, and played using the `play_audio` helper.
+        - Supports vocal directions in text (e.g., "[cheerful] Hello world").
+        - Useful for real-time output, agent system narration, or API streaming.
+
+    Example:
+        >>> # Play audio locally
+        >>> stream_tts_groq(["Hello world"], voice="austin")
+        >>>
+        >>> # With vocal directions
+        >>> stream_tts_groq(
+        ...     ["Welcome to Orpheus. [cheerful] This is an example."],
+        ...     voice="hannah",
+        ...     model="canopylabs/orpheus-v1-english"
+        ... )
+        >>>
+        >>> # With verbose logging
+        >>> stream_tts_groq(["Hello world"], voice="austin", verbose=True)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
+
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting Groq TTS Request")
+        logger.info(
+            f"   Model: {model} | Voice: {voice} | Format: {response_format} | Stream Mode: {stream_mode}"
+        )
+        if isinstance(text_chunks, (list, tuple)):
+            logger.debug(f"   Text chunks: {len(text_chunks)} chunks")
+            for i, chunk in enumerate(text_chunks[:3]):
                 logger.debug(
-                    f"   Using default response_format: {response_format}"
+                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
                 )
 
-        return stream_tts_openai(
-            text_chunks=text_chunks,
-            voice=voice,  # type: ignore
-            model=model_name,
-            stream_mode=stream_mode,
-            response_format=response_format,
-            verbose=verbose_logging,
+    request = _prepare_groq_tts(
+        voice, model, response_format, verbose_logging
+    )
+    request.cache = cache
+    request.cancel = cancel
+    sink = _cancellable_sink(sink, cancel)
+
+    # Generator mode: yield audio bytes as they arrive, no playback
+    if return_generator:
+        return _generate_tts_audio(
+            _iter_request_payloads(text_chunks, stream_mode, request),
+            request,
+            prefetch=_effective_prefetch(
+                request, stream_mode, prefetch
+            ),
         )
 
-    elif provider == "elevenlabs":
-        if verbose_logging:
-            logger.info(
-                f"🔀 Routing to ElevenLabs provider (model: {model_name})"
+    if response_format != "wav":
+        # For non-WAV formats, we can't play directly
+        for audio_stream in _iter_chunk_audio(
+            _iter_request_payloads(text_chunks, stream_mode, request),
+            request,
+            prefetch=_effective_prefetch(
+                request, stream_mode, prefetch
+            ),
+        ):
+            for _ in audio_stream:
+                pass
+            print(
+                f"Warning: {response_format} format not supported for direct playback. Only 'wav' format is supported."
             )
+        return None
+
+    # Join all chunks into one request unless stream_mode is set, then play
+    # each resulting WAV (one per text chunk in stream_mode) as it arrives
+    _play_wav_responses(
+        _iter_chunk_audio(
+            _iter_request_payloads(text_chunks, stream_mode, request),
+            request,
+            prefetch=_effective_prefetch(
+                request, stream_mode, prefetch
+            ),
+        ),
+        sink,
+    )
 
-        # Use ElevenLabs
-        # Determine voice_id: use voice_id parameter if provided, otherwise use voice parameter
-        if voice_id is None:
-            if voice is None:
-                error_msg = (
-                    "Either 'voice' or 'voice_id' must be provided for ElevenLabs models. "
-                    "Use a friendly name like 'rachel' or a voice ID."
-                )
-                if verbose_logging:
-                    logger.error(f"❌ {error_msg}")
-                raise ValueError(error_msg)
-            voice_id = voice
-            if verbose_logging:
-                logger.debug(
-                    f"   Using voice parameter as voice_id: {voice_id}"
-                )
-        else:
-            # voice_id was explicitly provided, use it
-            if verbose_logging:
-                logger.debug(
-                    f"   Using provided voice_id: {voice_id}"
-                )
 
-        # Set default output_format for ElevenLabs if not provided
-        # Use mp3_44100_128 as default (works on free tier, pcm_44100 requires Pro tier)
-        if output_format is None:
-            output_format = "mp3_44100_128"
-            if verbose_logging:
-                logger.debug(
-                    f"   Using default output_format: {output_format}"
-                )
+def _iter_word_fragments(
+    text_chunks: Iterable[str],
+) -> Generator[str, None, None]:
+    """
+    Re-chunk streamed text (e.g. LLM tokens) at word boundaries.
 
-        return stream_tts_elevenlabs(
-            text_chunks=text_chunks,
-            voice_id=voice_id,
-            model_id=model_name,
-            stability=stability,
-            similarity_boost=similarity_boost,
-            output_format=output_format,
-            optimize_streaming_latency=optimize_streaming_latency,
-            enable_logging=enable_logging,
-            stream_mode=stream_mode,
-            verbose=verbose_logging,
-        )
+    The ElevenLabs input stream expects every text message to end with a
+    space, so a token that ends mid-word is held back until the rest of the
+    word arrives. Whatever is left at the end is flushed with a trailing space.
+    """
+    pending = ""
+    for chunk in text_chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        cut = max(pending.rfind(" "), pending.rfind("\n"))
+        if cut < 0:
+            continue
+        fragment, pending = pending[: cut + 1], pending[cut + 1 :]
+        if fragment.strip():
+            yield fragment
+    if pending.strip():
+        yield pending + " "
+
+
+def _iter_elevenlabs_ws_audio(
+    ws_url: str,
+    headers: dict,
+    initial_message: dict,
+    text_chunks: Iterable[str],
+    verbose_logging: bool = False,
+    cancel: Optional[CancelToken] = None,
+) -> Generator[bytes, None, None]:
+    """
+    Run one ElevenLabs `stream-input` WebSocket session and yield its audio.
 
-    elif provider == "groq":
-        if verbose_logging:
-            logger.info(
-                f"🔀 Routing to Groq provider (model: {model_name})"
-            )
+    A sender thread pushes text fragments as `text_chunks` produces them while
+    this generator receives and decodes audio frames, so synthesis of the
+    beginning of an utterance overlaps with generation of its end.
 
-        # Use Groq
-        if voice is None:
-            error_msg = (
-                "Voice must be provided for Groq models. "
-                "For English model: 'austin', 'hannah', or 'troy'. "
-                "For Arabic model: 'salma' or 'omar'."
-            )
-            if verbose_logging:
-                logger.error(f"❌ {error_msg}")
-            raise ValueError(error_msg)
+    Yields:
+        bytes: Decoded audio frames in the requested output format.
 
-        # Set default response_format for Groq if not provided
-        if response_format is None:
-            response_format = "wav"
-            if verbose_logging:
-                logger.debug(
-                    f"   Using default response_format: {response_format}"
-                )
+    Raises:
+        ValueError: If websockets is missing, the server reports an error, or
+            the text iterable raises.
+        TTSCancelled: If `cancel` is cancelled; the socket is closed at once.
+    """
+    import base64
 
-        return stream_tts_groq(
-            text_chunks=text_chunks,
-            voice=voice,
-            model=model_name,
-            stream_mode=stream_mode,
-            response_format=response_format,
-            verbose=verbose_logging,
+    try:
+        from websockets.exceptions import ConnectionClosed
+        from websockets.sync.client import connect
+    except ImportError:
+        raise ValueError(
+            "websockets library is required for WebSocket TTS. "
+            "Install it with: pip install websockets"
         )
 
-    else:
-        error_msg = (
-            f"Unknown provider: {provider}. Supported providers are 'openai', 'elevenlabs', and 'groq'. "
-            f"Use format 'provider/model_name' (e.g., 'openai/tts-1', 'elevenlabs/eleven_multilingual_v2', or 'groq/canopylabs/orpheus-v1-english')."
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    with connect(ws_url, additional_headers=headers) as websocket:
+        remove_callback = (
+            cancel.on_cancel(websocket.close)
+            if cancel is not None
+            else lambda: None
         )
+        websocket.send(json.dumps(initial_message))
+        sender_errors: List[BaseException] = []
+
+        def send_text() -> None:
+            try:
+                for fragment in _iter_word_fragments(text_chunks):
+                    websocket.send(json.dumps({"text": fragment}))
+                # An empty text message ends the input and flushes the audio
+                websocket.send(json.dumps({"text": ""}))
+            except ConnectionClosed:
+                pass
+            except BaseException as e:
+                sender_errors.append(e)
+                websocket.close()
+
+        sender = threading.Thread(target=send_text, daemon=True)
+        sender.start()
+
+        frames = 0
+        try:
+            for message in websocket:
+                data = json.loads(message)
+                if data.get("error"):
+                    raise ValueError(
+                        f"ElevenLabs WebSocket error: {data.get('message') or data['error']}"
+                    )
+                if data.get("audio"):
+                    frames += 1
+                    yield base64.b64decode(data["audio"])
+                if data.get("isFinal"):
+                    break
+        except ConnectionClosed as e:
+            if cancel is not None and cancel.cancelled:
+                raise TTSCancelled() from e
+            if not sender_errors:
+                raise ValueError(
+                    f"ElevenLabs WebSocket closed unexpectedly: {e}"
+                ) from e
+        finally:
+            remove_callback()
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+
+        if sender_errors:
+            raise ValueError(
+                f"Error while streaming text to ElevenLabs: {sender_errors[0]}"
+            ) from sender_errors[0]
+
         if verbose_logging:
-            logger.error(f"❌ {error_msg}")
-        raise ValueError(error_msg)
+            logger.info(
+                f"📊 WebSocket session complete: {frames} frames"
+            )
 
 
-def stream_tts_elevenlabs(
+@_stop_on_cancel
+def stream_tts_elevenlabs_ws(
     text_chunks: Union[List[str], Iterable[str]],
     voice_id: str,
     model_id: str = "eleven_multilingual_v2",
     stability: float = 0.5,
     similarity_boost: float = 0.75,
     output_format: str = "mp3_44100_128",
-    optimize_streaming_latency: Optional[int] = None,
+    chunk_length_schedule: Optional[List[int]] = None,
     enable_logging: bool = True,
-    stream_mode: bool = False,
     verbose: Optional[bool] = None,
-) -> None:
+    return_generator: bool = False,
+    base_url: str = "wss://api.elevenlabs.io",
+    sink: Optional[AudioSink] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Optional[Generator[bytes, None, None]]:
     """
-    Stream text-to-speech using Eleven Labs TTS API, processing chunks and playing the resulting audio stream.
+    Stream text-to-speech over the ElevenLabs `stream-input` WebSocket.
+
+    One socket is opened per utterance. Text is pushed as it is produced
+    (e.g. token by token from an LLM), re-chunked at word boundaries, and
+    audio frames are yielded or played as soon as the server returns them,
+    without waiting for complete sentences or opening a request per sentence.
 
     Args:
-        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
-            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
-        voice_id (str): The Eleven Labs voice ID or friendly name (e.g., "rachel", "domi") to use for TTS synthesis.
+        text_chunks (Union[List[str], Iterable[str]]): Text fragments of one utterance, in order.
+            Fragments may split words (LLM tokens); they are joined before sending.
+        voice_id (str): The Eleven Labs voice ID or friendly name (e.g., "rachel").
         model_id (str): The model ID to use. Default is "eleven_multilingual_v2".
         stability (float): Stability setting for voice (0.0 to 1.0). Default is 0.5.
         similarity_boost (float): Similarity boost setting (0.0 to 1.0). Default is 0.75.
-        output_format (str): Output audio format. Options include:
-            - Free tier: "mp3_44100_128" (default), "mp3_44100_192", "pcm_16000", "pcm_22050", "pcm_24000"
-            - Pro tier: "pcm_8000", "pcm_32000", "pcm_44100", "pcm_48000", "ulaw_8000", "alaw_8000"
-            Default is "mp3_44100_128" (works on free tier accounts). Note: "pcm_44100" requires Pro tier subscription.
-        optimize_streaming_latency (Optional[int]): Latency optimization (0-4). Default is None.
+        output_format (str): Output audio format, as for `stream_tts_elevenlabs`.
+            Default is "mp3_44100_128".
+        chunk_length_schedule (Optional[List[int]]): Characters buffered by the server before
+            each successive generation (e.g. [50, 120, 160, 290]). Lower values reduce latency.
+            Default is None (server default).
         enable_logging (bool): Enable logging for the request. Default is True.
-        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
-            and process as a single request. Default is False.
         verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        return_generator (bool): If True, return a generator of raw audio bytes instead of
+            playing them. Default is False.
+        base_url (str): WebSocket origin. Override to point at a local stand-in server for
+            testing. Default is "wss://api.elevenlabs.io".
+        sink (Optional[AudioSink]): Where to play the audio when return_generator is False
+            (e.g. `WAVFileSink`, `NumpySink`, `CallbackSink`, `NullSink`). Default is None
+            (the default sink, normally the sound card; see `set_default_sink`).
+        cancel (Optional[CancelToken]): Aborts the call from another thread (barge-in): open
+            responses are closed, queued requests dropped and unplayed audio discarded, and the
+            function returns None (a returned generator ends). Default is None.
 
     Returns:
-        None: Plays audio to system output.
+        Optional[Generator[bytes, None, None]]: None when playing audio to system output, or a
+            generator of raw audio bytes in `output_format` when return_generator is True.
 
-    Details:
-        - This function uses the Eleven Labs TTS API streaming endpoint via httpx.
-        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
-        - When stream_mode is True, each chunk is processed individually as it arrives.
-        - Audio is streamed, buffered, and played using the `play_audio` helper.
-        - For PCM formats, handles audio data as int16 samples.
-        - Useful for real-time output, agent system narration, or API streaming.
+    Raises:
+        ValueError: If ELEVENLABS_API_KEY is not set, the format can't be played, or the
+            server reports an error.
 
     Example:
-        >>> # Play audio locally
-        >>> stream_tts_elevenlabs(["Hello world"], voice_id="rachel")
+        >>> # Speak an LLM response while it is still being generated
+        >>> stream_tts_elevenlabs_ws(llm_token_stream(), voice_id="rachel", output_format="pcm_24000")
         >>>
-        >>> # With verbose logging
-        >>> stream_tts_elevenlabs(["Hello world"], voice_id="rachel", verbose=True)
+        >>> # Forward audio frames to a client
+        >>> for audio_chunk in stream_tts_elevenlabs_ws(tokens, voice_id="rachel", return_generator=True):
+        ...     send(audio_chunk)
     """
     # Determine if verbose logging is enabled
     verbose_logging = (
@@ -928,456 +2758,455 @@ def stream_tts_elevenlabs(
 
     if verbose_logging:
         logger.info("=" * 80)
-        logger.info("🎙️  Starting ElevenLabs TTS Request")
+        logger.info("🎙️  Starting ElevenLabs WebSocket TTS Session")
         logger.info(
-            f"   Model: {model_id} | Voice ID: {voice_id} | Format: {output_format} | "
-            f"Stream Mode: {stream_mode} | Stability: {stability} | Similarity: {similarity_boost}"
+            f"   Model: {model_id} | Voice ID: {voice_id} | Format: {output_format}"
         )
-        if isinstance(text_chunks, (list, tuple)):
-            logger.debug(f"   Text chunks: {len(text_chunks)} chunks")
-            for i, chunk in enumerate(text_chunks[:3]):
-                logger.debug(
-                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
-                )
 
-    # Get API key from parameter or environment variable
+    # Get API key from environment variable
     api_key = get_api_key(
         "ELEVENLABS_API_KEY",
         "https://elevenlabs.io/app/settings/api-keys",
     )
 
-    if verbose_logging:
-        logger.debug("✅ API key retrieved successfully")
-
     # Check if voice_id is a friendly name and look it up in ELEVENLABS_VOICES
-    # If it's not found, assume it's already a voice ID
     actual_voice_id = ELEVENLABS_VOICES.get(
         voice_id.lower(), voice_id
     )
 
-    # Determine sample rate from output format
-    sample_rate_map = {
-        "pcm_8000": 8000,
-        "pcm_16000": 16000,
-        "pcm_22050": 22050,
-        "pcm_24000": 24000,
-        "pcm_32000": 32000,
-        "pcm_44100": 44100,
-        "pcm_48000": 48000,
-        "ulaw_8000": 8000,
-        "alaw_8000": 8000,
-        "mp3_22050_32": 22050,
-        "mp3_24000_48": 24000,
-        "mp3_44100_32": 44100,
-        "mp3_44100_64": 44100,
-        "mp3_44100_96": 44100,
-        "mp3_44100_128": 44100,
-        "mp3_44100_192": 44100,
-        "opus_48000_32": 48000,
-        "opus_48000_64": 48000,
-        "opus_48000_96": 48000,
-        "opus_48000_128": 48000,
-        "opus_48000_192": 48000,
+    if output_format.startswith("opus_") and not return_generator:
+        raise ValueError(
+            f"Opus format '{output_format}' not yet supported. Please use PCM format (e.g., 'pcm_44100')."
+        )
+    sample_rate = _ELEVENLABS_SAMPLE_RATES.get(output_format, 44100)
+
+    query_string = "&".join(
+        [
+            f"model_id={model_id}",
+            f"output_format={output_format}",
+            f"enable_logging={str(enable_logging).lower()}",
+        ]
+    )
+    ws_url = f"{base_url.rstrip('/')}/v1/text-to-speech/{actual_voice_id}/stream-input?{query_string}"
+
+    # The first message opens the stream and carries the voice settings
+    initial_message = {
+        "text": " ",
+        "voice_settings": {
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+        },
     }
+    if chunk_length_schedule:
+        initial_message["generation_config"] = {
+            "chunk_length_schedule": chunk_length_schedule
+        }
 
-    # Extract sample rate from format or use default
+    if verbose_logging:
+        logger.debug(f"🌐 WebSocket Endpoint: {ws_url}")
+
+    audio = _iter_elevenlabs_ws_audio(
+        ws_url,
+        {"xi-api-key": api_key},
+        initial_message,
+        text_chunks,
+        verbose_logging,
+        cancel,
+    )
+
+    # Generator mode: yield audio bytes as they arrive, no playback
+    if return_generator:
+        return _stop_iteration_on_cancel(audio)
+
+    sink = _cancellable_sink(sink, cancel)
     if output_format.startswith("pcm_"):
-        sample_rate = sample_rate_map.get(output_format, 44100)
-    elif output_format.startswith(
-        "ulaw_"
-    ) or output_format.startswith("alaw_"):
-        sample_rate = sample_rate_map.get(output_format, 8000)
+        _play_pcm_responses([audio], sample_rate, sink)
     elif output_format.startswith("mp3_"):
-        # For MP3 formats, extract sample rate from map
-        sample_rate = sample_rate_map.get(output_format, 44100)
-    elif output_format.startswith("opus_"):
-        # For Opus formats, we'd need to decode first (not implemented)
-        raise ValueError(
-            f"Opus format '{output_format}' not yet supported. Please use PCM format (e.g., 'pcm_44100')."
+        _play_mp3_responses([audio], sample_rate, sink)
+    elif output_format.startswith(("ulaw_", "alaw_")):
+        _play_g711_responses(
+            [audio], output_format, sample_rate, sink
         )
     else:
-        sample_rate = 44100  # Default fallback
+        process_audio_buffer(
+            bytearray(b"".join(audio)),
+            output_format,
+            sample_rate,
+            sink,
+        )
 
-    # Build URL with query parameters
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{actual_voice_id}/stream"
+    if verbose_logging:
+        logger.info("✅ Audio playback completed successfully")
+        logger.info("=" * 80)
+    return None
 
-    # Build query parameters
-    params = {
-        "output_format": output_format,
-        "enable_logging": str(enable_logging).lower(),
-    }
 
-    if optimize_streaming_latency is not None:
-        params["optimize_streaming_latency"] = str(
-            optimize_streaming_latency
+async def _aiter_tts_response(
+    request: _TTSRequest, payload: dict
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async counterpart of `_iter_tts_response` on the pooled AsyncClient.
+
+    Yields:
+        bytes: Raw audio chunks as they arrive.
+
+    Raises:
+        ValueError: If the provider returns an error status.
+    """
+    cache_key = None
+    received = None
+    if request.cache is not None:
+        cache_key = request.cache_key(payload)
+        audio = request.cache.get(cache_key)
+        if audio is not None:
+            yield audio
+            return
+        received = bytearray()
+
+    async def open_response() -> httpx.Response:
+        client = _get_async_http_client()
+        response = await client.send(
+            client.build_request(
+                "POST",
+                request.url,
+                headers=request.headers,
+                params=request.params,
+                json=payload,
+            ),
+            stream=True,
         )
+        try:
+            if response.status_code >= 400:
+                # The response checks read the error body synchronously
+                await response.aread()
+            request.check_response(response)
+        except BaseException:
+            await response.aclose()
+            raise
+        return response
 
-    # Headers matching the Eleven Labs API specification
-    # Note: Accept header is optional for streaming endpoint, but can help with content negotiation
-    headers = {
-        "xi-api-key": api_key,  # Already stripped above
-        "Content-Type": "application/json",
-    }
+    try:
+        response = await acall_with_retry(
+            request.provider, open_response
+        )
+    except httpx.HTTPStatusError as e:
+        raise _http_status_error_to_value_error(e) from e
 
-    # Optionally add Accept header for better content negotiation
-    # For streaming, the API will return the format specified in output_format query param
-    if output_format.startswith("pcm_"):
-        headers["Accept"] = "audio/pcm"
-    elif output_format.startswith("mp3_"):
-        headers["Accept"] = "audio/mpeg"
-    elif output_format.startswith("opus_"):
-        headers["Accept"] = "audio/opus"
-    # For ulaw/alaw, we can omit Accept or use audio/basic, but it's optional
+    try:
+        async for audio_chunk in response.aiter_bytes():
+            if audio_chunk:
+                if received is not None:
+                    received.extend(audio_chunk)
+                yield audio_chunk
+    finally:
+        await response.aclose()
+
+    if received:
+        request.cache.set(cache_key, bytes(received))
+
+
+async def _aiter_text_payloads(
+    text_chunks: Union[Iterable[str], AsyncIterable[str]],
+    stream_mode: bool,
+    build_payload: Callable[[str], dict],
+) -> AsyncGenerator[dict, None]:
+    """Async counterpart of `_iter_text_payloads` that also accepts async iterables."""
+    if not isinstance(text_chunks, AsyncIterable):
+        for payload in _iter_text_payloads(
+            text_chunks, stream_mode, build_payload
+        ):
+            yield payload
+        return
 
-    # If stream_mode is False, process all chunks at once (backward compatible)
     if not stream_mode:
-        # Convert iterable to list if needed
-        if isinstance(text_chunks, (list, tuple)):
-            chunks_list = list(text_chunks)
-        else:
-            chunks_list = list(text_chunks)
+        yield build_payload(
+            " ".join([chunk async for chunk in text_chunks])
+        )
+        return
+
+    async for chunk in text_chunks:
+        if not chunk or not chunk.strip():
+            continue
+        yield build_payload(chunk.strip())
+
+
+async def _aiter_request_payloads(
+    text_chunks: Union[Iterable[str], AsyncIterable[str]],
+    stream_mode: bool,
+    request: _TTSRequest,
+) -> AsyncGenerator[dict, None]:
+    """Async counterpart of `_iter_request_payloads`."""
+    if not _splices_sentences(request, stream_mode):
+        async for payload in _aiter_text_payloads(
+            text_chunks, stream_mode, request.build_payload
+        ):
+            yield payload
+        return
+
+    if not isinstance(text_chunks, AsyncIterable):
+        for payload in _iter_request_payloads(
+            text_chunks, stream_mode, request
+        ):
+            yield payload
+        return
+
+    async for chunk in text_chunks:
+        for sentence in format_text_for_speech(chunk or ""):
+            yield request.build_payload(sentence)
+
+
+async def _agenerate_tts_audio(
+    payloads: AsyncIterator[dict],
+    request: _TTSRequest,
+    prefetch: int = 0,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Yield audio bytes for every payload in order (async `_generate_tts_audio`).
 
-        # Join all text chunks into a single string
-        text = " ".join(chunks_list)
+    With prefetch > 0 a feeder task keeps up to `prefetch` requests in flight
+    ahead of the chunk being consumed, each drained by its own task into a
+    queue, mirroring `_pipeline_tts_responses`. Pending requests are
+    cancelled when the consumer stops early.
+    """
+    if prefetch <= 0:
+        async for payload in payloads:
+            async for audio_chunk in _aiter_tts_response(
+                request, payload
+            ):
+                yield audio_chunk
+        return
+
+    slots = asyncio.Semaphore(prefetch + 1)
+    ready: asyncio.Queue = asyncio.Queue()
+    tasks: set = set()
+
+    async def drain(payload: dict, chunks: asyncio.Queue) -> None:
+        try:
+            async for audio_chunk in _aiter_tts_response(
+                request, payload
+            ):
+                chunks.put_nowait(audio_chunk)
+        except Exception as e:
+            chunks.put_nowait(_StreamError(e))
+        finally:
+            chunks.put_nowait(_STREAM_END)
+
+    async def feed() -> None:
+        try:
+            async for payload in payloads:
+                await slots.acquire()
+                chunks: asyncio.Queue = asyncio.Queue()
+                task = asyncio.create_task(drain(payload, chunks))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                ready.put_nowait(chunks)
+        except Exception as e:
+            ready.put_nowait(_StreamError(e))
+        finally:
+            ready.put_nowait(_STREAM_END)
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            chunks = await ready.get()
+            if chunks is _STREAM_END:
+                return
+            if isinstance(chunks, _StreamError):
+                raise chunks.error
+            while True:
+                audio_chunk = await chunks.get()
+                if audio_chunk is _STREAM_END:
+                    break
+                if isinstance(audio_chunk, _StreamError):
+                    raise audio_chunk.error
+                yield audio_chunk
+            slots.release()
+    finally:
+        # Drop anything still downloading if the consumer stopped early
+        pending = [feeder, *tasks]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def async_stream_tts_openai(
+    text_chunks: Union[List[str], Iterable[str], AsyncIterable[str]],
+    voice: VoiceType = "alloy",
+    model: str = "tts-1",
+    stream_mode: bool = False,
+    response_format: str = "pcm",
+    verbose: Optional[bool] = None,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async version of `stream_tts_openai` that yields audio bytes without playing them.
 
-        payload = {
-            "text": text,
-            "model_id": model_id,
-            "voice_settings": {
-                "stability": stability,
-                "similarity_boost": similarity_boost,
-            },
-        }
+    Arguments are validated and the API key is read immediately; requests are
+    sent on the pooled HTTP/2 `httpx.AsyncClient` once the returned generator
+    is iterated, so many syntheses can run concurrently on one event loop.
 
-        # Make streaming request to Eleven Labs API
-        try:
-            with _http_client.stream(
-                "POST",
-                url,
-                headers=headers,
-                params=params,
-                json=payload,
-            ) as response:
-                # Check for authentication errors first (before reading response)
-                if response.status_code == 401:
-                    # Try to read error response for more details
-                    error_text = (
-                        "No additional error details available"
-                    )
-                    try:
-                        # Read the error response body
-                        error_bytes = b""
-                        for chunk in response.iter_bytes():
-                            error_bytes += chunk
-                        if error_bytes:
-                            error_text = error_bytes.decode(
-                                "utf-8", errors="ignore"
-                            )
-                    except Exception as e:
-                        error_text = (
-                            f"Could not read error response: {str(e)}"
-                        )
+    Args:
+        text_chunks (Union[List[str], Iterable[str], AsyncIterable[str]]): Text to synthesize.
+            Async iterables (e.g. an LLM token stream) are consumed without blocking the loop.
+        voice (VoiceType): The voice to use for TTS synthesis. Default is "alloy".
+        model (str): The model to use for TTS. Default is "tts-1".
+        stream_mode (bool): If True, send one request per text chunk as chunks arrive.
+            If False, join all chunks into a single request. Default is False.
+        response_format (str): Audio format to request. Default is "pcm".
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight while the current chunk is consumed. Default is 0.
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
 
-                    # Debug information
-                    debug_info = (
-                        f"Request URL: {url}\n"
-                        f"Voice ID used: {actual_voice_id}\n"
-                        f"Output format: {output_format}\n"
-                        f"Model ID: {model_id}\n"
-                        f"Headers sent: {dict((k, v if k != 'xi-api-key' else '***REDACTED***') for k, v in headers.items())}"
-                    )
+    Returns:
+        AsyncGenerator[bytes, None]: Raw audio bytes in `response_format`, in order.
 
-                    raise ValueError(
-                        f"Authentication failed (401). Please check your ELEVENLABS_API_KEY.\n"
-                        f"The API key may be invalid, expired, or not set correctly.\n"
-                        f"Error details: {error_text}\n"
-                        f"Debug info:\n{debug_info}\n"
-                        f"Get your API key from: https://elevenlabs.io/app/settings/api-keys"
-                    )
-                elif response.status_code == 404:
-                    raise ValueError(
-                        f"Voice ID '{actual_voice_id}' not found. Please check if the voice ID is correct.\n"
-                        f"If you used a friendly name like '{voice_id}', verify it exists in ELEVENLABS_VOICES."
-                    )
-                elif response.status_code >= 400:
-                    # For other error status codes, read the error response before raising
-                    error_text = (
-                        "No additional error details available"
-                    )
-                    error_detail = None
-                    try:
-                        # Read the error response body
-                        error_bytes = b""
-                        for chunk in response.iter_bytes():
-                            error_bytes += chunk
-                        if error_bytes:
-                            error_text = error_bytes.decode(
-                                "utf-8", errors="ignore"
-                            )
-                            # Try to parse JSON error for better error messages
-                            try:
-                                import json
-
-                                error_json = json.loads(error_text)
-                                if "detail" in error_json:
-                                    error_detail = error_json[
-                                        "detail"
-                                    ]
-                            except Exception:
-                                pass
-                    except Exception as e:
-                        error_text = (
-                            f"Could not read error response: {str(e)}"
-                        )
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set, the model is invalid, or the API returns an error.
 
-                    # Provide helpful suggestions for common errors
-                    suggestion = ""
-                    if error_detail and isinstance(
-                        error_detail, dict
-                    ):
-                        status = error_detail.get("status", "")
-
-                        if (
-                            "output_format_not_allowed" in status
-                            or "output_format_not_allowed"
-                            in str(error_detail)
-                        ):
-                            suggestion = (
-                                "\n\n💡 Suggestion: The requested output format requires a Pro tier subscription. "
-                                "Try using one of these free tier formats instead:\n"
-                                "  - mp3_44100_128 (MP3, 44.1kHz, 128kbps) - Recommended\n"
-                                "  - mp3_44100_192 (MP3, 44.1kHz, 192kbps)\n"
-                                "  - pcm_16000 (PCM, 16kHz)\n"
-                                "  - pcm_22050 (PCM, 22.05kHz)\n"
-                                "  - pcm_24000 (PCM, 24kHz)\n"
-                                "Example: stream_tts(..., output_format='mp3_44100_128')"
-                            )
+    Example:
+        >>> async for audio_chunk in async_stream_tts_openai(["Hello world"], voice="nova"):
+        ...     await websocket.send_bytes(audio_chunk)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
 
-                    raise ValueError(
-                        f"HTTP error {response.status_code}: {error_text}{suggestion}\n"
-                        f"URL: {response.request.url}"
-                    )
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting async OpenAI TTS Request")
+        logger.info(
+            f"   Model: {model} | Voice: {voice} | Format: {response_format} | Stream Mode: {stream_mode}"
+        )
 
-                response.raise_for_status()
+    request = _prepare_openai_tts(
+        voice, model, response_format, verbose_logging
+    )
+    request.cache = cache
 
-                # Buffer to accumulate audio data
-                buffer = bytearray()
+    return _agenerate_tts_audio(
+        _aiter_request_payloads(text_chunks, stream_mode, request),
+        request,
+        prefetch=_effective_prefetch(request, stream_mode, prefetch),
+    )
 
-                # Stream audio chunks
-                for chunk in response.iter_bytes():
-                    if chunk:
-                        buffer.extend(chunk)
 
-                # Process buffered audio data
-                process_audio_buffer(
-                    buffer, output_format, sample_rate
-                )
-        except httpx.HTTPStatusError as e:
-            # Re-raise ValueError if we already converted it
-            if isinstance(e, ValueError):
-                raise
-            # Otherwise, provide a generic error message
-            raise ValueError(
-                f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                f"URL: {e.request.url}"
-            ) from e
-    else:
-        # Stream mode: process each chunk as it arrives
-        for chunk in text_chunks:
-            if not chunk or not chunk.strip():
-                continue
+def async_stream_tts_elevenlabs(
+    text_chunks: Union[List[str], Iterable[str], AsyncIterable[str]],
+    voice_id: str,
+    model_id: str = "eleven_multilingual_v2",
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    output_format: str = "mp3_44100_128",
+    optimize_streaming_latency: Optional[int] = None,
+    enable_logging: bool = True,
+    stream_mode: bool = False,
+    verbose: Optional[bool] = None,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async version of `stream_tts_elevenlabs` that yields audio bytes without playing them.
 
-            payload = {
-                "text": chunk.strip(),
-                "model_id": model_id,
-                "voice_settings": {
-                    "stability": stability,
-                    "similarity_boost": similarity_boost,
-                },
-            }
+    Args:
+        text_chunks (Union[List[str], Iterable[str], AsyncIterable[str]]): Text to synthesize.
+        voice_id (str): The Eleven Labs voice ID or friendly name (e.g., "rachel").
+        model_id (str): The model ID to use. Default is "eleven_multilingual_v2".
+        stability (float): Stability setting for voice (0.0 to 1.0). Default is 0.5.
+        similarity_boost (float): Similarity boost setting (0.0 to 1.0). Default is 0.75.
+        output_format (str): Output audio format, including opus formats. Default is "mp3_44100_128".
+        optimize_streaming_latency (Optional[int]): Latency optimization (0-4). Default is None.
+        enable_logging (bool): Enable logging for the request. Default is True.
+        stream_mode (bool): If True, send one request per text chunk as chunks arrive. Default is False.
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight while the current chunk is consumed. Default is 0.
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
 
-            # Make streaming request to Eleven Labs API for this chunk
-            try:
-                with _http_client.stream(
-                    "POST",
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=payload,
-                ) as response:
-                    # Check for authentication errors first (before reading response)
-                    if response.status_code == 401:
-                        # Try to read error response for more details
-                        error_text = (
-                            "No additional error details available"
-                        )
-                        try:
-                            # Read the error response body
-                            error_bytes = b""
-                            for audio_chunk in response.iter_bytes():
-                                error_bytes += audio_chunk
-                            if error_bytes:
-                                error_text = error_bytes.decode(
-                                    "utf-8", errors="ignore"
-                                )
-                        except Exception as e:
-                            error_text = f"Could not read error response: {str(e)}"
-
-                        # Debug information
-                        debug_info = (
-                            f"Request URL: {url}\n"
-                            f"Voice ID used: {actual_voice_id}\n"
-                            f"Output format: {output_format}\n"
-                            f"Model ID: {model_id}\n"
-                            f"Headers sent: {dict((k, v if k != 'xi-api-key' else '***REDACTED***') for k, v in headers.items())}"
-                        )
+    Returns:
+        AsyncGenerator[bytes, None]: Raw audio bytes in `output_format`, in order.
 
-                        raise ValueError(
-                            f"Authentication failed (401). Please check your ELEVENLABS_API_KEY.\n"
-                            f"The API key may be invalid, expired, or not set correctly.\n"
-                            f"Error details: {error_text}\n"
-                            f"Debug info:\n{debug_info}\n"
-                            f"Get your API key from: https://elevenlabs.io/app/settings/api-keys"
-                        )
-                    elif response.status_code == 404:
-                        raise ValueError(
-                            f"Voice ID '{actual_voice_id}' not found. Please check if the voice ID is correct.\n"
-                            f"If you used a friendly name like '{voice_id}', verify it exists in ELEVENLABS_VOICES."
-                        )
-                    elif response.status_code >= 400:
-                        # For other error status codes, read the error response before raising
-                        error_text = (
-                            "No additional error details available"
-                        )
-                        error_detail = None
-                        try:
-                            # Read the error response body
-                            error_bytes = b""
-                            for chunk in response.iter_bytes():
-                                error_bytes += chunk
-                            if error_bytes:
-                                error_text = error_bytes.decode(
-                                    "utf-8", errors="ignore"
-                                )
-                                # Try to parse JSON error for better error messages
-                                try:
-                                    import json
-
-                                    error_json = json.loads(
-                                        error_text
-                                    )
-                                    if "detail" in error_json:
-                                        error_detail = error_json[
-                                            "detail"
-                                        ]
-                                except Exception:
-                                    pass
-                        except Exception as e:
-                            error_text = f"Could not read error response: {str(e)}"
-
-                        # Provide helpful suggestions for common errors
-                        suggestion = ""
-                        if error_detail and isinstance(
-                            error_detail, dict
-                        ):
-                            status = error_detail.get("status", "")
-
-                            if (
-                                "output_format_not_allowed" in status
-                                or "output_format_not_allowed"
-                                in str(error_detail)
-                            ):
-                                suggestion = (
-                                    "\n\n💡 Suggestion: The requested output format requires a Pro tier subscription. "
-                                    "Try using one of these free tier formats instead:\n"
-                                    "  - mp3_44100_128 (MP3, 44.1kHz, 128kbps) - Recommended\n"
-                                    "  - mp3_44100_192 (MP3, 44.1kHz, 192kbps)\n"
-                                    "  - pcm_16000 (PCM, 16kHz)\n"
-                                    "  - pcm_22050 (PCM, 22.05kHz)\n"
-                                    "  - pcm_24000 (PCM, 24kHz)\n"
-                                    "Example: stream_tts(..., output_format='mp3_44100_128')"
-                                )
-
-                        raise ValueError(
-                            f"HTTP error {response.status_code}: {error_text}{suggestion}\n"
-                            f"URL: {response.request.url}"
-                        )
+    Raises:
+        ValueError: If ELEVENLABS_API_KEY is not set or the API returns an error.
 
-                    response.raise_for_status()
+    Example:
+        >>> async for audio_chunk in async_stream_tts_elevenlabs(["Hello world"], voice_id="rachel"):
+        ...     await websocket.send_bytes(audio_chunk)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
 
-                    # Buffer to accumulate audio data for this chunk
-                    buffer = bytearray()
+    if verbose_logging:
+        logger.info("=" * 80)
+        logger.info("🎙️  Starting async ElevenLabs TTS Request")
+        logger.info(
+            f"   Model: {model_id} | Voice ID: {voice_id} | Format: {output_format} | Stream Mode: {stream_mode}"
+        )
 
-                    # Stream audio chunks for this text chunk
-                    for audio_chunk in response.iter_bytes():
-                        if audio_chunk:
-                            buffer.extend(audio_chunk)
+    request = _prepare_elevenlabs_tts(
+        voice_id,
+        model_id,
+        stability,
+        similarity_boost,
+        output_format,
+        optimize_streaming_latency,
+        enable_logging,
+        playback=False,
+        verbose_logging=verbose_logging,
+    )
+    request.cache = cache
 
-                    # Process and play audio for this chunk immediately
-                    process_audio_buffer(
-                        buffer, output_format, sample_rate
-                    )
-            except httpx.HTTPStatusError as e:
-                # Re-raise ValueError if we already converted it
-                if isinstance(e, ValueError):
-                    raise
-                # Otherwise, provide a generic error message
-                raise ValueError(
-                    f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                    f"URL: {e.request.url}"
-                ) from e
+    return _agenerate_tts_audio(
+        _aiter_request_payloads(text_chunks, stream_mode, request),
+        request,
+        prefetch=_effective_prefetch(request, stream_mode, prefetch),
+    )
 
 
-def stream_tts_groq(
-    text_chunks: Union[List[str], Iterable[str]],
+def async_stream_tts_groq(
+    text_chunks: Union[List[str], Iterable[str], AsyncIterable[str]],
     voice: str,
     model: str = "canopylabs/orpheus-v1-english",
     stream_mode: bool = False,
     response_format: str = "wav",
     verbose: Optional[bool] = None,
-) -> None:
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+) -> AsyncGenerator[bytes, None]:
     """
-    Stream text-to-speech using Groq's fast TTS API, processing chunks and playing the resulting audio stream.
+    Async version of `stream_tts_groq` that yields audio bytes without playing them.
 
     Args:
-        text_chunks (Union[List[str], Iterable[str]]): A list or iterable of text strings (already formatted/split)
-            to convert to speech. If stream_mode is True, chunks are processed as they arrive.
-        voice (str): The voice to use for TTS synthesis.
-            For English model (canopylabs/orpheus-v1-english): "austin", "hannah", "troy"
-            For Arabic model (canopylabs/orpheus-arabic-saudi): "salma", "omar"
-        model (str): The model to use for TTS.
-            Options: "canopylabs/orpheus-v1-english", "canopylabs/orpheus-arabic-saudi"
-            Default is "canopylabs/orpheus-v1-english".
-        stream_mode (bool): If True, process chunks as they arrive in real-time. If False, join all chunks
-            and process as a single request. Default is False.
-        response_format (str): Audio format to request from Groq. Options: "wav", "mp3", "opus", "aac", "flac".
-            Default is "wav". Note: Only "wav" format is supported for direct playback.
+        text_chunks (Union[List[str], Iterable[str], AsyncIterable[str]]): Text to synthesize.
+        voice (str): The voice to use ("austin", "hannah", "troy", "salma", "omar").
+        model (str): The model to use. Default is "canopylabs/orpheus-v1-english".
+        stream_mode (bool): If True, send one request per text chunk as chunks arrive.
+            Each chunk then produces its own complete audio file. Default is False.
+        response_format (str): Audio format to request. Default is "wav".
         verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight while the current chunk is consumed. Default is 0.
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
 
     Returns:
-        None: Plays audio to system output.
+        AsyncGenerator[bytes, None]: Raw audio bytes in `response_format`, in order.
 
-    Details:
-        - This function uses the Groq TTS API's streaming capabilities via httpx.
-        - When stream_mode is False, all `text_chunks` are joined into a single string for synthesis.
-        - When stream_mode is True, each chunk is processed individually as it arrives.
-        - Audio is streamed, buffered, and played using the `play_audio` helper.
-        - Supports vocal directions in text (e.g., "[cheerful] Hello world").
-        - Useful for real-time output, agent system narration, or API streaming.
+    Raises:
+        ValueError: If GROQ_API_KEY is not set, the model/voice is invalid, or the API returns an error.
 
     Example:
-        >>> # Play audio locally
-        >>> stream_tts_groq(["Hello world"], voice="austin")
-        >>>
-        >>> # With vocal directions
-        >>> stream_tts_groq(
-        ...     ["Welcome to Orpheus. [cheerful] This is an example."],
-        ...     voice="hannah",
-        ...     model="canopylabs/orpheus-v1-english"
-        ... )
-        >>>
-        >>> # With verbose logging
-        >>> stream_tts_groq(["Hello world"], voice="austin", verbose=True)
+        >>> async for audio_chunk in async_stream_tts_groq(["Hello world"], voice="austin"):
+        ...     await websocket.send_bytes(audio_chunk)
     """
     # Determine if verbose logging is enabled
     verbose_logging = (
@@ -1386,312 +3215,130 @@ def stream_tts_groq(
 
     if verbose_logging:
         logger.info("=" * 80)
-        logger.info("🎙️  Starting Groq TTS Request")
+        logger.info("🎙️  Starting async Groq TTS Request")
         logger.info(
             f"   Model: {model} | Voice: {voice} | Format: {response_format} | Stream Mode: {stream_mode}"
         )
-        if isinstance(text_chunks, (list, tuple)):
-            logger.debug(f"   Text chunks: {len(text_chunks)} chunks")
-            for i, chunk in enumerate(text_chunks[:3]):
-                logger.debug(
-                    f"   Chunk {i+1}: {str(chunk)[:100]}{'...' if len(str(chunk)) > 100 else ''}"
-                )
 
-    # Get API key from environment variable
-    api_key = get_api_key(
-        "GROQ_API_KEY",
-        "https://console.groq.com/keys",
+    request = _prepare_groq_tts(
+        voice, model, response_format, verbose_logging
     )
+    request.cache = cache
 
-    if verbose_logging:
-        logger.debug("✅ API key retrieved successfully")
-
-    # Validate model
-    if model not in GROQ_TTS_MODELS:
-        raise ValueError(
-            f"Invalid model '{model}'. Supported models: {', '.join(GROQ_TTS_MODELS)}"
-        )
-
-    # Validate voice based on model
-    if model == "canopylabs/orpheus-v1-english":
-        if voice not in GROQ_ORPHEUS_ENGLISH_VOICES:
-            raise ValueError(
-                f"Invalid voice '{voice}' for English model. "
-                f"Supported voices: {', '.join(GROQ_ORPHEUS_ENGLISH_VOICES)}"
-            )
-    elif model == "canopylabs/orpheus-arabic-saudi":
-        if voice not in GROQ_ORPHEUS_ARABIC_VOICES:
-            raise ValueError(
-                f"Invalid voice '{voice}' for Arabic model. "
-                f"Supported voices: {', '.join(GROQ_ORPHEUS_ARABIC_VOICES)}"
-            )
+    return _agenerate_tts_audio(
+        _aiter_request_payloads(text_chunks, stream_mode, request),
+        request,
+        prefetch=_effective_prefetch(request, stream_mode, prefetch),
+    )
 
-    # Groq TTS API endpoint
-    url = "https://api.groq.com/openai/v1/audio/speech"
 
-    # Headers
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+def async_stream_tts(
+    text_chunks: Union[List[str], Iterable[str], AsyncIterable[str]],
+    model: str = "openai/tts-1",
+    voice: Optional[str] = None,
+    stream_mode: bool = False,
+    # OpenAI-specific parameters
+    response_format: Optional[str] = None,
+    # ElevenLabs-specific parameters
+    voice_id: Optional[str] = None,
+    stability: float = 0.5,
+    similarity_boost: float = 0.75,
+    output_format: Optional[str] = None,
+    optimize_streaming_latency: Optional[int] = None,
+    enable_logging: bool = True,
+    verbose: Optional[bool] = None,
+    prefetch: int = 0,
+    cache: Optional[CacheBackend] = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Async version of `stream_tts` for asyncio servers (FastAPI, websockets, ...).
 
-    # If stream_mode is False, process all chunks at once (backward compatible)
-    if not stream_mode:
-        # Convert iterable to list if needed
-        if isinstance(text_chunks, (list, tuple)):
-            chunks_list = list(text_chunks)
-        else:
-            chunks_list = list(text_chunks)
+    Routes to the provider exactly like `stream_tts` and returns an async
+    generator of raw audio bytes. Requests go through a pooled HTTP/2
+    `httpx.AsyncClient` (one per event loop), so many concurrent sessions
+    share connections without a thread per call. Use `async_play_pcm_stream`
+    to play PCM output locally.
 
-        # Join all text chunks into a single string
-        text = " ".join(chunks_list)
+    Args:
+        text_chunks (Union[List[str], Iterable[str], AsyncIterable[str]]): Text to synthesize.
+            May be an async iterable such as a streaming LLM response.
+        model (str): The model name in format "provider/model_name". See `stream_tts`.
+        voice (Optional[str]): Voice identifier. See `stream_tts`.
+        stream_mode (bool): If True, send one request per text chunk as chunks arrive. Default is False.
+        response_format (Optional[str]): OpenAI/Groq audio format. See `stream_tts`.
+        voice_id (Optional[str]): ElevenLabs-specific voice ID.
+        stability (float): ElevenLabs-specific stability setting. Default is 0.5.
+        similarity_boost (float): ElevenLabs-specific similarity boost. Default is 0.75.
+        output_format (Optional[str]): ElevenLabs-specific output format.
+        optimize_streaming_latency (Optional[int]): ElevenLabs-specific latency optimization (0-4).
+        enable_logging (bool): ElevenLabs-specific logging setting. Default is True.
+        verbose (Optional[bool]): Enable verbose logging. If None, uses VOICE_AGENTS_VERBOSE_LOGGING env var.
+        prefetch (int): Only used when stream_mode is True. Number of upcoming text chunks whose
+            requests are kept in flight while the current chunk is consumed. Default is 0.
+        cache (Optional[CacheBackend]): Audio cache (e.g. `TTSCache()`). Identical requests are
+            served from the cache without a network round trip; misses are stored once fully
+            received. Default is None (no caching).
 
-        # Payload
-        payload = {
-            "model": model,
-            "voice": voice,
-            "input": text,
-            "response_format": response_format,
-        }
+    Returns:
+        AsyncGenerator[bytes, None]: Raw audio bytes from the provider, in order.
 
-        # Buffer to accumulate audio data
-        buffer = bytearray()
+    Raises:
+        ValueError: If the provider is unknown, a required voice is missing, or the API returns an error.
 
-        # Make streaming request to Groq TTS API
-        try:
-            with _http_client.stream(
-                "POST",
-                url,
-                headers=headers,
-                json=payload,
-            ) as response:
-                # Check for authentication errors
-                if response.status_code == 401:
-                    error_text = (
-                        "No additional error details available"
-                    )
-                    try:
-                        error_bytes = b""
-                        for chunk in response.iter_bytes():
-                            error_bytes += chunk
-                        if error_bytes:
-                            error_text = error_bytes.decode(
-                                "utf-8", errors="ignore"
-                            )
-                    except Exception as e:
-                        error_text = (
-                            f"Could not read error response: {str(e)}"
-                        )
+    Example:
+        >>> async for audio_chunk in async_stream_tts(
+        ...     ["Hello world"], model="openai/tts-1", voice="alloy"
+        ... ):
+        ...     await websocket.send_bytes(audio_chunk)
+    """
+    # Determine if verbose logging is enabled
+    verbose_logging = (
+        verbose if verbose is not None else _verbose_logging_enabled
+    )
 
-                    raise ValueError(
-                        f"Authentication failed (401). Please check your GROQ_API_KEY.\n"
-                        f"The API key may be invalid, expired, or not set correctly.\n"
-                        f"Error details: {error_text}\n"
-                        f"Get your API key from: https://console.groq.com/keys"
-                    )
+    provider, provider_kwargs = _resolve_tts_route(
+        model,
+        voice=voice,
+        response_format=response_format,
+        voice_id=voice_id,
+        stability=stability,
+        similarity_boost=similarity_boost,
+        output_format=output_format,
+        optimize_streaming_latency=optimize_streaming_latency,
+        enable_logging=enable_logging,
+        verbose_logging=verbose_logging,
+    )
 
-                response.raise_for_status()
+    # Route to appropriate provider
+    provider_function = {
+        "openai": async_stream_tts_openai,
+        "elevenlabs": async_stream_tts_elevenlabs,
+        "groq": async_stream_tts_groq,
+    }[provider]
+
+    return provider_function(
+        text_chunks=text_chunks,
+        stream_mode=stream_mode,
+        verbose=verbose_logging,
+        prefetch=prefetch,
+        cache=cache,
+        **provider_kwargs,
+    )
 
-                # Stream audio chunks
-                for audio_chunk in response.iter_bytes():
-                    if audio_chunk:
-                        buffer.extend(audio_chunk)
 
-                # Process and play audio (for WAV format)
-                if response_format == "wav" and len(buffer) > 0:
-                    try:
-                        import io
-                        import wave
-
-                        # Read WAV file from buffer
-                        wav_io = io.BytesIO(bytes(buffer))
-                        with wave.open(wav_io, "rb") as wav_file:
-                            # Get audio parameters
-                            frames = wav_file.getnframes()
-                            sample_rate = wav_file.getframerate()
-                            channels = wav_file.getnchannels()
-                            sample_width = wav_file.getsampwidth()
-
-                            # Read audio data
-                            audio_bytes = wav_file.readframes(frames)
-
-                            # Convert to numpy array
-                            if sample_width == 2:  # 16-bit
-                                audio = np.frombuffer(
-                                    audio_bytes, dtype=np.int16
-                                )
-                            elif sample_width == 4:  # 32-bit
-                                audio = np.frombuffer(
-                                    audio_bytes, dtype=np.int32
-                                )
-                            else:
-                                raise ValueError(
-                                    f"Unsupported sample width: {sample_width}"
-                                )
-
-                            # Handle stereo audio (convert to mono)
-                            if channels > 1:
-                                audio = audio.reshape(-1, channels)
-                                audio = audio[
-                                    :, 0
-                                ]  # Take first channel
-
-                            # Play audio
-                            if len(audio) > 0:
-                                audio_float = (
-                                    audio.astype(np.float32) / 32768.0
-                                )
-                                sd.play(audio_float, sample_rate)
-                                sd.wait()
-                    except ImportError:
-                        # Fallback: try to play raw WAV data
-                        # This is a simple approach that may not work for all WAV files
-                        print(
-                            "Warning: wave module not available. "
-                            "Install it for proper WAV playback."
-                        )
-                elif response_format != "wav":
-                    # For non-WAV formats, we can't play directly
-                    print(
-                        f"Warning: {response_format} format not supported for direct playback. Only 'wav' format is supported."
-                    )
-                    pass
-        except httpx.HTTPStatusError as e:
-            # Re-raise ValueError if we already converted it
-            if isinstance(e, ValueError):
-                raise
-            # Otherwise, provide a generic error message
-            raise ValueError(
-                f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                f"URL: {e.request.url}"
-            ) from e
-    else:
-        # Stream mode: process each chunk as it arrives
-        for chunk in text_chunks:
-            if not chunk or not chunk.strip():
-                continue
+class _SpeechMark:
+    """
+    Queue marker that ends the callback worker's current TTS stream.
 
-            # Payload for this chunk
-            payload = {
-                "model": model,
-                "voice": voice,
-                "input": chunk.strip(),
-                "response_format": response_format,
-            }
+    `done` is set once everything queued before it has been played.
+    """
 
-            # Buffer to accumulate audio data for this chunk
-            buffer = bytearray()
+    def __init__(self):
+        self.done = threading.Event()
 
-            # Make streaming request to Groq TTS API for this chunk
-            try:
-                with _http_client.stream(
-                    "POST",
-                    url,
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    # Check for authentication errors
-                    if response.status_code == 401:
-                        error_text = (
-                            "No additional error details available"
-                        )
-                        try:
-                            error_bytes = b""
-                            for audio_chunk in response.iter_bytes():
-                                error_bytes += audio_chunk
-                            if error_bytes:
-                                error_text = error_bytes.decode(
-                                    "utf-8", errors="ignore"
-                                )
-                        except Exception as e:
-                            error_text = f"Could not read error response: {str(e)}"
-
-                        raise ValueError(
-                            f"Authentication failed (401). Please check your GROQ_API_KEY.\n"
-                            f"The API key may be invalid, expired, or not set correctly.\n"
-                            f"Error details: {error_text}\n"
-                            f"Get your API key from: https://console.groq.com/keys"
-                        )
 
-                    response.raise_for_status()
-
-                    # Stream audio chunks for this text chunk
-                    for audio_chunk in response.iter_bytes():
-                        if audio_chunk:
-                            buffer.extend(audio_chunk)
-
-                    # Process and play audio for this chunk immediately (for WAV format)
-                    if response_format == "wav" and len(buffer) > 0:
-                        try:
-                            import io
-                            import wave
-
-                            # Read WAV file from buffer
-                            wav_io = io.BytesIO(bytes(buffer))
-                            with wave.open(wav_io, "rb") as wav_file:
-                                # Get audio parameters
-                                frames = wav_file.getnframes()
-                                sample_rate = wav_file.getframerate()
-                                channels = wav_file.getnchannels()
-                                sample_width = wav_file.getsampwidth()
-
-                                # Read audio data
-                                audio_bytes = wav_file.readframes(
-                                    frames
-                                )
-
-                                # Convert to numpy array
-                                if sample_width == 2:  # 16-bit
-                                    audio = np.frombuffer(
-                                        audio_bytes, dtype=np.int16
-                                    )
-                                elif sample_width == 4:  # 32-bit
-                                    audio = np.frombuffer(
-                                        audio_bytes, dtype=np.int32
-                                    )
-                                else:
-                                    raise ValueError(
-                                        f"Unsupported sample width: {sample_width}"
-                                    )
-
-                                # Handle stereo audio (convert to mono)
-                                if channels > 1:
-                                    audio = audio.reshape(
-                                        -1, channels
-                                    )
-                                    audio = audio[
-                                        :, 0
-                                    ]  # Take first channel
-
-                                # Play audio
-                                if len(audio) > 0:
-                                    audio_float = (
-                                        audio.astype(np.float32)
-                                        / 32768.0
-                                    )
-                                    sd.play(audio_float, sample_rate)
-                                    sd.wait()
-                        except ImportError:
-                            # Fallback: try to play raw WAV data
-                            print(
-                                "Warning: wave module not available. "
-                                "Install it for proper WAV playback."
-                            )
-                    elif response_format != "wav":
-                        # For non-WAV formats, we can't play directly
-                        print(
-                            f"Warning: {response_format} format not supported for direct playback. Only 'wav' format is supported."
-                        )
-                        pass
-            except httpx.HTTPStatusError as e:
-                # Re-raise ValueError if we already converted it
-                if isinstance(e, ValueError):
-                    raise
-                # Otherwise, provide a generic error message
-                raise ValueError(
-                    f"HTTP error {e.response.status_code}: {_safe_get_response_text(e.response)}\n"
-                    f"URL: {e.request.url}"
-                ) from e
+# Wakes a worker-side text iterator left waiting on the queue after an error
+_WAKE = object()
 
 
 class StreamingTTSCallback:
@@ -1699,15 +3346,47 @@ class StreamingTTSCallback:
     A callback class that buffers streaming text and converts it to speech in real-time.
 
     This class accumulates text chunks from the agent's streaming output, detects
-    complete sentences, and sends them to TTS as they become available.
+    complete sentences, and sends them to TTS as they become available. Sentences
+    are detected incrementally with `StreamingSegmenter`: each chunk is scanned
+    once, and the boundaries match `format_text_for_speech` on the full text
+    (abbreviations such as "Dr." do not end a sentence). A `ChunkPlanner` then
+    groups them into requests: the first is cut at a clause boundary near
+    `first_chunk_chars` so audio starts quickly, and later sentences are merged
+    into requests of up to `max_chunk_chars` to save round trips.
+
+    By default requests are handed to a background worker thread, so calling
+    the callback never waits for synthesis or playback and the agent keeps
+    streaming tokens. The worker feeds one live `stream_tts` call, keeping
+    `prefetch` requests synthesizing ahead of the one playing, and plays them
+    in order. At most `max_queue` requests wait in the queue; beyond that the
+    callback blocks until the worker catches up.
 
     Args:
         voice: The voice to use for TTS. Default is "alloy".
         model: The TTS model to use in format "provider/model_name". Default is "openai/tts-1".
             Examples: "openai/tts-1", "openai/tts-1-hd", "elevenlabs/eleven_multilingual_v2"
-        min_sentence_length: Minimum length before sending a sentence to TTS. Default is 10.
-        stream_mode: Whether to use streaming mode for TTS. Default is False.
+        min_sentence_length: Minimum length before sending text to TTS. Shorter
+            sentences are held and sent together with the next one. Default is 10.
+        stream_mode: Whether to use streaming mode for TTS when `background` is False. If True,
+            each formatted sentence of a chunk is its own request. Default is False.
         formatting: Whether to format text for speech. If False, raw text is passed to TTS. Default is True.
+        cache: Optional audio cache (e.g. `TTSCache()`) so repeated sentences skip the network. Default is None.
+        sink: Where to play the speech (e.g. `NumpySink()`). Default is None (the default sink).
+        language: Abbreviation list used to detect sentences ("en", "de", "fr", "es"). Default is "en".
+        background: Synthesize and play on a worker thread. If False, each sentence is spoken
+            before the callback returns. Default is True.
+        prefetch: Requests synthesized ahead of the one playing (background mode). Default is 2.
+        max_queue: Requests that may wait for the worker before the callback blocks. Default is 8.
+        first_chunk_chars: Target length of the first request. None sends the first
+            sentence whole. Default is 60.
+        max_chunk_chars: Largest request that later sentences are merged into. None sends
+            every sentence on its own. Default is 250.
+
+    Example:
+        >>> tts_callback = StreamingTTSCallback(voice="alloy", model="openai/tts-1")
+        >>> for token in agent.stream(task):
+        ...     tts_callback(token)  # returns immediately
+        >>> tts_callback.flush()  # speak the rest and wait until it has played
     """
 
     def __init__(
@@ -1717,15 +3396,37 @@ class StreamingTTSCallback:
         min_sentence_length: int = 10,
         stream_mode: bool = False,
         formatting: bool = True,
+        cache: Optional[CacheBackend] = None,
+        sink: Optional[AudioSink] = None,
+        language: str = "en",
+        background: bool = True,
+        prefetch: int = 2,
+        max_queue: int = 8,
+        first_chunk_chars: Optional[int] = 60,
+        max_chunk_chars: Optional[int] = 250,
     ):
         self.voice = voice
         self.model = model
         self.min_sentence_length = min_sentence_length
         self.stream_mode = stream_mode
         self.formatting = formatting
-        self.buffer = ""
-        # Pattern to match sentence endings: . ! ? followed by whitespace or end of string
-        self.sentence_endings = re.compile(r"[.!?](?:\s+|$)")
+        self.cache = cache
+        self.sink = sink
+        self.background = background
+        self.prefetch = prefetch
+        self.segmenter = StreamingSegmenter(get_segmenter(language))
+        self.planner = ChunkPlanner(
+            first_chunk_chars=first_chunk_chars,
+            max_chunk_chars=max_chunk_chars,
+            min_chunk_chars=min_sentence_length,
+        )
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        # Bumped by cancel(); queued text from an older generation is dropped
+        self._generation = 0
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        # Token of the stream_tts call currently playing, for cancel()
+        self._token: Optional[CancelToken] = None
 
     def _format_text(self, text: str) -> Union[str, List[str]]:
         """
@@ -1742,6 +3443,115 @@ class StreamingTTSCallback:
             return formatted if formatted else [text]
         return text
 
+    def _speak(self, text: str) -> None:
+        """Send one planned chunk to TTS, or queue it for the worker."""
+        formatted = self._format_text(text)
+        if not formatted:
+            return
+        # Ensure formatted is a list/iterable, not a string
+        # (strings are iterable and would be treated as character-by-character)
+        if isinstance(formatted, str):
+            formatted = [formatted]
+        if not self.background:
+            self._play(formatted, stream_mode=self.stream_mode)
+            return
+
+        # The worker makes one request per queued chunk
+        self._ensure_worker()
+        self._queue.put((self._generation, " ".join(formatted)))
+
+    def _play(
+        self,
+        texts: Iterable[str],
+        stream_mode: bool,
+        prefetch: int = 0,
+    ) -> None:
+        """Run one `stream_tts` call that `cancel()` can abort."""
+        token = CancelToken()
+        with self._worker_lock:
+            self._token = token
+        try:
+            stream_tts(
+                texts,
+                voice=self.voice,
+                model=self.model,
+                stream_mode=stream_mode,
+                prefetch=prefetch,
+                cache=self.cache,
+                sink=self.sink,
+                cancel=token,
+            )
+        finally:
+            with self._worker_lock:
+                if self._token is token:
+                    self._token = None
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker,
+                    name="StreamingTTSCallback",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _iter_queued(
+        self, first: object, state: dict
+    ) -> Generator[str, None, None]:
+        """Queued texts up to the next mark, for one `stream_tts` call."""
+        item = first
+        while True:
+            if item is _WAKE:
+                return
+            if isinstance(item, _SpeechMark):
+                with state["lock"]:
+                    state["mark"] = item
+                    if state["over"]:
+                        item.done.set()
+                return
+            generation, text = item
+            if generation == self._generation:
+                yield text
+            item = self._queue.get()
+
+    def _run_worker(self) -> None:
+        """Play queued sentences, one `stream_tts` call per response."""
+        while True:
+            item = self._queue.get()
+            if item is _WAKE:
+                continue
+            if isinstance(item, _SpeechMark):
+                item.done.set()
+                continue
+
+            state = {
+                "lock": threading.Lock(),
+                "mark": None,
+                "over": False,
+            }
+            failed = False
+            try:
+                self._play(
+                    self._iter_queued(item, state),
+                    stream_mode=True,
+                    prefetch=self.prefetch,
+                )
+            except Exception as e:
+                failed = True
+                logger.error(f"❌ Error in TTS streaming: {e}")
+            with state["lock"]:
+                state["over"] = True
+                if state["mark"] is not None:
+                    state["mark"].done.set()
+                elif failed:
+                    # A prefetch thread may still be waiting on the queue
+                    # (it is not if the queue is full)
+                    try:
+                        self._queue.put_nowait(_WAKE)
+                    except queue.Full:
+                        pass
+
     def __call__(self, chunk: str) -> None:
         """
         Process a streaming text chunk.
@@ -1752,87 +3562,86 @@ class StreamingTTSCallback:
         if not chunk:
             return
 
-        # Add chunk to buffer
-        self.buffer += chunk
-
-        # Check for complete sentences
-        sentences = self._extract_complete_sentences()
+        # Only the new text is scanned; completed sentences come back
+        for sentence in self.segmenter.push(chunk):
+            for text in self.planner.push(sentence):
+                try:
+                    self._speak(text)
+                except Exception as e:
+                    logger.error(f"❌ Error in TTS streaming: {e}")
 
-        # Send complete sentences to TTS
-        if sentences:
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if (
-                    sentence
-                    and len(sentence) >= self.min_sentence_length
-                ):
-                    try:
-                        formatted = self._format_text(sentence)
-                        if formatted:
-                            # Ensure formatted is a list/iterable, not a string
-                            # (strings are iterable and would be treated as character-by-character)
-                            if isinstance(formatted, str):
-                                formatted = [formatted]
-                            stream_tts(
-                                formatted,
-                                voice=self.voice,
-                                model=self.model,
-                                stream_mode=self.stream_mode,
-                            )
-                    except Exception as e:
-                        print(f"Error in TTS streaming: {e}")
-
-    def _extract_complete_sentences(self) -> List[str]:
+    def join(self, timeout: Optional[float] = None) -> bool:
         """
-        Extract complete sentences from the buffer.
+        Wait until every queued sentence has been played.
+
+        Text still buffered in an unfinished sentence is not spoken; use `flush()`
+        at the end of a response.
+
+        Args:
+            timeout: Seconds to wait. Default is None (no limit).
 
         Returns:
-            List of complete sentences, removing them from the buffer.
+            bool: True if playback finished, False on timeout.
         """
-        sentences = []
+        if self._worker is None:
+            return True
+        mark = _SpeechMark()
+        self._queue.put(mark)
+        return mark.done.wait(timeout)
 
-        # Find all sentence endings
-        matches = list(self.sentence_endings.finditer(self.buffer))
-
-        if matches:
-            # Extract sentences up to the last complete sentence
-            last_end = matches[-1].end()
-            text_to_process = self.buffer[:last_end]
-            self.buffer = self.buffer[last_end:]
+    def flush(self, wait: bool = True) -> None:
+        """
+        Flush any remaining text in the buffer to TTS.
 
-            # Split into sentences using the same pattern
-            sentence_list = self.sentence_endings.split(
-                text_to_process
-            )
-            for sentence in sentence_list:
-                sentence = sentence.strip()
-                if (
-                    sentence
-                    and len(sentence) >= self.min_sentence_length
-                ):
-                    sentences.append(sentence)
+        Call this at the end of each response.
 
-        return sentences
+        Args:
+            wait: Block until everything has been played (see `join()`). Default is True.
+        """
+        texts = []
+        for sentence in self.segmenter.flush():
+            texts.extend(self.planner.push(sentence))
+        texts.extend(self.planner.flush())
+        for text in texts:
+            try:
+                self._speak(text)
+            except Exception as e:
+                logger.error(f"❌ Error flushing TTS buffer: {e}")
+        if self._worker is None:
+            return
+        if wait:
+            self.join()
+        else:
+            self._queue.put(_SpeechMark())
 
-    def flush(self) -> None:
+    def cancel(self) -> float:
         """
-        Flush any remaining text in the buffer to TTS.
+        Stop speaking at once (barge-in) and drop everything not yet played.
+
+        Buffered text and queued sentences are dropped, and the `stream_tts` call
+        in progress is aborted through its `CancelToken`: open responses are
+        closed and the sink's unplayed audio is discarded. The callback can be
+        used again for the next response.
+
+        Returns:
+            float: Seconds of the interrupted response that were actually played.
         """
-        if self.buffer.strip():
+        self._generation += 1
+        with self._worker_lock:
+            token = self._token
+        played = 0.0
+        if token is not None:
+            token.cancel()
+            played = token.played_seconds
+        self.segmenter.flush()
+        self.planner.reset()
+        while True:
             try:
-                formatted = self._format_text(self.buffer.strip())
-                if formatted:
-                    # Ensure formatted is a list/iterable, not a string
-                    # (strings are iterable and would be treated as character-by-character)
-                    if isinstance(formatted, str):
-                        formatted = [formatted]
-                    stream_tts(
-                        formatted,
-                        voice=self.voice,
-                        model=self.model,
-                        stream_mode=self.stream_mode,
-                    )
-            except Exception as e:
-                print(f"Error flushing TTS buffer: {e}")
-            finally:
-                self.buffer = ""
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _SpeechMark):
+                item.done.set()
+        if self._worker is not None:
+            self._queue.put(_SpeechMark())
+        return played
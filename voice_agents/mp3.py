@@ -0,0 +1,144 @@
+import importlib.util
+from typing import Generator, Iterable, List, Optional
+
+import numpy as np
+
+
+def streaming_mp3_available() -> bool:
+    """
+    Whether incremental, in-process MP3 decoding is available.
+
+    Requires PyAV (`pip install av`). Without it MP3 audio is decoded with
+    pydub/ffmpeg once fully downloaded.
+    """
+    return importlib.util.find_spec("av") is not None
+
+
+class MP3StreamDecoder:
+    """
+    Decode an MP3 byte stream to mono int16 PCM as the bytes arrive.
+
+    Uses libavcodec in-process through PyAV: no ffmpeg subprocess is spawned
+    and every complete MP3 frame is decoded as soon as it has been received,
+    so playback can start with the first few KB of the response. Chunks may
+    split frames anywhere; partial frames are buffered by the parser.
+
+    Args:
+        sample_rate (Optional[int]): Output sample rate. None keeps the stream's own rate.
+
+    Raises:
+        ValueError: If PyAV is not installed.
+
+    Example:
+        >>> decoder = MP3StreamDecoder(sample_rate=44100)
+        >>> for chunk in response.iter_bytes():
+        ...     samples = decoder.push(chunk)
+        >>> tail = decoder.flush()
+    """
+
+    def __init__(self, sample_rate: Optional[int] = None):
+        try:
+            import av
+        except ImportError:
+            raise ValueError(
+                "Streaming MP3 decoding requires PyAV. Install it with: pip install av"
+            )
+        self._av = av
+        self._codec = av.CodecContext.create("mp3", "r")
+        self._resampler = av.AudioResampler(
+            format="s16", layout="mono", rate=sample_rate
+        )
+
+    def _decode(self, packets: Iterable) -> List[np.ndarray]:
+        blocks = []
+        for packet in packets:
+            try:
+                frames = self._codec.decode(packet)
+            except self._av.error.InvalidDataError:
+                # ID3 tags and Xing/LAME info headers are not audio frames
+                continue
+            for frame in frames:
+                for converted in self._resampler.resample(frame):
+                    blocks.append(converted.to_ndarray()[0])
+        return blocks
+
+    @staticmethod
+    def _join(blocks: List[np.ndarray]) -> Optional[np.ndarray]:
+        if not blocks:
+            return None
+        return (
+            np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+        )
+
+    def push(self, chunk: bytes) -> Optional[np.ndarray]:
+        """Return the int16 samples decoded after adding chunk, if any."""
+        if not chunk:
+            return None
+        return self._join(self._decode(self._codec.parse(chunk)))
+
+    def flush(self) -> Optional[np.ndarray]:
+        """Decode whatever is still buffered at the end of the stream."""
+        blocks = self._decode(self._codec.parse(None))
+        blocks += self._decode([None])
+        blocks += [
+            converted.to_ndarray()[0]
+            for converted in self._resampler.resample(None)
+        ]
+        return self._join(blocks)
+
+
+def _decode_mp3_with_pydub(
+    data: bytes, sample_rate: Optional[int]
+) -> np.ndarray:
+    """Decode a complete MP3 file to mono int16 samples with pydub/ffmpeg."""
+    import io
+
+    try:
+        from pydub import AudioSegment
+    except ImportError:
+        raise ValueError(
+            "MP3 decoding requires PyAV (pip install av) or pydub "
+            "(pip install pydub, plus ffmpeg on your system)."
+        )
+
+    audio_segment = AudioSegment.from_mp3(io.BytesIO(data))
+    audio_segment = audio_segment.set_channels(1).set_sample_width(2)
+    if sample_rate is not None:
+        audio_segment = audio_segment.set_frame_rate(sample_rate)
+    return np.frombuffer(audio_segment.raw_data, dtype=np.int16)
+
+
+def iter_mp3_samples(
+    chunks: Iterable[bytes], sample_rate: Optional[int] = None
+) -> Generator[np.ndarray, None, None]:
+    """
+    Turn a stream of MP3 bytes into mono int16 sample arrays.
+
+    With PyAV installed, samples are yielded frame by frame while the MP3 is
+    still downloading (see `MP3StreamDecoder`). Otherwise the whole stream is
+    collected and decoded once with pydub/ffmpeg.
+
+    Args:
+        chunks: Iterable of MP3 bytes (e.g. `response.iter_bytes()`).
+        sample_rate: Output sample rate. None keeps the stream's own rate.
+
+    Yields:
+        np.ndarray: Decoded int16 samples.
+
+    Raises:
+        ValueError: If neither PyAV nor pydub is installed.
+    """
+    if not streaming_mp3_available():
+        data = b"".join(chunks)
+        if data:
+            yield _decode_mp3_with_pydub(data, sample_rate)
+        return
+
+    decoder = MP3StreamDecoder(sample_rate)
+    for chunk in chunks:
+        samples = decoder.push(chunk)
+        if samples is not None:
+            yield samples
+    samples = decoder.flush()
+    if samples is not None:
+        yield samples
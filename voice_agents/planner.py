@@ -0,0 +1,220 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+
+# Words a clause may start with, in the default (English) planner
+CONJUNCTIONS: Tuple[str, ...] = (
+    "and",
+    "but",
+    "or",
+    "so",
+    "because",
+    "while",
+    "which",
+    "although",
+    "though",
+    "whereas",
+)
+
+
+class ChunkPlanner:
+    """
+    Group sentences into TTS requests for a low time-to-first-audio.
+
+    The first request decides how soon audio starts, so it is kept short: a
+    long opening sentence is cut at its last clause boundary (a comma,
+    semicolon, dash, or a conjunction such as "and") that fits within
+    `first_chunk_chars`. Every later request only has to be synthesized
+    before the audio ahead of it has finished playing, so later sentences are
+    merged into fewer, larger requests. The budget grows by `growth` with
+    each request up to `max_chunk_chars`, which saves a round trip per
+    sentence while synthesis stays ahead of playback.
+
+    Sentences are pushed as they complete (e.g. from a `StreamingSegmenter`)
+    and chunks are returned as soon as they are decided.
+
+    Args:
+        first_chunk_chars (Optional[int]): Target length of the first chunk. None
+            disables the clause cut. Default is 60.
+        max_chunk_chars (Optional[int]): Largest merged chunk. None sends every
+            sentence on its own. Default is 250.
+        min_chunk_chars (int): Shorter text is held and joined with the next
+            sentence. Default is 10.
+        growth (float): Budget multiplier from one chunk to the next. Default is 2.0.
+        conjunctions (Iterable[str]): Words a clause may start with. Default is `CONJUNCTIONS`.
+
+    Example:
+        >>> planner = ChunkPlanner(first_chunk_chars=30)
+        >>> planner.push("Thanks for waiting, I found your order and it shipped today.")
+        ['Thanks for waiting,']
+        >>> planner.push("It comes Monday.")
+        []
+        >>> planner.flush()
+        ['I found your order and it shipped today. It comes Monday.']
+    """
+
+    def __init__(
+        self,
+        first_chunk_chars: Optional[int] = 60,
+        max_chunk_chars: Optional[int] = 250,
+        min_chunk_chars: int = 10,
+        growth: float = 2.0,
+        conjunctions: Iterable[str] = CONJUNCTIONS,
+    ):
+        if growth < 1.0:
+            raise ValueError(
+                f"growth must be at least 1.0, got {growth}"
+            )
+        self.first_chunk_chars = first_chunk_chars
+        self.max_chunk_chars = max_chunk_chars
+        self.min_chunk_chars = min_chunk_chars
+        self.growth = growth
+        words = "|".join(map(re.escape, conjunctions))
+        # Clause boundaries: after , ; or a dash, or before a conjunction
+        self._clause_pattern = re.compile(
+            r"(?<=[,;–—])\s+|(?<=\s-)\s+"
+            + (rf"|\s+(?=(?:{words})\b)" if words else ""),
+            re.IGNORECASE,
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget held text and start again with a short first chunk."""
+        self._sentences: List[str] = []
+        self._length = 0
+        self._chunks = 0
+
+    def _budget(self) -> Optional[int]:
+        """Size the next merged chunk may grow to."""
+        if self.max_chunk_chars is None:
+            return None
+        if self.first_chunk_chars is None:
+            return self.max_chunk_chars
+        return int(
+            min(
+                self.max_chunk_chars,
+                self.first_chunk_chars * self.growth**self._chunks,
+            )
+        )
+
+    def _clause_cut(self, text: str) -> Optional[Tuple[int, int]]:
+        """Latest clause boundary that leaves a first chunk of the target size."""
+        cut = None
+        for match in self._clause_pattern.finditer(text):
+            if match.start() > self.first_chunk_chars:
+                break
+            if (
+                match.start() >= self.min_chunk_chars
+                and len(text) - match.end() >= self.min_chunk_chars
+            ):
+                cut = match
+        return None if cut is None else (cut.start(), cut.end())
+
+    def _take(self) -> str:
+        chunk = " ".join(self._sentences)
+        self._sentences = []
+        self._length = 0
+        self._chunks += 1
+        return chunk
+
+    def _hold(self, sentence: str) -> None:
+        self._length += len(sentence) + bool(self._sentences)
+        self._sentences.append(sentence)
+
+    def push(self, sentence: str) -> List[str]:
+        """
+        Add a complete sentence and return the chunks that are now decided.
+
+        Args:
+            sentence (str): The next sentence.
+
+        Returns:
+            List[str]: Chunks to synthesize, in order.
+        """
+        sentence = sentence.strip()
+        if not sentence:
+            return []
+        budget = self._budget()
+        chunks = []
+        if (
+            self._sentences
+            and self._chunks
+            and self._length >= self.min_chunk_chars
+            and (
+                budget is None
+                or self._length + 1 + len(sentence) > budget
+            )
+        ):
+            chunks.append(self._take())
+        self._hold(sentence)
+
+        if self._chunks == 0:
+            # First chunk: send it as soon as it is long enough, cut at a
+            # clause if it is too long
+            if self._length < self.min_chunk_chars:
+                return chunks
+            text = self._take()
+            cut = (
+                self._clause_cut(text)
+                if self.first_chunk_chars is not None
+                and len(text) > self.first_chunk_chars
+                else None
+            )
+            if cut is None:
+                return chunks + [text]
+            chunks.append(text[: cut[0]])
+            self._hold(text[cut[1] :])
+            budget = self._budget()
+
+        if self._length >= self.min_chunk_chars and (
+            budget is None or self._length >= budget
+        ):
+            chunks.append(self._take())
+        return chunks
+
+    def flush(self) -> List[str]:
+        """
+        Return the held text as a final chunk and reset the planner.
+
+        Returns:
+            List[str]: The last chunk, if any text is held.
+        """
+        chunks = [self._take()] if self._sentences else []
+        self.reset()
+        return chunks
+
+
+def plan_chunks(
+    sentences: Iterable[str],
+    first_chunk_chars: Optional[int] = 60,
+    max_chunk_chars: Optional[int] = 250,
+    min_chunk_chars: int = 10,
+) -> List[str]:
+    """
+    Group sentences into TTS requests with `ChunkPlanner`.
+
+    A short first chunk, cut at a clause boundary, starts audio quickly;
+    later sentences are merged into growing chunks of up to `max_chunk_chars`.
+
+    Args:
+        sentences (Iterable[str]): Sentences, e.g. from `format_text_for_speech`.
+        first_chunk_chars (Optional[int]): Target length of the first chunk. Default is 60.
+        max_chunk_chars (Optional[int]): Largest merged chunk. Default is 250.
+        min_chunk_chars (int): Shorter text is joined with the next sentence. Default is 10.
+
+    Returns:
+        List[str]: Chunks to pass to `stream_tts(..., stream_mode=True)`.
+
+    Example:
+        >>> chunks = plan_chunks(format_text_for_speech(long_answer))
+        >>> stream_tts(chunks, stream_mode=True, prefetch=1)
+    """
+    planner = ChunkPlanner(
+        first_chunk_chars=first_chunk_chars,
+        max_chunk_chars=max_chunk_chars,
+        min_chunk_chars=min_chunk_chars,
+    )
+    chunks = []
+    for sentence in sentences:
+        chunks.extend(planner.push(sentence))
+    chunks.extend(planner.flush())
+    return chunks
@@ -0,0 +1,464 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from loguru import logger
+
+T = TypeVar("T")
+
+# Status codes that mean "try again later" rather than "this request is wrong"
+_RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(ValueError):
+    """Raised without contacting a provider whose circuit breaker is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How provider requests are retried.
+
+    Delays use exponential backoff with full jitter: attempt n waits a random
+    time in [0, min(max_delay, base_delay * 2 ** (n - 1))], or the server's
+    `Retry-After` if that is longer. Retries are also limited by a budget shared
+    by all requests: every request earns `budget_ratio` retry tokens (up to
+    `budget_max_tokens`) and every retry spends one, so retries cannot grow
+    into a retry storm when a provider is overloaded.
+
+    Attributes:
+        max_attempts (int): Total attempts per request, including the first. Default is 3.
+        base_delay (float): Backoff base in seconds. Default is 0.25.
+        max_delay (float): Cap on the jittered backoff in seconds. Default is 4.0.
+        max_retry_after (float): Give up instead of honouring a `Retry-After`
+            longer than this many seconds. Default is 30.0.
+        budget_ratio (float): Retry tokens earned per request. Default is 0.2.
+        budget_max_tokens (float): Size of the retry budget (and its initial
+            balance). Default is 10.0.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.25
+    max_delay: float = 4.0
+    max_retry_after: float = 30.0
+    budget_ratio: float = 0.2
+    budget_max_tokens: float = 10.0
+
+
+@dataclass
+class ResilienceStats:
+    """
+    Counters for one provider, as returned by `get_resilience_stats`.
+
+    Attributes:
+        requests (int): Requests started (not counting retries).
+        successes (int): Attempts that got a successful response.
+        failures (int): Attempts that failed with a retryable error.
+        retries (int): Retries performed.
+        gave_up (int): Requests that failed after exhausting their attempts.
+        budget_exhausted (int): Retries skipped because the retry budget was empty.
+        circuit_opened (int): Times the circuit breaker opened.
+        circuit_rejected (int): Requests failed fast by the open circuit breaker.
+    """
+
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    gave_up: int = 0
+    budget_exhausted: int = 0
+    circuit_opened: int = 0
+    circuit_rejected: int = 0
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one provider.
+
+    After `failure_threshold` retryable failures in a row the circuit opens and
+    requests fail immediately with `CircuitOpenError`. Once `recovery_time`
+    seconds have passed a single trial request is let through (half-open); it
+    closes the circuit if it succeeds and re-opens it if it fails.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit. Default is 5.
+        recovery_time (float): Seconds to stay open before a trial request. Default is 30.0.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_time: float = 30.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if (
+                time.monotonic() - self._opened_at
+                >= self.recovery_time
+            ):
+                return "half_open"
+            return "open"
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now."""
+        return self._admit() is not None
+
+    def _admit(self) -> Optional[bool]:
+        """None if the request is rejected, else whether it is the half-open trial."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if (
+                time.monotonic() - self._opened_at
+                < self.recovery_time
+                or self._trial_in_flight
+            ):
+                return None
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a retryable failure. Returns True if this opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None:
+                # Failed trial request: stay open for another recovery_time
+                reopened = self._trial_in_flight
+                if reopened:
+                    self._opened_at = time.monotonic()
+                    self._trial_in_flight = False
+                return reopened
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def release_trial(self) -> None:
+        """Give back a trial slot whose request ended without a verdict (e.g. a 4xx)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class _RetryBudget:
+    """Token bucket shared by all requests; see `RetryPolicy`."""
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(
+                self.max_tokens, self._tokens + self.ratio
+            )
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+_policy = RetryPolicy()
+_budget = _RetryBudget(
+    _policy.budget_ratio, _policy.budget_max_tokens
+)
+_failure_threshold = 5
+_recovery_time = 30.0
+_breakers: Dict[str, CircuitBreaker] = {}
+_stats: Dict[str, ResilienceStats] = {}
+_state_lock = threading.Lock()
+
+
+def configure_resilience(
+    retry_policy: Optional[RetryPolicy] = None,
+    failure_threshold: int = 5,
+    recovery_time: float = 30.0,
+) -> None:
+    """
+    Configure retries and circuit breaking for every TTS and STT request.
+
+    Resets the retry budget and all circuit breakers; counters are kept.
+
+    Args:
+        retry_policy (Optional[RetryPolicy]): Retry settings. Defaults to `RetryPolicy()`.
+            Use `RetryPolicy(max_attempts=1)` to disable retries.
+        failure_threshold (int): Consecutive failures that open a provider's circuit. Default is 5.
+        recovery_time (float): Seconds an open circuit waits before a trial request. Default is 30.0.
+
+    Example:
+        >>> configure_resilience(RetryPolicy(max_attempts=5, max_delay=2.0),
+        ...                      failure_threshold=10, recovery_time=15.0)
+    """
+    global _policy, _budget, _failure_threshold, _recovery_time
+    with _state_lock:
+        _policy = retry_policy or RetryPolicy()
+        _budget = _RetryBudget(
+            _policy.budget_ratio, _policy.budget_max_tokens
+        )
+        _failure_threshold = failure_threshold
+        _recovery_time = recovery_time
+        _breakers.clear()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Return the circuit breaker for a provider ("openai", "elevenlabs" or "groq")."""
+    with _state_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                _failure_threshold, _recovery_time
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def _get_stats(provider: str) -> ResilienceStats:
+    with _state_lock:
+        return _stats.setdefault(provider, ResilienceStats())
+
+
+def _count(stats: ResilienceStats, field: str) -> None:
+    with _state_lock:
+        setattr(stats, field, getattr(stats, field) + 1)
+
+
+def get_resilience_stats() -> Dict[str, dict]:
+    """
+    Return the retry and circuit breaker counters of each provider used so far.
+
+    Returns:
+        Dict[str, dict]: Provider name to its `ResilienceStats` fields plus
+            `circuit_state` ("closed", "open" or "half_open").
+
+    Example:
+        >>> get_resilience_stats()["openai"]["retries"]
+        3
+    """
+    with _state_lock:
+        snapshot = {
+            provider: asdict(stats)
+            for provider, stats in _stats.items()
+        }
+    return {
+        provider: {
+            **counters,
+            "circuit_state": get_circuit_breaker(provider).state,
+        }
+        for provider, counters in snapshot.items()
+    }
+
+
+def reset_resilience_stats() -> None:
+    """Zero all counters."""
+    with _state_lock:
+        _stats.clear()
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Whether an error means the provider is failing rather than the request.
+
+    True for timeouts, connection errors and 408/425/429/5xx responses, whether
+    raised as httpx errors or as this library's ValueError wrapping them. Other
+    4xx errors (bad key, unknown voice) are not retryable.
+    """
+    cause = (
+        error.__cause__ if isinstance(error, ValueError) else error
+    )
+    if isinstance(cause, httpx.TransportError):
+        return True
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code in _RETRYABLE_STATUS_CODES
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Seconds requested by a `Retry-After` header on the failed response, if any."""
+    cause = (
+        error.__cause__ if isinstance(error, ValueError) else error
+    )
+    if not isinstance(cause, httpx.HTTPStatusError):
+        return None
+    value = cause.response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _before_attempt(provider: str, stats: ResilienceStats) -> bool:
+    """Admit an attempt through the circuit breaker. Returns whether it is the trial."""
+    trial = get_circuit_breaker(provider)._admit()
+    if trial is None:
+        _count(stats, "circuit_rejected")
+        raise CircuitOpenError(
+            f"{provider} circuit breaker is open after repeated failures; "
+            f"requests fail fast for up to {_recovery_time}s."
+        )
+    return trial
+
+
+def _after_failure(
+    provider: str,
+    stats: ResilienceStats,
+    error: Exception,
+    attempt: int,
+) -> Optional[float]:
+    """
+    Record a failed attempt and decide whether to retry.
+
+    Returns:
+        Optional[float]: Seconds to wait before the next attempt, or None to give up.
+    """
+    breaker = get_circuit_breaker(provider)
+    if not is_retryable_error(error):
+        breaker.release_trial()
+        return None
+
+    _count(stats, "failures")
+    if breaker.record_failure():
+        _count(stats, "circuit_opened")
+        logger.warning(
+            f"🚧 {provider} circuit breaker opened after {breaker._failures} failures"
+        )
+        # Surface the real error rather than retrying into the open circuit
+        _count(stats, "gave_up")
+        return None
+
+    if breaker.state != "closed":
+        # Another request opened the circuit meanwhile; a retry would only
+        # be rejected, so surface this attempt's error instead
+        _count(stats, "gave_up")
+        return None
+
+    policy = _policy
+    if attempt >= policy.max_attempts:
+        _count(stats, "gave_up")
+        return None
+
+    delay = random.uniform(
+        0,
+        min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1)),
+    )
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        if retry_after > policy.max_retry_after:
+            _count(stats, "gave_up")
+            return None
+        delay = max(delay, retry_after)
+
+    if not _budget.withdraw():
+        _count(stats, "budget_exhausted")
+        _count(stats, "gave_up")
+        return None
+
+    _count(stats, "retries")
+    logger.warning(
+        f"🔁 {provider} request failed ({error}); retry {attempt}/"
+        f"{policy.max_attempts - 1} in {delay:.2f}s"
+    )
+    return delay
+
+
+def call_with_retry(provider: str, send: Callable[[], T]) -> T:
+    """
+    Run a provider request with retries, backoff and circuit breaking.
+
+    `send` performs one attempt and must raise on failure (an httpx error, or a
+    ValueError raised from one). It must be safe to call again, e.g. rewind any
+    file being uploaded. Non-retryable errors are raised immediately; retryable
+    ones are raised once attempts, `Retry-After` limits or the retry budget run out.
+
+    Args:
+        provider (str): Provider name, selecting the circuit breaker and counters.
+        send (Callable[[], T]): Performs one attempt and returns its result.
+
+    Returns:
+        T: The result of the first successful attempt.
+
+    Raises:
+        CircuitOpenError: If the provider's circuit breaker is open.
+    """
+    stats = _get_stats(provider)
+    _count(stats, "requests")
+    _budget.deposit()
+    attempt = 0
+    while True:
+        attempt += 1
+        trial = _before_attempt(provider, stats)
+        try:
+            result = send()
+        except Exception as e:
+            delay = _after_failure(provider, stats, e, attempt)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+        except BaseException:
+            # Cancelled (TTSCancelled, CancelledError, ...) without a
+            # verdict: free the half-open trial or the circuit never closes
+            if trial:
+                get_circuit_breaker(provider).release_trial()
+            raise
+        get_circuit_breaker(provider).record_success()
+        _count(stats, "successes")
+        return result
+
+
+async def acall_with_retry(
+    provider: str, send: Callable[[], Awaitable[T]]
+) -> T:
+    """Async version of `call_with_retry`; `send` is a coroutine function."""
+    stats = _get_stats(provider)
+    _count(stats, "requests")
+    _budget.deposit()
+    attempt = 0
+    while True:
+        attempt += 1
+        trial = _before_attempt(provider, stats)
+        try:
+            result = await send()
+        except Exception as e:
+            delay = _after_failure(provider, stats, e, attempt)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+        except BaseException:
+            if trial:
+                get_circuit_breaker(provider).release_trial()
+            raise
+        get_circuit_breaker(provider).record_success()
+        _count(stats, "successes")
+        return result
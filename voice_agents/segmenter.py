@@ -0,0 +1,397 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Abbreviations whose periods do not end a sentence, per language. Earlier
+# entries take precedence where two overlap (e.g. "i.e." in "i.e.g.").
+ABBREVIATIONS: Dict[str, Tuple[str, ...]] = {
+    "en": (
+        "Dr.",
+        "Mr.",
+        "Mrs.",
+        "Ms.",
+        "Prof.",
+        "Sr.",
+        "Jr.",
+        "Inc.",
+        "Ltd.",
+        "Corp.",
+        "vs.",
+        "etc.",
+        "e.g.",
+        "i.e.",
+        "U.S.A.",
+        "U.K.",
+        "A.I.",
+        "Ph.D.",
+        "M.D.",
+        "B.A.",
+        "M.A.",
+        "B.S.",
+        "M.S.",
+    ),
+    "de": (
+        "Dr.",
+        "Prof.",
+        "Hr.",
+        "Fr.",
+        "Nr.",
+        "Str.",
+        "ca.",
+        "bzw.",
+        "usw.",
+        "vgl.",
+        "z.B.",
+        "d.h.",
+        "u.a.",
+        "o.ä.",
+        "inkl.",
+        "ggf.",
+        "evtl.",
+        "GmbH.",
+    ),
+    "fr": (
+        "M.",
+        "Mme.",
+        "Mlle.",
+        "Dr.",
+        "Pr.",
+        "St.",
+        "Ste.",
+        "etc.",
+        "cf.",
+        "p.ex.",
+        "c.-à-d.",
+        "av.",
+        "env.",
+    ),
+    "es": (
+        "Sr.",
+        "Sra.",
+        "Srta.",
+        "Dr.",
+        "Dra.",
+        "Ud.",
+        "Uds.",
+        "etc.",
+        "p.ej.",
+        "aprox.",
+        "núm.",
+        "EE.UU.",
+    ),
+}
+
+# Sentence ends (. ! ? followed by whitespace or the end of the text),
+# newlines, semicolons, and colons followed by whitespace
+_SPLIT_PATTERN = re.compile(
+    r"(?<=[.!?])\s+|(?<=[.!?])$|\n+|(?<=;)\s+|(?<=:\s)"
+)
+
+
+class SentenceSegmenter:
+    """
+    Split text into speech-friendly chunks in one pass over the text.
+
+    All abbreviations are compiled into a single alternation, found with one
+    scan, and masked out of a same-length copy of the text so their periods
+    cannot end a sentence; one more scan with the split pattern then yields
+    the chunk boundaries, which are sliced from the original text. No
+    placeholders are substituted or restored.
+
+    Abbreviations are literal strings matched at a word boundary. Where two
+    of them touch or overlap, the one listed first wins, so the result is
+    the same as protecting them one after another in list order.
+
+    Args:
+        abbreviations (Iterable[str]): Abbreviations that do not end a
+            sentence. Default is the English list, `ABBREVIATIONS["en"]`.
+
+    Example:
+        >>> segmenter = SentenceSegmenter(ABBREVIATIONS["en"] + ("Gen.", "Col."))
+        >>> segmenter.split("Gen. Smith arrived. He sat down.")
+        ['Gen. Smith arrived.', 'He sat down.']
+    """
+
+    def __init__(
+        self, abbreviations: Iterable[str] = ABBREVIATIONS["en"]
+    ):
+        self.abbreviations = tuple(abbreviations)
+        self._priority = {}
+        for priority, abbreviation in enumerate(self.abbreviations):
+            self._priority.setdefault(abbreviation, priority)
+        # A lookahead finds overlapping candidates at every word boundary
+        self._abbreviation_pattern = (
+            re.compile(
+                r"\b(?=("
+                + "|".join(map(re.escape, self._priority))
+                + "))"
+            )
+            if self._priority
+            else None
+        )
+
+    def _candidates(self, text: str) -> List[Tuple[int, int]]:
+        """Return the (start, end) of every abbreviation match, overlaps included."""
+        if self._abbreviation_pattern is None:
+            return []
+        return [
+            (match.start(), match.start() + len(match.group(1)))
+            for match in self._abbreviation_pattern.finditer(text)
+        ]
+
+    def _resolve(
+        self, text: str, candidates: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """Return the spans of the candidates that stay protected."""
+        if all(
+            end < next_start
+            for (_, end), (next_start, _) in zip(
+                candidates, candidates[1:]
+            )
+        ):
+            return candidates
+
+        # Abbreviations touch or overlap: resolve them in priority order. A
+        # later-listed one loses to any earlier-listed one it overlaps, and
+        # to one ending right before it (it would no longer start at a word
+        # boundary once that one is protected).
+        protected = {}
+        for start, end in sorted(
+            candidates,
+            key=lambda span: (
+                self._priority[text[span[0] : span[1]]],
+                span[0],
+            ),
+        ):
+            priority = self._priority[text[start:end]]
+            before = protected.get(start - 1)
+            if before is not None and before < priority:
+                continue
+            if any(
+                position in protected
+                for position in range(start, end)
+            ):
+                continue
+            for position in range(start, end):
+                protected[position] = priority
+        spans = []
+        for position in sorted(protected):
+            if spans and spans[-1][1] == position:
+                spans[-1][1] += 1
+            else:
+                spans.append([position, position + 1])
+        return [(start, end) for start, end in spans]
+
+    def _protected_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Return the (start, end) of every abbreviation that does not end a sentence."""
+        return self._resolve(text, self._candidates(text))
+
+    @staticmethod
+    def _mask(text: str, spans: List[Tuple[int, int]]) -> str:
+        """Copy of text with the given spans blanked to word characters."""
+        if not spans:
+            return text
+        parts = []
+        position = 0
+        for start, end in spans:
+            parts.append(text[position:start])
+            parts.append("_" * (end - start))
+            position = end
+        parts.append(text[position:])
+        return "".join(parts)
+
+    def _masked(self, text: str) -> str:
+        """Copy of text with protected abbreviations blanked to word characters."""
+        return self._mask(text, self._protected_spans(text))
+
+    def _iter_chunks(self, text: str, masked: str):
+        position = 0
+        for match in _SPLIT_PATTERN.finditer(masked):
+            yield text[position : match.start()]
+            position = match.end()
+        yield text[position:]
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split text on sentence ends, newlines, semicolons and colons.
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            List[str]: Stripped, non-empty chunks.
+        """
+        if not text or not text.strip():
+            return []
+        return [
+            chunk.strip()
+            for chunk in self._iter_chunks(text, self._masked(text))
+            if chunk.strip()
+        ]
+
+
+class StreamingSegmenter:
+    """
+    Split text into chunks as it arrives, e.g. token by token from an LLM.
+
+    Produces exactly the chunks `SentenceSegmenter.split` would produce for
+    the whole text, but only scans what is new: a boundary is emitted as soon
+    as no later text can change it, and the text behind it is dropped from
+    the scan window. Work per `push` is proportional to the pushed text plus
+    a short window (the longest abbreviation), so a long response costs
+    linear time instead of rescanning the buffer on every token.
+
+    Args:
+        segmenter (Optional[SentenceSegmenter]): Rules to split with. Default is `get_segmenter("en")`.
+
+    Example:
+        >>> stream = StreamingSegmenter()
+        >>> stream.push("Dr. Smith is ")
+        []
+        >>> stream.push("here. He says hi")
+        ['Dr. Smith is here.']
+        >>> stream.flush()
+        ['He says hi']
+    """
+
+    def __init__(self, segmenter: Optional[SentenceSegmenter] = None):
+        self.segmenter = segmenter or get_segmenter()
+        # An abbreviation cannot be recognized until all of it has arrived
+        self._reach = max(
+            map(len, self.segmenter.abbreviations), default=0
+        )
+        self._reset()
+
+    def _reset(self) -> None:
+        self._window = ""
+        self._offset = 0  # position of the window in the whole text
+        self._parts = []  # current chunk's text before the window
+        self._chunk_start = 0
+        self._resume = 0  # where the split pattern search continues
+
+    def _emit(self, chunks: List[str], end: int) -> None:
+        start = max(0, self._chunk_start - self._offset)
+        chunk = (
+            "".join(self._parts)
+            + self._window[start : end - self._offset]
+        )
+        self._parts = []
+        if chunk.strip():
+            chunks.append(chunk.strip())
+
+    def _scan(self, final: bool) -> List[str]:
+        window = self._window
+        size = len(window)
+        segmenter = self.segmenter
+        candidates = segmenter._candidates(window)
+        if self._offset and candidates and candidates[0][0] == 0:
+            # The first character is context only; a match there may not
+            # start at a real word boundary
+            candidates = candidates[1:]
+
+        # Positions from `stable` on can still change: an abbreviation may be
+        # incomplete there, or may yet touch one of the last candidates
+        stable = size + 1
+        if not final:
+            stable = size - self._reach + 1
+            threshold = stable
+            groups = []
+            for start, end in candidates:
+                if groups and start <= groups[-1][1]:
+                    groups[-1][1] = max(groups[-1][1], end)
+                else:
+                    groups.append([start, end])
+            for start, end in reversed(groups):
+                if end < threshold:
+                    break
+                stable = min(stable, start)
+
+        masked = segmenter._mask(
+            window, segmenter._resolve(window, candidates)
+        )
+        chunks = []
+        limit = size
+        for match in _SPLIT_PATTERN.finditer(
+            masked, self._resume - self._offset
+        ):
+            if not final and match.end() >= min(stable, size):
+                limit = match.start()
+                break
+            self._emit(chunks, self._offset + match.start())
+            self._chunk_start = self._offset + match.end()
+            # Like re.finditer, never take a second empty match in one place
+            self._resume = self._chunk_start + (
+                match.start() == match.end()
+            )
+        if final:
+            return chunks
+
+        # No boundary can start in the settled text the search just passed
+        self._resume = max(
+            self._resume, self._offset + min(limit, stable)
+        )
+        # Drop what the search no longer needs, keeping the two characters of
+        # lookbehind and cutting where no abbreviation straddles the edge
+        cut = self._resume - self._offset - 2
+        for start, end in reversed(candidates):
+            if start <= cut < end:
+                cut = start - 1
+        if cut > 0:
+            start = self._chunk_start - self._offset
+            if start < cut:
+                self._parts.append(window[max(0, start) : cut])
+            self._window = window[cut:]
+            self._offset += cut
+        return chunks
+
+    def push(self, text: str) -> List[str]:
+        """
+        Add text and return the chunks it completes.
+
+        Args:
+            text (str): The next piece of text.
+
+        Returns:
+            List[str]: Stripped, non-empty chunks that are now final.
+        """
+        if not text:
+            return []
+        self._window += text
+        return self._scan(final=False)
+
+    def flush(self) -> List[str]:
+        """
+        End the text and return the remaining chunks.
+
+        The segmenter is reset and can be reused for the next text.
+
+        Returns:
+            List[str]: Stripped, non-empty chunks.
+        """
+        chunks = self._scan(final=True)
+        self._emit(chunks, self._offset + len(self._window))
+        self._reset()
+        return chunks
+
+
+@lru_cache(maxsize=None)
+def get_segmenter(language: str = "en") -> SentenceSegmenter:
+    """
+    Return the shared segmenter for a language, compiled on first use.
+
+    Args:
+        language (str): A key of `ABBREVIATIONS` ("en", "de", "fr", "es"). Default is "en".
+
+    Returns:
+        SentenceSegmenter: The language's segmenter.
+
+    Raises:
+        ValueError: If the language has no abbreviation list.
+    """
+    if language not in ABBREVIATIONS:
+        raise ValueError(
+            f"No abbreviation list for language '{language}'. "
+            f"Supported: {', '.join(sorted(ABBREVIATIONS))}. "
+            "Use SentenceSegmenter(abbreviations) for other languages."
+        )
+    return SentenceSegmenter(ABBREVIATIONS[language])
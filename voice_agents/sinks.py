@@ -0,0 +1,298 @@
+import threading
+import wave
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from voice_agents.resample import Resampler
+
+
+def _to_int16(samples: np.ndarray) -> np.ndarray:
+    """Convert int16 or float ([-1, 1]) samples to int16."""
+    if samples.dtype == np.int16:
+        return samples
+    return (
+        np.clip(samples.astype(np.float32), -1.0, 1.0) * 32767.0
+    ).astype(np.int16)
+
+
+class AudioSink:
+    """
+    Destination for synthesized audio.
+
+    Every playback path (`stream_tts*`, `play_pcm_samples`,
+    `process_audio_buffer`, ...) writes mono samples to a sink instead of
+    talking to the sound card directly, so the library runs unchanged on
+    machines without an audio device. Subclass it and override `write` (and
+    optionally `drain`, `clear` and `close`) to send audio somewhere else.
+
+    Sinks are context managers; leaving the `with` block closes them.
+
+    Example:
+        >>> with WAVFileSink("out.wav") as sink:
+        ...     stream_tts(["Hello there"], sink=sink)
+    """
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        """
+        Accept a block of mono samples.
+
+        Args:
+            samples (np.ndarray): int16 samples, or float samples in [-1, 1].
+            sample_rate (int): Sample rate of `samples` in Hz.
+
+        Returns:
+            int: Number of frames accepted.
+        """
+        raise NotImplementedError
+
+    def drain(self) -> None:
+        """Mark the end of an utterance; block until it has been delivered."""
+
+    def clear(self) -> None:
+        """Drop audio that has been written but not delivered yet."""
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Audio written but not delivered yet, i.e. what `clear` would drop."""
+        return 0.0
+
+    def close(self) -> None:
+        """Release the sink's resources."""
+
+    def __enter__(self) -> "AudioSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class DeviceSink(AudioSink):
+    """
+    Play audio on the sound card through the shared `AudioEngine`.
+
+    sounddevice (and PortAudio) is only imported when the first block is
+    written, so creating this sink, and importing the library, works on
+    headless machines.
+    """
+
+    def __init__(self):
+        self._engine = None
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        from voice_agents.audio_engine import get_audio_engine
+
+        self._engine = get_audio_engine(sample_rate)
+        return self._engine.write(samples, sample_rate)
+
+    def drain(self) -> None:
+        if self._engine is not None:
+            self._engine.drain()
+
+    def clear(self) -> None:
+        if self._engine is not None:
+            self._engine.clear()
+
+    @property
+    def buffered_seconds(self) -> float:
+        if self._engine is None:
+            return 0.0
+        return self._engine.buffered_frames / self._engine.sample_rate
+
+
+class _RateLockedSink(AudioSink):
+    """Base for sinks that store audio at the first rate they receive."""
+
+    def __init__(self):
+        self.sample_rate: Optional[int] = None
+        self._resamplers = {}
+
+    def _prepare(
+        self, samples: np.ndarray, sample_rate: int
+    ) -> np.ndarray:
+        if self.sample_rate is None:
+            self.sample_rate = sample_rate
+        elif sample_rate != self.sample_rate:
+            resampler = self._resamplers.get(sample_rate)
+            if resampler is None:
+                resampler = self._resamplers[sample_rate] = Resampler(
+                    sample_rate, self.sample_rate
+                )
+            samples = resampler.push(samples)
+        return _to_int16(samples)
+
+    def _flush_resamplers(self) -> List[np.ndarray]:
+        resamplers, self._resamplers = self._resamplers, {}
+        return [
+            _to_int16(resampler.flush())
+            for resampler in resamplers.values()
+        ]
+
+
+class WAVFileSink(_RateLockedSink):
+    """
+    Write audio to a 16-bit mono WAV file as it arrives.
+
+    The file is created on the first write at that block's sample rate; later
+    blocks at other rates are resampled to it. The header is updated with
+    every write, so the file is valid while synthesis is still running.
+
+    Args:
+        path (str): Output file path.
+
+    Example:
+        >>> sink = WAVFileSink("speech.wav")
+        >>> stream_tts(["Hello", "world"], sink=sink)
+        >>> sink.close()
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._file: Optional[wave.Wave_write] = None
+        self.frames_written = 0
+
+    def _append(self, samples: np.ndarray) -> None:
+        if len(samples):
+            self._file.writeframes(samples.astype("<i2").tobytes())
+            self.frames_written += len(samples)
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        samples = self._prepare(samples, sample_rate)
+        if self._file is None:
+            self._file = wave.open(self.path, "wb")
+            self._file.setnchannels(1)
+            self._file.setsampwidth(2)
+            self._file.setframerate(self.sample_rate)
+        self._append(samples)
+        return len(samples)
+
+    def drain(self) -> None:
+        for samples in self._flush_resamplers():
+            self._append(samples)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.drain()
+            self._file.close()
+            self._file = None
+
+
+class NumpySink(_RateLockedSink):
+    """
+    Collect audio in memory as NumPy arrays.
+
+    Attributes:
+        sample_rate (Optional[int]): Rate of the collected audio (the first
+            block's rate; later blocks at other rates are resampled to it).
+
+    Example:
+        >>> sink = NumpySink()
+        >>> stream_tts(["Hello"], sink=sink)
+        >>> audio, rate = sink.samples, sink.sample_rate
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._blocks: List[np.ndarray] = []
+        self._lock = threading.Lock()
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        samples = self._prepare(samples, sample_rate)
+        with self._lock:
+            self._blocks.append(samples)
+        return len(samples)
+
+    def drain(self) -> None:
+        tails = self._flush_resamplers()
+        with self._lock:
+            self._blocks.extend(tails)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """All collected audio as one int16 array."""
+        with self._lock:
+            if not self._blocks:
+                return np.zeros(0, dtype=np.int16)
+            if len(self._blocks) > 1:
+                self._blocks = [np.concatenate(self._blocks)]
+            return self._blocks[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._blocks = []
+        self._resamplers = {}
+
+
+class CallbackSink(AudioSink):
+    """
+    Hand every block of audio to a user function.
+
+    Args:
+        callback (Callable[[np.ndarray, int], None]): Called with each block
+            of samples and its sample rate, in the writer's thread.
+        on_drain (Optional[Callable[[], None]]): Called at the end of every
+            utterance.
+
+    Example:
+        >>> sink = CallbackSink(lambda samples, rate: websocket.send(samples.tobytes()))
+        >>> stream_tts(["Hi"], sink=sink)
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[np.ndarray, int], None],
+        on_drain: Optional[Callable[[], None]] = None,
+    ):
+        self.callback = callback
+        self.on_drain = on_drain
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        self.callback(samples, sample_rate)
+        return len(samples)
+
+    def drain(self) -> None:
+        if self.on_drain is not None:
+            self.on_drain()
+
+
+class NullSink(AudioSink):
+    """
+    Discard audio (for benchmarks and tests), counting the frames received.
+
+    Attributes:
+        frames_written (int): Frames received so far.
+    """
+
+    def __init__(self):
+        self.frames_written = 0
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> int:
+        self.frames_written += len(samples)
+        return len(samples)
+
+
+_default_sink: AudioSink = DeviceSink()
+
+
+def get_default_sink() -> AudioSink:
+    """Return the sink used when a playback function gets no `sink`."""
+    return _default_sink
+
+
+def set_default_sink(sink: Optional[AudioSink]) -> None:
+    """
+    Set the sink used when a playback function gets no `sink`.
+
+    Args:
+        sink (Optional[AudioSink]): New default. None restores `DeviceSink`.
+
+    Example:
+        >>> set_default_sink(NullSink())  # headless worker
+    """
+    global _default_sink
+    _default_sink = sink if sink is not None else DeviceSink()
+
+
+def _resolve_sink(sink: Optional[AudioSink]) -> AudioSink:
+    return sink if sink is not None else _default_sink
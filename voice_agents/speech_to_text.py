@@ -1,5 +1,16 @@
+import asyncio
 import os
-from typing import Generator, List, Literal, Optional, Union
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    AsyncGenerator,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 import numpy as np
@@ -9,7 +20,422 @@ from voice_agents.utils import (
 )
 
 from voice_agents.models_and_voices import GROQ_STT_MODELS
-from voice_agents.client import _http_client
+from voice_agents.client import _get_async_http_client, _http_client
+from voice_agents.g711 import pcm_to_ulaw
+from voice_agents.resample import resample
+from voice_agents.resilience import acall_with_retry, call_with_retry
+from voice_agents.upload import _optimized_upload, _wav_bytes
+
+
+@dataclass
+class _STTRequest:
+    """
+    A fully prepared speech-to-text upload (everything except the audio file).
+
+    Built once per call by the `_prepare_*_stt` helpers and shared by the sync
+    and async transcription functions.
+    """
+
+    provider: str
+    url: str
+    headers: dict
+    data: dict
+    content_type: str
+    env_var_name: str
+    api_key_url: str
+    timeout: Optional[float] = None
+
+
+def _mono_int16(audio_data: np.ndarray) -> np.ndarray:
+    """
+    Take the first channel of `audio_data` as int16 PCM.
+
+    int16 input is returned as is (a view for multi-channel audio). Float
+    input in [-1.0, 1.0] is scaled, rounded and clipped in a single float32
+    buffer, whatever its precision.
+    """
+    audio = np.asarray(audio_data)
+    # Ensure mono audio
+    if audio.ndim > 1 and audio.shape[1] > 0:
+        audio = audio[:, 0]
+    if audio.dtype == np.int16:
+        return audio
+    if np.issubdtype(audio.dtype, np.floating):
+        scaled = np.multiply(audio, 32767.0, dtype=np.float32)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        return scaled.astype(np.int16)
+    return audio.astype(np.int16)
+
+
+@contextmanager
+def _audio_upload(
+    audio_file_path: Optional[str],
+    audio_data: Optional[np.ndarray],
+    sample_rate: int,
+    content_type: str,
+    optimize: bool = True,
+) -> Generator[Tuple[str, object, str], None, None]:
+    """
+    Provide the multipart `file` field for an audio file path or numpy array.
+
+    With `optimize` and upload preprocessing enabled (see `configure_upload`),
+    the audio is downmixed, resampled and re-encoded in memory first.
+    Otherwise numpy audio is encoded as 16-bit mono WAV into an in-memory
+    buffer, so a turn costs no filesystem writes and a single copy of the
+    samples. A file path is opened directly and closed when the context exits.
+
+    Yields:
+        Tuple[str, object, str]: (filename, seekable file object, content type).
+
+    Raises:
+        ValueError: If neither source is provided.
+        IOError: If audio_file_path does not exist.
+    """
+    if audio_file_path:
+        if not os.path.exists(audio_file_path):
+            raise IOError(f"Audio file not found: {audio_file_path}")
+    elif audio_data is None:
+        raise ValueError(
+            "Either audio_file_path or audio_data must be provided."
+        )
+
+    file_field = (
+        _optimized_upload(audio_file_path, audio_data, sample_rate)
+        if optimize
+        else None
+    )
+    if file_field is not None:
+        yield file_field
+    elif audio_file_path:
+        # Use the provided file path
+        file_obj = open(audio_file_path, "rb")
+        try:
+            yield (
+                os.path.basename(audio_file_path),
+                file_obj,
+                content_type,
+            )
+        finally:
+            file_obj.close()
+    else:
+        buffer = _wav_bytes(_mono_int16(audio_data), sample_rate)
+        yield ("audio.wav", buffer, content_type)
+
+
+def _check_stt_response(
+    request: _STTRequest, response: httpx.Response
+) -> None:
+    """
+    Raise a descriptive error for a failed transcription response.
+
+    Raises:
+        ValueError: If authentication failed or the API returned an error status.
+    """
+    # Check for authentication errors
+    if response.status_code == 401:
+        error_text = "No additional error details available"
+        try:
+            if response.text:
+                error_text = response.text
+        except Exception as e:
+            error_text = f"Could not read error response: {str(e)}"
+
+        raise ValueError(
+            f"Authentication failed (401). Please check your {request.env_var_name}.\n"
+            f"The API key may be invalid, expired, or not set correctly.\n"
+            f"Error details: {error_text}\n"
+            f"Get your API key from: {request.api_key_url}"
+        )
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise ValueError(
+            f"HTTP error {e.response.status_code}: {e.response.text}\n"
+            f"URL: {e.request.url}"
+        ) from e
+
+
+def _rewind_upload(file_field: Optional[tuple]) -> None:
+    """Rewind the uploaded file so a retried request sends it again from the start."""
+    if file_field and hasattr(file_field[1], "seek"):
+        file_field[1].seek(0)
+
+
+def _send_stt_request(
+    request: _STTRequest, file_field: Optional[tuple]
+) -> httpx.Response:
+    """Upload audio with the shared sync client and validate the response."""
+
+    def send() -> httpx.Response:
+        _rewind_upload(file_field)
+        response = _http_client.post(
+            request.url,
+            headers=request.headers,
+            files={"file": file_field} if file_field else None,
+            data=request.data,
+            **(
+                {"timeout": request.timeout}
+                if request.timeout is not None
+                else {}
+            ),
+        )
+        _check_stt_response(request, response)
+        return response
+
+    return call_with_retry(request.provider, send)
+
+
+async def _asend_stt_request(
+    request: _STTRequest, file_field: Optional[tuple]
+) -> httpx.Response:
+    """Upload audio with the pooled async client and validate the response."""
+
+    async def send() -> httpx.Response:
+        _rewind_upload(file_field)
+        response = await _get_async_http_client().post(
+            request.url,
+            headers=request.headers,
+            files={"file": file_field} if file_field else None,
+            data=request.data,
+            **(
+                {"timeout": request.timeout}
+                if request.timeout is not None
+                else {}
+            ),
+        )
+        _check_stt_response(request, response)
+        return response
+
+    return await acall_with_retry(request.provider, send)
+
+
+def _prepare_openai_stt(
+    model: str,
+    language: Optional[str],
+    prompt: Optional[str],
+    response_format: str,
+    temperature: float,
+) -> _STTRequest:
+    """Read the API key and build the OpenAI Whisper upload request."""
+    # Get API key from environment variable
+    api_key = get_api_key(
+        "OPENAI_API_KEY",
+        "https://platform.openai.com/api-keys",
+    )
+
+    data = {
+        "model": model,
+        "response_format": response_format,
+        "temperature": str(temperature),
+    }
+
+    if language:
+        data["language"] = language
+
+    if prompt:
+        data["prompt"] = prompt
+
+    return _STTRequest(
+        provider="openai",
+        # OpenAI Whisper API endpoint
+        url="https://api.openai.com/v1/audio/transcriptions",
+        headers={
+            "Authorization": f"Bearer {api_key}",
+        },
+        data=data,
+        content_type="audio/wav",
+        env_var_name="OPENAI_API_KEY",
+        api_key_url="https://platform.openai.com/api-keys",
+    )
+
+
+def _parse_openai_stt_response(
+    response: httpx.Response, response_format: str
+) -> str:
+    """Extract the transcript from an OpenAI Whisper response."""
+    # Parse response based on format
+    if response_format == "text":
+        return response.text.strip()
+    elif response_format == "json":
+        result = response.json()
+        return result.get("text", "")
+    elif response_format == "verbose_json":
+        result = response.json()
+        return result.get("text", "")
+    elif response_format in ["srt", "vtt"]:
+        return response.text
+    else:
+        return response.text.strip()
+
+
+def _prepare_elevenlabs_stt(
+    api_key: str,
+    model_id: str,
+    language_code: Optional[str],
+    tag_audio_events: bool,
+    num_speakers: Optional[int],
+    timestamps_granularity: str,
+    diarize: bool,
+    diarization_threshold: Optional[float],
+    file_format: str,
+    cloud_storage_url: Optional[str],
+    temperature: Optional[float],
+    seed: Optional[int],
+    use_multi_channel: bool,
+    enable_logging: bool,
+) -> _STTRequest:
+    """Build the ElevenLabs (non-real-time) speech-to-text upload request."""
+    # Prepare multipart form data
+    data = {
+        "model_id": model_id,
+        "tag_audio_events": str(tag_audio_events).lower(),
+        "timestamps_granularity": timestamps_granularity,
+        "diarize": str(diarize).lower(),
+        "file_format": file_format,
+        "use_multi_channel": str(use_multi_channel).lower(),
+        "enable_logging": str(enable_logging).lower(),
+    }
+
+    if language_code:
+        data["language_code"] = language_code
+    if num_speakers is not None:
+        data["num_speakers"] = str(num_speakers)
+    if diarization_threshold is not None:
+        data["diarization_threshold"] = str(diarization_threshold)
+    if cloud_storage_url:
+        data["cloud_storage_url"] = cloud_storage_url
+    if temperature is not None:
+        data["temperature"] = str(temperature)
+    if seed is not None:
+        data["seed"] = str(seed)
+
+    return _STTRequest(
+        provider="elevenlabs",
+        url="https://api.elevenlabs.io/v1/speech-to-text",
+        headers={
+            "xi-api-key": api_key,
+        },
+        data=data,
+        content_type="application/octet-stream",
+        env_var_name="ELEVENLABS_API_KEY",
+        api_key_url="https://elevenlabs.io/app/settings/api-keys",
+        # Use longer timeout for large files
+        timeout=300.0,
+    )
+
+
+def _parse_elevenlabs_stt_response(response: httpx.Response) -> str:
+    """Extract the transcript from an ElevenLabs speech-to-text response."""
+    # Parse response
+    result = response.json()
+
+    # Handle multi-channel response
+    if "transcripts" in result:
+        # Multi-channel response
+        transcripts = result["transcripts"]
+        # Combine all transcripts
+        text_parts = [t.get("text", "") for t in transcripts]
+        return " ".join(text_parts)
+    else:
+        # Single channel response
+        return result.get("text", "")
+
+
+def _prepare_groq_stt(
+    model: str,
+    language: Optional[str],
+    prompt: Optional[str],
+    response_format: str,
+    temperature: float,
+    timestamp_granularities: Optional[List[str]],
+    translate: bool,
+) -> _STTRequest:
+    """Validate arguments, read the API key and build the Groq Whisper upload request."""
+    # Get API key from environment variable
+    api_key = get_api_key(
+        "GROQ_API_KEY",
+        "https://console.groq.com/keys",
+    )
+
+    # Validate model
+    if model not in GROQ_STT_MODELS:
+        raise ValueError(
+            f"Invalid model '{model}'. Supported models: {', '.join(GROQ_STT_MODELS)}"
+        )
+
+    # Validate translate parameter
+    if translate and model != "whisper-large-v3":
+        raise ValueError(
+            f"Translation is only supported with 'whisper-large-v3' model, not '{model}'."
+        )
+
+    # Choose endpoint based on translate flag
+    if translate:
+        url = "https://api.groq.com/openai/v1/audio/translations"
+    else:
+        url = "https://api.groq.com/openai/v1/audio/transcriptions"
+
+    data = {
+        "model": model,
+        "response_format": response_format,
+        "temperature": str(temperature),
+    }
+
+    if language:
+        data["language"] = language
+
+    if prompt:
+        data["prompt"] = prompt
+
+    # Add timestamp_granularities if provided and response_format is verbose_json
+    if timestamp_granularities and response_format == "verbose_json":
+        # Groq API (OpenAI-compatible) expects this as an array
+        # Send as JSON-encoded string, which is commonly accepted by OpenAI-compatible APIs
+        import json
+
+        data["timestamp_granularities"] = json.dumps(
+            timestamp_granularities
+        )
+
+    return _STTRequest(
+        provider="groq",
+        url=url,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+        },
+        data=data,
+        content_type="audio/wav",
+        env_var_name="GROQ_API_KEY",
+        api_key_url="https://console.groq.com/keys",
+        # Use longer timeout for large files
+        timeout=300.0,
+    )
+
+
+def _parse_groq_stt_response(
+    response: httpx.Response, response_format: str
+) -> str:
+    """Extract the transcript from a Groq Whisper response."""
+    # Parse response based on format
+    if response_format == "text":
+        return response.text.strip()
+    elif response_format == "json":
+        result = response.json()
+        return result.get("text", "")
+    elif response_format == "verbose_json":
+        result = response.json()
+        # Return the full JSON as a string, or extract text if available
+        if isinstance(result, dict) and "text" in result:
+            return result.get("text", "")
+        else:
+            # Return the full JSON string representation
+            import json
+
+            return json.dumps(result, indent=2, default=str)
+    else:
+        return response.text.strip()
 
 
 def speech_to_text(
@@ -34,7 +460,7 @@ def speech_to_text(
             If provided, audio_data will be ignored.
         audio_data (Optional[np.ndarray]): Raw audio data as numpy array.
             Should be float32 in range [-1, 1] or int16.
-            If provided without audio_file_path, will be saved to a temporary file.
+            If provided without audio_file_path, is encoded in memory for upload (see `configure_upload`).
         sample_rate (int): Sample rate of the audio data. Default is 16000.
             Only used when audio_data is provided.
         model (str): The model to use for transcription. Default is "whisper-1".
@@ -66,158 +492,17 @@ def speech_to_text(
         >>> sd.wait()
         >>> text = speech_to_text(audio_data=recording, sample_rate=16000)
     """
-    import tempfile
-
-    # Get API key from environment variable
-    api_key = get_api_key(
-        "OPENAI_API_KEY",
-        "https://platform.openai.com/api-keys",
+    request = _prepare_openai_stt(
+        model, language, prompt, response_format, temperature
     )
 
-    # OpenAI Whisper API endpoint
-    url = "https://api.openai.com/v1/audio/transcriptions"
-
-    # Headers
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-    }
-
-    # Determine which audio source to use
-    use_temp_file = False
-    temp_file_path = None
-
-    if audio_file_path:
-        # Use the provided file path
-        if not os.path.exists(audio_file_path):
-            raise IOError(f"Audio file not found: {audio_file_path}")
-        file_path = audio_file_path
-    elif audio_data is not None:
-        # Save audio data to a temporary file
-        try:
-            import soundfile as sf
-
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=".wav"
-            )
-            temp_file_path = temp_file.name
-            temp_file.close()
-
-            # Convert audio data to float32 if needed
-            if audio_data.dtype == np.int16:
-                audio_float = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype == np.float32:
-                audio_float = audio_data
-            else:
-                audio_float = audio_data.astype(np.float32)
-
-            # Ensure mono audio
-            if len(audio_float.shape) > 1:
-                audio_float = (
-                    audio_float[:, 0]
-                    if audio_float.shape[1] > 0
-                    else audio_float
-                )
-
-            # Save to temporary file
-            sf.write(temp_file_path, audio_float, sample_rate)
-            file_path = temp_file_path
-            use_temp_file = True
-        except ImportError:
-            raise ValueError(
-                "soundfile library is required for audio_data input. "
-                "Install it with: pip install soundfile"
-            )
-    else:
-        raise ValueError(
-            "Either audio_file_path or audio_data must be provided."
-        )
-
-    # Prepare form data
-    files = {
-        "file": (
-            os.path.basename(file_path),
-            open(file_path, "rb"),
-            "audio/wav",
-        )
-    }
-
-    data = {
-        "model": model,
-        "response_format": response_format,
-        "temperature": str(temperature),
-    }
-
-    if language:
-        data["language"] = language
-
-    if prompt:
-        data["prompt"] = prompt
-
-    try:
+    with _audio_upload(
+        audio_file_path, audio_data, sample_rate, request.content_type
+    ) as file_field:
         # Make request to OpenAI Whisper API
-        response = _http_client.post(
-            url,
-            headers=headers,
-            files=files,
-            data=data,
-        )
+        response = _send_stt_request(request, file_field)
 
-        # Check for authentication errors
-        if response.status_code == 401:
-            error_text = "No additional error details available"
-            try:
-                if response.text:
-                    error_text = response.text
-            except Exception as e:
-                error_text = (
-                    f"Could not read error response: {str(e)}"
-                )
-
-            raise ValueError(
-                f"Authentication failed (401). Please check your OPENAI_API_KEY.\n"
-                f"The API key may be invalid, expired, or not set correctly.\n"
-                f"Error details: {error_text}\n"
-                f"Get your API key from: https://platform.openai.com/api-keys"
-            )
-
-        response.raise_for_status()
-
-        # Parse response based on format
-        if response_format == "text":
-            return response.text.strip()
-        elif response_format == "json":
-            result = response.json()
-            return result.get("text", "")
-        elif response_format == "verbose_json":
-            result = response.json()
-            return result.get("text", "")
-        elif response_format in ["srt", "vtt"]:
-            return response.text
-        else:
-            return response.text.strip()
-    except httpx.HTTPStatusError as e:
-        # Re-raise ValueError if we already converted it
-        if isinstance(e, ValueError):
-            raise
-        # Otherwise, provide a generic error message
-        raise ValueError(
-            f"HTTP error {e.response.status_code}: {e.response.text}\n"
-            f"URL: {e.request.url}"
-        ) from e
-    finally:
-        # Clean up temporary file if we created one
-        if (
-            use_temp_file
-            and temp_file_path
-            and os.path.exists(temp_file_path)
-        ):
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
-        # Close the file handle
-        if "files" in locals() and files.get("file"):
-            files["file"][1].close()
+    return _parse_openai_stt_response(response, response_format)
 
 
 def speech_to_text_elevenlabs(
@@ -272,7 +557,7 @@ def speech_to_text_elevenlabs(
             Only used when realtime=False.
         audio_data (Optional[np.ndarray]): Raw audio data as numpy array.
             Should be float32 in range [-1, 1] or int16.
-            If provided without audio_file_path, will be saved to a temporary file.
+            If provided without audio_file_path, is encoded in memory for upload (see `configure_upload`).
             Only used when realtime=False.
         sample_rate (int): Sample rate of the audio data. Default is 16000.
             Only used when audio_data is provided and realtime=False.
@@ -358,7 +643,6 @@ def speech_to_text_elevenlabs(
     """
     import base64
     import json
-    import tempfile
 
     # Get API key from environment variable
     api_key = get_api_key(
@@ -386,14 +670,10 @@ def speech_to_text_elevenlabs(
             try:
                 import soundfile as sf
 
-                audio_data, sample_rate = sf.read(audio_file_path)
-                # Convert to mono if needed
-                if len(audio_data.shape) > 1:
-                    audio_data = (
-                        audio_data[:, 0]
-                        if audio_data.shape[1] > 0
-                        else audio_data
-                    )
+                # Decode straight to int16, skipping a float64 copy
+                audio_data, sample_rate = sf.read(
+                    audio_file_path, dtype="int16"
+                )
             except ImportError:
                 raise ValueError(
                     "soundfile library is required for audio_file_path in real-time mode. "
@@ -404,25 +684,8 @@ def speech_to_text_elevenlabs(
                 "Either audio_file_path or audio_data must be provided for real-time mode."
             )
 
-        # Convert audio to appropriate format
-        if (
-            audio_data.dtype == np.float32
-            or audio_data.dtype == np.float64
-        ):
-            # Normalize to int16
-            audio_int16 = (audio_data * 32767.0).astype(np.int16)
-        elif audio_data.dtype == np.int16:
-            audio_int16 = audio_data
-        else:
-            audio_int16 = audio_data.astype(np.int16)
-
-        # Ensure mono
-        if len(audio_int16.shape) > 1:
-            audio_int16 = (
-                audio_int16[:, 0]
-                if audio_int16.shape[1] > 0
-                else audio_int16
-            )
+        # Mono int16 for the PCM/mu-law stream
+        audio_int16 = _mono_int16(audio_data)
 
         # Extract sample rate from audio_format
         format_to_rate = {
@@ -436,34 +699,18 @@ def speech_to_text_elevenlabs(
         }
         target_sample_rate = format_to_rate.get(audio_format, 16000)
 
-        # Resample if needed
+        # Resample if needed (band-limited polyphase, no aliasing)
         if sample_rate != target_sample_rate:
-            try:
-                import scipy.signal
+            audio_int16 = resample(
+                audio_int16, int(sample_rate), target_sample_rate
+            )
+            sample_rate = target_sample_rate
 
-                num_samples = int(
-                    len(audio_int16)
-                    * target_sample_rate
-                    / sample_rate
-                )
-                audio_int16 = scipy.signal.resample(
-                    audio_int16, num_samples
-                ).astype(np.int16)
-                sample_rate = target_sample_rate
-            except ImportError:
-                # Simple resampling without scipy (linear interpolation)
-                num_samples = int(
-                    len(audio_int16)
-                    * target_sample_rate
-                    / sample_rate
-                )
-                indices = np.linspace(
-                    0, len(audio_int16) - 1, num_samples
-                )
-                audio_int16 = np.interp(
-                    indices, np.arange(len(audio_int16)), audio_int16
-                ).astype(np.int16)
-                sample_rate = target_sample_rate
+        # ulaw_8000 expects G.711 mu-law bytes, one per sample
+        if audio_format == "ulaw_8000":
+            audio_payload = pcm_to_ulaw(audio_int16)
+        else:
+            audio_payload = audio_int16
 
         # Build WebSocket URL with query parameters
         base_url = (
@@ -510,8 +757,8 @@ def speech_to_text_elevenlabs(
                     )  # 100ms chunks
                     first_chunk = True
 
-                    for i in range(0, len(audio_int16), chunk_size):
-                        chunk = audio_int16[i : i + chunk_size]
+                    for i in range(0, len(audio_payload), chunk_size):
+                        chunk = audio_payload[i : i + chunk_size]
                         # Encode to base64
                         audio_bytes = chunk.tobytes()
                         audio_base64 = base64.b64encode(
@@ -607,172 +854,44 @@ def speech_to_text_elevenlabs(
 
     else:
         # Non-real-time file upload mode
-        url = "https://api.elevenlabs.io/v1/speech-to-text"
-
-        # Headers
-        headers = {
-            "xi-api-key": api_key,
-        }
-
-        # Determine which audio source to use
-        use_temp_file = False
-        temp_file_path = None
+        request = _prepare_elevenlabs_stt(
+            api_key,
+            model_id,
+            language_code,
+            tag_audio_events,
+            num_speakers,
+            timestamps_granularity,
+            diarize,
+            diarization_threshold,
+            file_format,
+            cloud_storage_url,
+            temperature,
+            seed,
+            use_multi_channel,
+            enable_logging,
+        )
 
         if cloud_storage_url:
             # Use cloud storage URL
-            file_path = None
-        elif audio_file_path:
-            # Use the provided file path
-            if not os.path.exists(audio_file_path):
-                raise IOError(
-                    f"Audio file not found: {audio_file_path}"
-                )
-            file_path = audio_file_path
-        elif audio_data is not None:
-            # Save audio data to a temporary file
-            try:
-                import soundfile as sf
-
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".wav"
-                )
-                temp_file_path = temp_file.name
-                temp_file.close()
-
-                # Convert audio data to float32 if needed
-                if audio_data.dtype == np.int16:
-                    audio_float = (
-                        audio_data.astype(np.float32) / 32768.0
-                    )
-                elif audio_data.dtype == np.float32:
-                    audio_float = audio_data
-                else:
-                    audio_float = audio_data.astype(np.float32)
-
-                # Ensure mono audio
-                if len(audio_float.shape) > 1:
-                    audio_float = (
-                        audio_float[:, 0]
-                        if audio_float.shape[1] > 0
-                        else audio_float
-                    )
-
-                # Save to temporary file
-                sf.write(temp_file_path, audio_float, sample_rate)
-                file_path = temp_file_path
-                use_temp_file = True
-            except ImportError:
-                raise ValueError(
-                    "soundfile library is required for audio_data input. "
-                    "Install it with: pip install soundfile"
-                )
+            response = _send_stt_request(request, None)
+        elif audio_file_path or audio_data is not None:
+            with _audio_upload(
+                audio_file_path,
+                audio_data,
+                sample_rate,
+                request.content_type,
+                # Raw PCM and per-channel uploads must reach the API as given
+                optimize=file_format == "other"
+                and not use_multi_channel,
+            ) as file_field:
+                # Make request to ElevenLabs API
+                response = _send_stt_request(request, file_field)
         else:
             raise ValueError(
                 "Either audio_file_path, audio_data, or cloud_storage_url must be provided."
             )
 
-        # Prepare multipart form data
-        files = None
-        data = {
-            "model_id": model_id,
-            "tag_audio_events": str(tag_audio_events).lower(),
-            "timestamps_granularity": timestamps_granularity,
-            "diarize": str(diarize).lower(),
-            "file_format": file_format,
-            "use_multi_channel": str(use_multi_channel).lower(),
-            "enable_logging": str(enable_logging).lower(),
-        }
-
-        if language_code:
-            data["language_code"] = language_code
-        if num_speakers is not None:
-            data["num_speakers"] = str(num_speakers)
-        if diarization_threshold is not None:
-            data["diarization_threshold"] = str(diarization_threshold)
-        if cloud_storage_url:
-            data["cloud_storage_url"] = cloud_storage_url
-        if temperature is not None:
-            data["temperature"] = str(temperature)
-        if seed is not None:
-            data["seed"] = str(seed)
-
-        if file_path:
-            files = {
-                "file": (
-                    os.path.basename(file_path),
-                    open(file_path, "rb"),
-                    "application/octet-stream",
-                )
-            }
-
-        try:
-            # Make request to ElevenLabs API
-            # Use longer timeout for large files
-            response = _http_client.post(
-                url,
-                headers=headers,
-                files=files,
-                data=data,
-                timeout=300.0,
-            )
-
-            # Check for authentication errors
-            if response.status_code == 401:
-                error_text = "No additional error details available"
-                try:
-                    if response.text:
-                        error_text = response.text
-                except Exception as e:
-                    error_text = (
-                        f"Could not read error response: {str(e)}"
-                    )
-
-                raise ValueError(
-                    f"Authentication failed (401). Please check your ELEVENLABS_API_KEY.\n"
-                    f"The API key may be invalid, expired, or not set correctly.\n"
-                    f"Error details: {error_text}\n"
-                    f"Get your API key from: https://elevenlabs.io/app/settings/api-keys"
-                )
-
-            response.raise_for_status()
-
-            # Parse response
-            result = response.json()
-
-            # Handle multi-channel response
-            if "transcripts" in result:
-                # Multi-channel response
-                transcripts = result["transcripts"]
-                # Combine all transcripts
-                text_parts = [t.get("text", "") for t in transcripts]
-                return " ".join(text_parts)
-            else:
-                # Single channel response
-                return result.get("text", "")
-
-        except httpx.HTTPStatusError as e:
-            # Re-raise ValueError if we already converted it
-            if isinstance(e, ValueError):
-                raise
-            # Otherwise, provide a generic error message
-            raise ValueError(
-                f"HTTP error {e.response.status_code}: {e.response.text}\n"
-                f"URL: {e.request.url}"
-            ) from e
-        finally:
-            # Clean up temporary file if we created one
-            if (
-                use_temp_file
-                and temp_file_path
-                and os.path.exists(temp_file_path)
-            ):
-                try:
-                    os.unlink(temp_file_path)
-                except Exception:
-                    pass
-            # Close the file handle
-            if files and files.get("file"):
-                files["file"][1].close()
+        return _parse_elevenlabs_stt_response(response)
 
 
 def speech_to_text_groq(
@@ -802,7 +921,7 @@ def speech_to_text_groq(
             If provided, audio_data will be ignored.
         audio_data (Optional[np.ndarray]): Raw audio data as numpy array.
             Should be float32 in range [-1, 1] or int16.
-            If provided without audio_file_path, will be saved to a temporary file.
+            If provided without audio_file_path, is encoded in memory for upload (see `configure_upload`).
         sample_rate (int): Sample rate of the audio data. Default is 16000.
             Only used when audio_data is provided.
         model (str): The model to use for transcription/translation.
@@ -856,187 +975,266 @@ def speech_to_text_groq(
         ...     timestamp_granularities=["word", "segment"]
         ... )
     """
-    import tempfile
+    request = _prepare_groq_stt(
+        model,
+        language,
+        prompt,
+        response_format,
+        temperature,
+        timestamp_granularities,
+        translate,
+    )
 
-    # Get API key from environment variable
-    api_key = get_api_key(
-        "GROQ_API_KEY",
-        "https://console.groq.com/keys",
+    with _audio_upload(
+        audio_file_path, audio_data, sample_rate, request.content_type
+    ) as file_field:
+        # Make request to Groq API
+        response = _send_stt_request(request, file_field)
+
+    return _parse_groq_stt_response(response, response_format)
+
+
+async def async_speech_to_text(
+    audio_file_path: Optional[str] = None,
+    audio_data: Optional[np.ndarray] = None,
+    sample_rate: int = 16000,
+    model: str = "whisper-1",
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+    response_format: str = "text",
+    temperature: float = 0.0,
+) -> str:
+    """
+    Async version of `speech_to_text` using OpenAI's Whisper API.
+
+    The upload runs on a pooled HTTP/2 `httpx.AsyncClient`, so many
+    transcriptions can be awaited concurrently from one event loop.
+
+    Args:
+        audio_file_path (Optional[str]): Path to an audio file to transcribe.
+        audio_data (Optional[np.ndarray]): Raw audio data as numpy array (float32 or int16).
+        sample_rate (int): Sample rate of the audio data. Default is 16000.
+        model (str): The Whisper model to use. Default is "whisper-1".
+        language (Optional[str]): Optional ISO-639-1 language code.
+        prompt (Optional[str]): Optional text to guide the model's style.
+        response_format (str): "json", "text", "srt", "verbose_json", or "vtt". Default is "text".
+        temperature (float): Sampling temperature between 0 and 1. Default is 0.0.
+
+    Returns:
+        str: The transcribed text.
+
+    Raises:
+        ValueError: If neither audio_file_path nor audio_data is provided, if
+            OPENAI_API_KEY is not set, or if the API returns an error.
+        IOError: If there's an error reading the audio file.
+
+    Example:
+        >>> text = await async_speech_to_text(audio_file_path="recording.wav")
+    """
+    request = _prepare_openai_stt(
+        model, language, prompt, response_format, temperature
     )
 
-    # Validate model
-    if model not in GROQ_STT_MODELS:
-        raise ValueError(
-            f"Invalid model '{model}'. Supported models: {', '.join(GROQ_STT_MODELS)}"
-        )
+    with _audio_upload(
+        audio_file_path, audio_data, sample_rate, request.content_type
+    ) as file_field:
+        response = await _asend_stt_request(request, file_field)
 
-    # Validate translate parameter
-    if translate and model != "whisper-large-v3":
-        raise ValueError(
-            f"Translation is only supported with 'whisper-large-v3' model, not '{model}'."
-        )
+    return _parse_openai_stt_response(response, response_format)
 
-    # Choose endpoint based on translate flag
-    if translate:
-        url = "https://api.groq.com/openai/v1/audio/translations"
-    else:
-        url = "https://api.groq.com/openai/v1/audio/transcriptions"
 
-    # Headers
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-    }
+async def _aiter_in_thread(
+    generator: Generator[dict, None, None],
+) -> AsyncGenerator[dict, None]:
+    """Drive a blocking generator from a worker thread, one item at a time."""
+    sentinel = object()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, generator, sentinel)
+            if item is sentinel:
+                break
+            yield item
+    finally:
+        await asyncio.to_thread(generator.close)
 
-    # Determine which audio source to use
-    use_temp_file = False
-    temp_file_path = None
 
-    if audio_file_path:
-        # Use the provided file path
-        if not os.path.exists(audio_file_path):
-            raise IOError(f"Audio file not found: {audio_file_path}")
-        file_path = audio_file_path
-    elif audio_data is not None:
-        # Save audio data to a temporary file
-        try:
-            import soundfile as sf
+async def async_speech_to_text_elevenlabs(
+    audio_file_path: Optional[str] = None,
+    audio_data: Optional[np.ndarray] = None,
+    sample_rate: int = 16000,
+    realtime: bool = False,
+    # Non-real-time parameters
+    model_id: str = "scribe_v1",
+    language_code: Optional[str] = None,
+    tag_audio_events: bool = True,
+    num_speakers: Optional[int] = None,
+    timestamps_granularity: Literal[
+        "none", "word", "character"
+    ] = "word",
+    diarize: bool = False,
+    diarization_threshold: Optional[float] = None,
+    file_format: Literal["pcm_s16le_16", "other"] = "other",
+    cloud_storage_url: Optional[str] = None,
+    temperature: Optional[float] = None,
+    seed: Optional[int] = None,
+    use_multi_channel: bool = False,
+    enable_logging: bool = True,
+    # Real-time parameters (only used when realtime=True)
+    audio_format: Literal[
+        "pcm_8000",
+        "pcm_16000",
+        "pcm_22050",
+        "pcm_24000",
+        "pcm_44100",
+        "pcm_48000",
+        "ulaw_8000",
+    ] = "pcm_16000",
+    commit_strategy: Literal["manual", "vad"] = "manual",
+    vad_silence_threshold_secs: float = 1.5,
+    vad_threshold: float = 0.4,
+    min_speech_duration_ms: int = 250,
+    min_silence_duration_ms: int = 2500,
+    include_timestamps: bool = False,
+    include_language_detection: bool = False,
+) -> Union[str, AsyncGenerator[dict, None]]:
+    """
+    Async version of `speech_to_text_elevenlabs`.
 
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=".wav"
-            )
-            temp_file_path = temp_file.name
-            temp_file.close()
-
-            # Convert audio data to float32 if needed
-            if audio_data.dtype == np.int16:
-                audio_float = audio_data.astype(np.float32) / 32768.0
-            elif audio_data.dtype == np.float32:
-                audio_float = audio_data
-            else:
-                audio_float = audio_data.astype(np.float32)
-
-            # Ensure mono audio
-            if len(audio_float.shape) > 1:
-                audio_float = (
-                    audio_float[:, 0]
-                    if audio_float.shape[1] > 0
-                    else audio_float
-                )
+    File uploads go through the pooled HTTP/2 `httpx.AsyncClient`. In
+    real-time mode the WebSocket session from `speech_to_text_elevenlabs`
+    is driven from a worker thread and its messages are yielded through an
+    async generator, so the event loop is never blocked.
 
-            # Save to temporary file
-            sf.write(temp_file_path, audio_float, sample_rate)
-            file_path = temp_file_path
-            use_temp_file = True
-        except ImportError:
-            raise ValueError(
-                "soundfile library is required for audio_data input. "
-                "Install it with: pip install soundfile"
+    Args:
+        See `speech_to_text_elevenlabs`; all parameters have the same meaning.
+
+    Returns:
+        Union[str, AsyncGenerator[dict, None]]:
+            - If realtime=False: The transcribed text.
+            - If realtime=True: An async generator of transcription messages.
+
+    Raises:
+        ValueError: If no audio source is provided, if ELEVENLABS_API_KEY is
+            not set, or if the API returns an error.
+        IOError: If there's an error reading the audio file.
+
+    Example:
+        >>> text = await async_speech_to_text_elevenlabs(audio_file_path="recording.wav")
+        >>>
+        >>> messages = await async_speech_to_text_elevenlabs(
+        ...     audio_data=recording, sample_rate=16000, realtime=True
+        ... )
+        >>> async for message in messages:
+        ...     print(message)
+    """
+    if realtime:
+        return _aiter_in_thread(
+            speech_to_text_elevenlabs(
+                audio_file_path=audio_file_path,
+                audio_data=audio_data,
+                sample_rate=sample_rate,
+                realtime=True,
+                model_id=model_id,
+                language_code=language_code,
+                enable_logging=enable_logging,
+                audio_format=audio_format,
+                commit_strategy=commit_strategy,
+                vad_silence_threshold_secs=vad_silence_threshold_secs,
+                vad_threshold=vad_threshold,
+                min_speech_duration_ms=min_speech_duration_ms,
+                min_silence_duration_ms=min_silence_duration_ms,
+                include_timestamps=include_timestamps,
+                include_language_detection=include_language_detection,
             )
-    else:
-        raise ValueError(
-            "Either audio_file_path or audio_data must be provided."
         )
 
-    # Prepare form data
-    files = {
-        "file": (
-            os.path.basename(file_path),
-            open(file_path, "rb"),
-            "audio/wav",
-        )
-    }
+    # Get API key from environment variable
+    api_key = get_api_key(
+        "ELEVENLABS_API_KEY",
+        "https://elevenlabs.io/app/settings/api-keys",
+    )
 
-    data = {
-        "model": model,
-        "response_format": response_format,
-        "temperature": str(temperature),
-    }
+    request = _prepare_elevenlabs_stt(
+        api_key,
+        model_id,
+        language_code,
+        tag_audio_events,
+        num_speakers,
+        timestamps_granularity,
+        diarize,
+        diarization_threshold,
+        file_format,
+        cloud_storage_url,
+        temperature,
+        seed,
+        use_multi_channel,
+        enable_logging,
+    )
 
-    if language:
-        data["language"] = language
+    if cloud_storage_url:
+        response = await _asend_stt_request(request, None)
+    elif audio_file_path or audio_data is not None:
+        with _audio_upload(
+            audio_file_path,
+            audio_data,
+            sample_rate,
+            request.content_type,
+            # Raw PCM and per-channel uploads must reach the API as given
+            optimize=file_format == "other" and not use_multi_channel,
+        ) as file_field:
+            response = await _asend_stt_request(request, file_field)
+    else:
+        raise ValueError(
+            "Either audio_file_path, audio_data, or cloud_storage_url must be provided."
+        )
 
-    if prompt:
-        data["prompt"] = prompt
+    return _parse_elevenlabs_stt_response(response)
 
-    # Add timestamp_granularities if provided and response_format is verbose_json
-    if timestamp_granularities and response_format == "verbose_json":
-        # Groq API (OpenAI-compatible) expects this as an array
-        # Send as JSON-encoded string, which is commonly accepted by OpenAI-compatible APIs
-        import json
 
-        data["timestamp_granularities"] = json.dumps(
-            timestamp_granularities
-        )
+async def async_speech_to_text_groq(
+    audio_file_path: Optional[str] = None,
+    audio_data: Optional[np.ndarray] = None,
+    sample_rate: int = 16000,
+    model: str = "whisper-large-v3-turbo",
+    language: Optional[str] = None,
+    prompt: Optional[str] = None,
+    response_format: str = "text",
+    temperature: float = 0.0,
+    timestamp_granularities: Optional[
+        List[Literal["word", "segment"]]
+    ] = None,
+    translate: bool = False,
+) -> str:
+    """
+    Async version of `speech_to_text_groq` using Groq's Whisper API.
 
-    try:
-        # Make request to Groq API
-        # Use longer timeout for large files
-        response = _http_client.post(
-            url,
-            headers=headers,
-            files=files,
-            data=data,
-            timeout=300.0,
-        )
+    Args:
+        See `speech_to_text_groq`; all parameters have the same meaning.
 
-        # Check for authentication errors
-        if response.status_code == 401:
-            error_text = "No additional error details available"
-            try:
-                if response.text:
-                    error_text = response.text
-            except Exception as e:
-                error_text = (
-                    f"Could not read error response: {str(e)}"
-                )
+    Returns:
+        str: The transcribed (or translated) text.
 
-            raise ValueError(
-                f"Authentication failed (401). Please check your GROQ_API_KEY.\n"
-                f"The API key may be invalid, expired, or not set correctly.\n"
-                f"Error details: {error_text}\n"
-                f"Get your API key from: https://console.groq.com/keys"
-            )
+    Raises:
+        ValueError: If no audio source is provided, if GROQ_API_KEY is not set,
+            if the model is invalid, or if the API returns an error.
+        IOError: If there's an error reading the audio file.
 
-        response.raise_for_status()
+    Example:
+        >>> text = await async_speech_to_text_groq(audio_file_path="recording.wav")
+    """
+    request = _prepare_groq_stt(
+        model,
+        language,
+        prompt,
+        response_format,
+        temperature,
+        timestamp_granularities,
+        translate,
+    )
 
-        # Parse response based on format
-        if response_format == "text":
-            return response.text.strip()
-        elif response_format == "json":
-            result = response.json()
-            return result.get("text", "")
-        elif response_format == "verbose_json":
-            result = response.json()
-            # Return the full JSON as a string, or extract text if available
-            if isinstance(result, dict) and "text" in result:
-                return result.get("text", "")
-            else:
-                # Return the full JSON string representation
-                import json
-
-                return json.dumps(result, indent=2, default=str)
-        else:
-            return response.text.strip()
-    except httpx.HTTPStatusError as e:
-        # Re-raise ValueError if we already converted it
-        if isinstance(e, ValueError):
-            raise
-        # Otherwise, provide a generic error message
-        raise ValueError(
-            f"HTTP error {e.response.status_code}: {e.response.text}\n"
-            f"URL: {e.request.url}"
-        ) from e
-    finally:
-        # Clean up temporary file if we created one
-        if (
-            use_temp_file
-            and temp_file_path
-            and os.path.exists(temp_file_path)
-        ):
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
-        # Close the file handle
-        if "files" in locals() and files.get("file"):
-            files["file"][1].close()
+    with _audio_upload(
+        audio_file_path, audio_data, sample_rate, request.content_type
+    ) as file_field:
+        response = await _asend_stt_request(request, file_field)
+
+    return _parse_groq_stt_response(response, response_format)
@@ -0,0 +1,330 @@
+import threading
+from dataclasses import asdict, dataclass
+from typing import Generator, Iterable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+@dataclass
+class StitchSettings:
+    """
+    How consecutive TTS responses are joined before playback.
+
+    Providers pad every response with silence, which adds up to several
+    hundred milliseconds of dead air at each sentence boundary when sentences
+    are synthesized one request at a time (`stream_mode=True`).
+
+    Attributes:
+        enabled (bool): Trim and crossfade played audio. Default is True.
+        threshold_db (float): Frames whose RMS is below this level (dBFS) count
+            as silence. Default is -50.0.
+        frame_ms (float): Length of the frames the energy is measured on. Default is 5.0.
+        keep_ms (float): Silence kept at each trimmed edge, so consonants and
+            breaths are not clipped. Default is 30.0.
+        crossfade_ms (float): Length of the linear crossfade between one
+            response and the next. 0 disables it. Default is 8.0.
+    """
+
+    enabled: bool = True
+    threshold_db: float = -50.0
+    frame_ms: float = 5.0
+    keep_ms: float = 30.0
+    crossfade_ms: float = 8.0
+
+
+@dataclass
+class StitchStats:
+    """
+    Counters returned by `get_stitch_stats`.
+
+    Attributes:
+        utterances (int): Responses that went through the stitcher.
+        leading_ms (float): Leading silence removed.
+        trailing_ms (float): Trailing silence removed.
+        crossfade_ms (float): Audio overlapped by crossfades.
+        removed_ms (float): Total playback time removed.
+    """
+
+    utterances: int = 0
+    leading_ms: float = 0.0
+    trailing_ms: float = 0.0
+    crossfade_ms: float = 0.0
+    removed_ms: float = 0.0
+
+
+class SentenceStitcher:
+    """
+    Join a sequence of streamed responses into gap-free audio.
+
+    Each response's leading and trailing silence is cut down to `keep_ms`,
+    found with a vectorized per-frame energy threshold over the incoming
+    blocks, and the end of every response is crossfaded into the start of
+    the next. Audio is passed through as it arrives: only the trailing
+    silence seen so far and the crossfade region are held back.
+
+    Args:
+        sample_rate (int): Sample rate of the audio.
+        settings (Optional[StitchSettings]): Thresholds and lengths. Default is `StitchSettings()`.
+
+    Attributes:
+        stats (StitchStats): What has been removed so far.
+
+    Example:
+        >>> stitcher = SentenceStitcher(24000)
+        >>> for samples in stitcher.stitch(per_sentence_sample_blocks):
+        ...     sink.write(samples, 24000)
+        >>> stitcher.stats.removed_ms
+        412.5
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        settings: Optional[StitchSettings] = None,
+    ):
+        settings = settings or StitchSettings()
+        self.sample_rate = sample_rate
+        self._frame = max(
+            1, int(sample_rate * settings.frame_ms / 1000)
+        )
+        self._keep = int(sample_rate * settings.keep_ms / 1000)
+        self._fade = int(sample_rate * settings.crossfade_ms / 1000)
+        # Mean square of a frame at the threshold, in int16 units
+        self._threshold = (
+            32768.0 * 10 ** (settings.threshold_db / 20.0)
+        ) ** 2
+        self.stats = StitchStats()
+
+    def _ms(self, frames: int) -> float:
+        return 1000.0 * int(frames) / self.sample_rate
+
+    def _loud_frames(self, samples: np.ndarray) -> np.ndarray:
+        """Indices of the complete frames of `samples` above the threshold."""
+        count = len(samples) // self._frame
+        frames = (
+            samples[: count * self._frame]
+            .astype(np.float32)
+            .reshape(count, self._frame)
+        )
+        energy = np.einsum("ij,ij->i", frames, frames) / self._frame
+        return np.flatnonzero(energy > self._threshold)
+
+    def _iter_trimmed(
+        self, blocks: Iterable[np.ndarray]
+    ) -> Generator[np.ndarray, None, None]:
+        """Yield one response's audio without its excess leading and trailing silence."""
+        pending = np.zeros(0, dtype=np.int16)
+        leading = True
+        # After the leading edge: quiet whole frames already scanned (held
+        # back as possible trailing silence) and the unscanned partial frame,
+        # so every sample is measured once however long a pause lasts
+        held: List[np.ndarray] = []
+        for block in blocks:
+            if len(block) == 0:
+                continue
+            pending = np.concatenate([pending, block])
+            if leading:
+                loud = self._loud_frames(pending)
+                if not len(loud):
+                    # Still silent: only the last `keep` samples can survive
+                    whole = len(pending) // self._frame * self._frame
+                    drop = max(0, whole - self._keep)
+                    self.stats.leading_ms += self._ms(drop)
+                    pending = pending[drop:]
+                    continue
+                start = max(0, loud[0] * self._frame - self._keep)
+                self.stats.leading_ms += self._ms(start)
+                pending = pending[start:]
+                leading = False
+            loud = self._loud_frames(pending)
+            whole = len(pending) // self._frame * self._frame
+            if len(loud):
+                # Everything up to the last loud frame is final
+                end = (loud[-1] + 1) * self._frame
+                yield np.concatenate(held + [pending[:end]])
+                held = []
+            else:
+                end = 0
+            if whole > end:
+                held.append(pending[end:whole])
+            pending = pending[whole:]
+
+        if leading:
+            # Silence throughout (or shorter than a frame): keep `keep_ms` of
+            # it, like any other trimmed edge
+            excess = max(0, len(pending) - self._keep)
+            self.stats.leading_ms += self._ms(excess)
+            if len(pending) > excess:
+                yield pending[excess:]
+            return
+        pending = np.concatenate(held + [pending])
+        excess = max(0, len(pending) - self._keep)
+        self.stats.trailing_ms += self._ms(excess)
+        if len(pending) > excess:
+            yield pending[: len(pending) - excess]
+
+    def _crossfade(
+        self, tail: np.ndarray, head: np.ndarray
+    ) -> np.ndarray:
+        """Overlap the end of one response with the start of the next."""
+        length = min(len(tail), len(head))
+        ramp = (np.arange(length, dtype=np.float32) + 0.5) / length
+        mixed = tail[len(tail) - length :] * (1.0 - ramp) + (
+            head[:length] * ramp
+        )
+        self.stats.crossfade_ms += self._ms(length)
+        return np.concatenate(
+            [
+                tail[: len(tail) - length],
+                np.clip(np.rint(mixed), -32768, 32767).astype(
+                    np.int16
+                ),
+                head[length:],
+            ]
+        )
+
+    def stitch(
+        self, utterances: Iterable[Iterable[np.ndarray]]
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Trim and crossfade a sequence of responses.
+
+        Args:
+            utterances: One iterable of mono int16 sample blocks per response,
+                in playback order.
+
+        Yields:
+            np.ndarray: int16 samples ready to play.
+        """
+        # End of the previous response, kept back to crossfade into the next
+        tail = np.zeros(0, dtype=np.int16)
+        try:
+            for blocks in utterances:
+                self.stats.utterances += 1
+                first = True
+                for samples in self._iter_trimmed(blocks):
+                    if first and len(tail) and self._fade:
+                        samples = self._crossfade(tail, samples)
+                        tail = np.zeros(0, dtype=np.int16)
+                    first = False
+                    if len(tail):
+                        samples = np.concatenate([tail, samples])
+                    split = max(0, len(samples) - self._fade)
+                    if split:
+                        yield samples[:split]
+                    tail = samples[split:]
+            if len(tail):
+                yield tail
+        finally:
+            self.stats.removed_ms = (
+                self.stats.leading_ms
+                + self.stats.trailing_ms
+                + self.stats.crossfade_ms
+            )
+
+
+_settings = StitchSettings()
+_stats = StitchStats()
+_stats_lock = threading.Lock()
+
+
+def configure_stitching(
+    enabled: bool = True,
+    threshold_db: float = -50.0,
+    keep_ms: float = 30.0,
+    crossfade_ms: float = 8.0,
+    frame_ms: float = 5.0,
+) -> None:
+    """
+    Configure the silence trimming and crossfading applied to played TTS audio.
+
+    Args:
+        enabled (bool): Trim and crossfade played audio. Default is True.
+        threshold_db (float): Frame RMS level (dBFS) below which audio is silence. Default is -50.0.
+        keep_ms (float): Silence kept at each trimmed edge. Default is 30.0.
+        crossfade_ms (float): Crossfade between consecutive responses. Default is 8.0.
+        frame_ms (float): Energy measurement frame length. Default is 5.0.
+
+    Example:
+        >>> configure_stitching(keep_ms=60.0)  # leave more natural pauses
+        >>> configure_stitching(enabled=False)  # play responses untouched
+    """
+    global _settings
+    _settings = StitchSettings(
+        enabled=enabled,
+        threshold_db=threshold_db,
+        frame_ms=frame_ms,
+        keep_ms=keep_ms,
+        crossfade_ms=crossfade_ms,
+    )
+
+
+def get_stitch_stats() -> dict:
+    """
+    Return the silence removed from played audio so far.
+
+    Returns:
+        dict: `StitchStats` fields, e.g. `removed_ms`.
+
+    Example:
+        >>> get_stitch_stats()["removed_ms"]
+        1240.0
+    """
+    with _stats_lock:
+        return asdict(_stats)
+
+
+def reset_stitch_stats() -> None:
+    """Zero all counters."""
+    global _stats
+    with _stats_lock:
+        _stats = StitchStats()
+
+
+def stitch_utterances(
+    utterances: Iterable[Iterable[np.ndarray]],
+    sample_rate: int,
+) -> Generator[np.ndarray, None, None]:
+    """
+    Trim and crossfade consecutive responses with the configured settings.
+
+    Playback paths run every response through this before the sink. Removed
+    time is added to `get_stitch_stats()` and logged.
+
+    Args:
+        utterances: One iterable of mono int16 sample blocks per response.
+        sample_rate (int): Sample rate of the audio.
+
+    Yields:
+        np.ndarray: int16 samples ready to play.
+    """
+    settings = _settings
+    if not settings.enabled:
+        for blocks in utterances:
+            yield from blocks
+        return
+
+    stitcher = SentenceStitcher(sample_rate, settings)
+    try:
+        yield from stitcher.stitch(utterances)
+    finally:
+        stats = stitcher.stats
+        with _stats_lock:
+            for field, value in asdict(stats).items():
+                if field != "removed_ms":
+                    setattr(
+                        _stats, field, getattr(_stats, field) + value
+                    )
+            _stats.removed_ms = (
+                _stats.leading_ms
+                + _stats.trailing_ms
+                + _stats.crossfade_ms
+            )
+        if stats.utterances:
+            logger.debug(
+                f"✂️  Stitched {stats.utterances} response(s): removed "
+                f"{stats.removed_ms:.0f} ms "
+                f"(leading {stats.leading_ms:.0f}, trailing {stats.trailing_ms:.0f}, "
+                f"crossfade {stats.crossfade_ms:.0f})"
+            )
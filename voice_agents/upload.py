@@ -0,0 +1,372 @@
+import io
+import os
+import threading
+import time
+import wave
+from dataclasses import asdict, dataclass
+from typing import Iterable, Literal, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from voice_agents.resample import Resampler, resample
+
+UploadFormat = Literal["flac", "opus", "wav"]
+
+# Sample rates the Opus encoder accepts
+_OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Files are decoded, downmixed and resampled this many seconds at a time
+_BLOCK_SECONDS = 30
+
+# soundfile (format, subtype), file extension and MIME type per upload format
+_FORMATS = {
+    "flac": ("FLAC", "PCM_16", "flac", "audio/flac"),
+    "opus": ("OGG", "OPUS", "ogg", "audio/ogg"),
+    "wav": ("WAV", "PCM_16", "wav", "audio/wav"),
+}
+
+
+@dataclass
+class UploadSettings:
+    """
+    How audio is preprocessed before it is uploaded for transcription.
+
+    Whisper and Scribe transcribe 16 kHz mono audio, so a 44.1/48 kHz stereo
+    recording spends most of its upload on data the model throws away. With
+    preprocessing enabled, audio is downmixed, resampled to `sample_rate`
+    and encoded as `format` locally, which cuts the upload several times
+    over on a constrained uplink.
+
+    Attributes:
+        enabled (bool): Preprocess `audio_data` and decodable audio files.
+            Default is False; `configure_upload()` turns it on.
+        format (UploadFormat): "flac" (lossless), "opus" (lossy, smallest) or
+            "wav" (16-bit PCM). Default is "flac".
+        sample_rate (int): Rate audio above it is resampled to. Audio at a
+            lower rate is not upsampled. Default is 16000.
+    """
+
+    enabled: bool = False
+    format: UploadFormat = "flac"
+    sample_rate: int = 16000
+
+
+@dataclass
+class UploadStats:
+    """
+    Counters returned by `get_upload_stats`.
+
+    Attributes:
+        uploads (int): Uploads that were preprocessed.
+        skipped (int): Files uploaded unchanged because they could not be
+            decoded or re-encoding did not make them smaller.
+        original_bytes (int): Size of those uploads before preprocessing
+            (16-bit WAV at the source rate for numpy audio).
+        uploaded_bytes (int): Size actually uploaded.
+        encode_ms (float): Time spent decoding, resampling and encoding.
+    """
+
+    uploads: int = 0
+    skipped: int = 0
+    original_bytes: int = 0
+    uploaded_bytes: int = 0
+    encode_ms: float = 0.0
+
+
+_settings = UploadSettings()
+_stats = UploadStats()
+_stats_lock = threading.Lock()
+
+
+def configure_upload(
+    enabled: bool = True,
+    format: UploadFormat = "flac",
+    sample_rate: int = 16000,
+) -> None:
+    """
+    Configure the preprocessing applied to speech-to-text uploads.
+
+    Preprocessing is off until this is called, so uploads are unchanged
+    unless an application opts in.
+
+    Args:
+        enabled (bool): Downmix, resample and re-encode uploads. Default is True.
+        format (UploadFormat): "flac", "opus" or "wav". Default is "flac".
+        sample_rate (int): Target sample rate in Hz. Default is 16000.
+
+    Raises:
+        ValueError: If the format is unknown, or Opus is used with a sample
+            rate its encoder does not support.
+
+    Example:
+        >>> configure_upload()  # FLAC at 16 kHz
+        >>> configure_upload(format="opus")  # smallest uploads
+        >>> configure_upload(enabled=False)  # upload audio untouched
+    """
+    global _settings
+    if format not in _FORMATS:
+        raise ValueError(
+            f"Invalid upload format '{format}'. Supported formats: {', '.join(_FORMATS)}"
+        )
+    if format == "opus" and sample_rate not in _OPUS_SAMPLE_RATES:
+        raise ValueError(
+            f"Opus supports sample rates {', '.join(map(str, _OPUS_SAMPLE_RATES))}, got {sample_rate}"
+        )
+    _settings = UploadSettings(
+        enabled=enabled, format=format, sample_rate=sample_rate
+    )
+
+
+def get_upload_stats() -> dict:
+    """
+    Return how much upload volume preprocessing has saved so far.
+
+    Returns:
+        dict: `UploadStats` fields, e.g. `original_bytes` and `uploaded_bytes`.
+
+    Example:
+        >>> stats = get_upload_stats()
+        >>> stats["uploaded_bytes"] / stats["original_bytes"]
+        0.12
+    """
+    with _stats_lock:
+        return asdict(_stats)
+
+
+def reset_upload_stats() -> None:
+    """Zero all counters."""
+    global _stats
+    with _stats_lock:
+        _stats = UploadStats()
+
+
+def _wav_bytes(samples: np.ndarray, sample_rate: int) -> io.BytesIO:
+    """Encode mono int16 samples as a 16-bit WAV in memory."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(int(sample_rate))
+        wav_file.writeframes(np.ascontiguousarray(samples))
+    buffer.seek(0)
+    return buffer
+
+
+def _downmix(audio_data: np.ndarray) -> np.ndarray:
+    """
+    Average all channels into one, as int16 or float32 samples.
+
+    Mono int16 and float32 input is returned without a copy. Other integer
+    types are scaled to [-1.0, 1.0].
+    """
+    audio = np.asarray(audio_data)
+    integer = np.issubdtype(audio.dtype, np.integer)
+    if audio.ndim > 1:
+        if audio.shape[1] == 1:
+            audio = audio[:, 0]
+        else:
+            audio = audio.mean(axis=1, dtype=np.float32)
+            if integer:
+                audio /= np.iinfo(audio_data.dtype).max + 1
+            return audio
+    if audio.dtype == np.int16 or audio.dtype == np.float32:
+        return audio
+    if integer:
+        return np.divide(
+            audio, np.iinfo(audio.dtype).max + 1, dtype=np.float32
+        )
+    return audio.astype(np.float32)
+
+
+def _mono_blocks(
+    blocks: Iterable[np.ndarray], sample_rate: int, max_rate: int
+) -> Tuple[np.ndarray, int]:
+    """
+    Downmix blocks of audio and resample them to at most `max_rate`.
+
+    Only one block is converted at a time, so memory is bounded by the
+    output rather than by the input's rate and channel count.
+
+    Returns:
+        Tuple[np.ndarray, int]: Mono int16 or float32 samples and their rate.
+    """
+    resampler = (
+        Resampler(int(sample_rate), max_rate)
+        if sample_rate > max_rate
+        else None
+    )
+    parts = []
+    for block in blocks:
+        mono = _downmix(block)
+        parts.append(resampler.push(mono) if resampler else mono)
+    if resampler:
+        parts.append(resampler.flush())
+    samples = (
+        np.concatenate(parts) if parts else np.zeros(0, np.int16)
+    )
+    return samples, int(min(sample_rate, max_rate))
+
+
+def _read_mono(
+    audio_file_path: str, max_rate: int
+) -> Tuple[np.ndarray, int]:
+    """
+    Decode an audio file block by block into mono samples at most `max_rate`.
+
+    Raises:
+        ValueError: If soundfile is missing.
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        raise ValueError(
+            "soundfile library is required to decode audio files. "
+            "Install it with: pip install soundfile"
+        )
+
+    sample_rate = sf.info(audio_file_path).samplerate
+    return _mono_blocks(
+        sf.blocks(
+            audio_file_path,
+            blocksize=sample_rate * _BLOCK_SECONDS,
+            dtype="int16",
+            always_2d=True,
+        ),
+        sample_rate,
+        max_rate,
+    )
+
+
+def encode_audio(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    format: UploadFormat = "flac",
+    target_sample_rate: int = 16000,
+) -> Tuple[io.BytesIO, str, str]:
+    """
+    Downmix, resample and encode audio into an in-memory upload.
+
+    Args:
+        audio_data (np.ndarray): Samples, (frames,) or (frames, channels).
+            Float audio should be in [-1.0, 1.0].
+        sample_rate (int): Sample rate of `audio_data` in Hz.
+        format (UploadFormat): "flac", "opus" or "wav". Default is "flac".
+        target_sample_rate (int): Audio above this rate is resampled to it.
+            Default is 16000.
+
+    Returns:
+        Tuple[io.BytesIO, str, str]: The encoded audio, its filename and MIME type.
+
+    Raises:
+        ValueError: If the format is unknown, or FLAC/Opus is requested and
+            soundfile is missing.
+
+    Example:
+        >>> buffer, filename, content_type = encode_audio(recording, 48000)
+        >>> filename, content_type
+        ('audio.flac', 'audio/flac')
+    """
+    if format not in _FORMATS:
+        raise ValueError(
+            f"Invalid upload format '{format}'. Supported formats: {', '.join(_FORMATS)}"
+        )
+    container, subtype, extension, content_type = _FORMATS[format]
+    samples = _downmix(audio_data)
+    if sample_rate > target_sample_rate:
+        samples = resample(
+            samples, int(sample_rate), target_sample_rate
+        )
+        sample_rate = target_sample_rate
+    if format == "opus" and sample_rate not in _OPUS_SAMPLE_RATES:
+        # Lower rates are upsampled to the nearest rate Opus can encode
+        rate = min(r for r in _OPUS_SAMPLE_RATES if r >= sample_rate)
+        samples = resample(samples, int(sample_rate), rate)
+        sample_rate = rate
+
+    if format == "wav":
+        if samples.dtype != np.int16:
+            scaled = np.multiply(samples, 32767.0, dtype=np.float32)
+            np.rint(scaled, out=scaled)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            samples = scaled.astype(np.int16)
+        buffer = _wav_bytes(samples, sample_rate)
+    else:
+        try:
+            import soundfile as sf
+        except ImportError:
+            raise ValueError(
+                f"soundfile library is required for {format} uploads. "
+                "Install it with: pip install soundfile"
+            )
+        buffer = io.BytesIO()
+        sf.write(
+            buffer,
+            samples,
+            int(sample_rate),
+            format=container,
+            subtype=subtype,
+        )
+        buffer.seek(0)
+    return buffer, f"audio.{extension}", content_type
+
+
+def _record(original: int, uploaded: int, started: float) -> None:
+    with _stats_lock:
+        _stats.uploads += 1
+        _stats.original_bytes += original
+        _stats.uploaded_bytes += uploaded
+        _stats.encode_ms += (time.perf_counter() - started) * 1000.0
+
+
+def _optimized_upload(
+    audio_file_path: Optional[str],
+    audio_data: Optional[np.ndarray],
+    sample_rate: int,
+) -> Optional[Tuple[str, io.BytesIO, str]]:
+    """
+    Preprocess an upload according to the configured `UploadSettings`.
+
+    Returns:
+        Optional[Tuple[str, io.BytesIO, str]]: The multipart `file` field, or
+            None to upload the audio the usual way (preprocessing disabled,
+            soundfile missing, a file it cannot decode, or no size gain).
+    """
+    settings = _settings
+    if not settings.enabled:
+        return None
+    started = time.perf_counter()
+    try:
+        if audio_file_path:
+            original = os.path.getsize(audio_file_path)
+            audio_data, sample_rate = _read_mono(
+                audio_file_path, settings.sample_rate
+            )
+        else:
+            audio = np.asarray(audio_data)
+            frames = audio.shape[0] if audio.ndim else 0
+            original = 44 + 2 * frames
+        buffer, filename, content_type = encode_audio(
+            audio_data,
+            sample_rate,
+            format=settings.format,
+            target_sample_rate=settings.sample_rate,
+        )
+    except Exception as error:
+        # ImportError, or a container libsndfile cannot decode (m4a, webm, ...)
+        logger.debug(f"⚠️ Uploading audio unprocessed: {error}")
+        with _stats_lock:
+            _stats.skipped += 1
+        return None
+
+    uploaded = buffer.getbuffer().nbytes
+    if audio_file_path and uploaded >= original:
+        # Already compact (e.g. a low-bitrate MP3); send the file as is
+        with _stats_lock:
+            _stats.skipped += 1
+        return None
+    _record(original, uploaded, started)
+    logger.debug(
+        f"📦 STT upload {original} -> {uploaded} bytes ({filename})"
+    )
+    return (filename, buffer, content_type)
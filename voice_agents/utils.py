@@ -1,14 +1,20 @@
+import asyncio
 import os
-import re
-from typing import List
+from typing import AsyncIterable, Generator, Iterable, List, Optional
 
 import numpy as np
-import sounddevice as sd
+
+from voice_agents.g711 import alaw_to_pcm, ulaw_to_pcm
+from voice_agents.mp3 import iter_mp3_samples
+from voice_agents.segmenter import get_segmenter
+from voice_agents.sinks import AudioSink, _resolve_sink
 
 SAMPLE_RATE = 24000
 
 
-def format_text_for_speech(text: str) -> List[str]:
+def format_text_for_speech(
+    text: str, language: str = "en"
+) -> List[str]:
     """
     Format a long string into a list of speech-friendly chunks by splitting on
     sentence boundaries and other natural speech pauses.
@@ -27,104 +33,217 @@ def format_text_for_speech(text: str) -> List[str]:
     - URLs and email addresses
     - Multiple consecutive punctuation marks
 
+    The work is done by a `SentenceSegmenter` compiled once per language, in
+    a single pass over the text.
+
     Args:
         text: Long string of text to format
+        language: Abbreviation list to use, a key of `ABBREVIATIONS`
+            ("en", "de", "fr", "es"). Default is "en".
 
     Returns:
         List of formatted text chunks, stripped of whitespace and filtered
         to remove empty strings
     """
-    if not text or not text.strip():
-        return []
-
-    # Common abbreviations that shouldn't split sentences
-    abbreviations = [
-        r"\bDr\.",
-        r"\bMr\.",
-        r"\bMrs\.",
-        r"\bMs\.",
-        r"\bProf\.",
-        r"\bSr\.",
-        r"\bJr\.",
-        r"\bInc\.",
-        r"\bLtd\.",
-        r"\bCorp\.",
-        r"\bvs\.",
-        r"\betc\.",
-        r"\be\.g\.",
-        r"\bi\.e\.",
-        r"\bU\.S\.A\.",
-        r"\bU\.K\.",
-        r"\bA\.I\.",
-        r"\bPh\.D\.",
-        r"\bM\.D\.",
-        r"\bB\.A\.",
-        r"\bM\.A\.",
-        r"\bB\.S\.",
-        r"\bM\.S\.",
-    ]
-
-    # Split on sentence boundaries, but be smart about it
-    # Split on: . ! ? followed by space or end of string
-    # Also split on: newlines, semicolons, colons (when followed by space)
-
-    # First, protect abbreviations by temporarily replacing them
-    protected_text = text
-    abbrev_map = {}
-    for i, abbrev in enumerate(abbreviations):
-        placeholder = f"__ABBREV_{i}__"
-        protected_text = re.sub(abbrev, placeholder, protected_text)
-        abbrev_map[placeholder] = abbrev.replace("\\b", "").replace(
-            "\\.", "."
-        )
+    return get_segmenter(language).split(text)
+
+
+def _play_samples(
+    samples: np.ndarray,
+    sample_rate: int,
+    sink: Optional[AudioSink] = None,
+) -> None:
+    """Write one complete utterance to the sink and wait until it is delivered."""
+    sink = _resolve_sink(sink)
+    try:
+        sink.write(samples, sample_rate)
+    except BaseException:
+        sink.clear()
+        raise
+    sink.drain()
+
+
+def play_audio(
+    audio_data: np.ndarray, sink: Optional[AudioSink] = None
+) -> None:
+    """
+    Play audio data and wait until it is played.
+
+    Args:
+        audio_data: Audio data as numpy array of int16 samples
+        sink: Where to send the audio. None uses the default sink (the sound card).
+    """
+    if len(audio_data) > 0:
+        _play_samples(audio_data, SAMPLE_RATE, sink)
 
-    # Split on sentence boundaries
-    # Pattern: sentence ending (. ! ?) followed by whitespace or end of string
-    # Also split on newlines, semicolons, and colons (when followed by space)
-    split_pattern = (
-        r"(?<=[.!?])\s+|(?<=[.!?])$|\n+|(?<=;)\s+|(?<=:\s)"
-    )
 
-    chunks = re.split(split_pattern, protected_text)
+def _audio_segment_samples(audio_segment) -> np.ndarray:
+    """Convert a decoded pydub AudioSegment to mono float32 samples in [-1, 1]."""
+    # Convert to numpy array
+    audio_data = np.array(audio_segment.get_array_of_samples())
 
-    # Restore abbreviations and clean up chunks
-    result = []
+    # Handle stereo to mono conversion if needed
+    if audio_segment.channels == 2:
+        audio_data = audio_data.reshape((-1, 2)).mean(axis=1)
+
+    # Normalize to float32
+    if audio_segment.sample_width == 1:
+        # 8-bit audio
+        return audio_data.astype(np.float32) / 128.0 - 1.0
+    elif audio_segment.sample_width == 4:
+        # 32-bit audio
+        return audio_data.astype(np.float32) / 2147483648.0
+    # 16-bit audio
+    return audio_data.astype(np.float32) / 32768.0
+
+
+class _PCMSampleAligner:
+    """
+    Split raw 16-bit PCM bytes into whole samples across chunk boundaries.
+
+    Network chunks can split a 2-byte sample in half, so any odd trailing byte
+    is carried over and prepended to the next chunk instead of being dropped.
+    Shared by the sync and async PCM readers.
+    """
+
+    def __init__(self):
+        self._carry = b""
+
+    def push(self, chunk: bytes) -> Optional[np.ndarray]:
+        """Return the complete int16 samples available after adding chunk, if any."""
+        if not chunk:
+            return None
+        if self._carry:
+            chunk = self._carry + chunk
+            self._carry = b""
+        usable = len(chunk) - (len(chunk) % 2)
+        if usable < len(chunk):
+            self._carry = chunk[usable:]
+        if not usable:
+            return None
+        return np.frombuffer(chunk, dtype=np.int16, count=usable // 2)
+
+
+def iter_pcm_samples(
+    chunks: Iterable[bytes],
+) -> Generator[np.ndarray, None, None]:
+    """
+    Turn a stream of raw 16-bit PCM bytes into sample-aligned int16 arrays.
+
+    Network chunks can split a 2-byte sample in half, so any odd trailing byte
+    is carried over and prepended to the next chunk instead of being dropped.
+
+    Args:
+        chunks: Iterable of raw little-endian 16-bit PCM bytes (e.g. `response.iter_bytes()`).
+
+    Yields:
+        np.ndarray: int16 samples for every complete sample received so far.
+    """
+    aligner = _PCMSampleAligner()
     for chunk in chunks:
-        if not chunk or not chunk.strip():
-            continue
-
-        # Restore abbreviations
-        restored_chunk = chunk
-        for placeholder, abbrev in abbrev_map.items():
-            restored_chunk = restored_chunk.replace(
-                placeholder, abbrev
-            )
+        samples = aligner.push(chunk)
+        if samples is not None:
+            yield samples
 
-        # Strip whitespace and add to result if not empty
-        cleaned = restored_chunk.strip()
-        if cleaned:
-            result.append(cleaned)
 
-    # If no splits occurred, return the original text as a single chunk
-    if not result:
-        return [text.strip()] if text.strip() else []
+def play_pcm_samples(
+    sample_blocks: Iterable[np.ndarray],
+    sample_rate: int = SAMPLE_RATE,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Play blocks of int16 samples through an audio sink.
 
-    return result
+    Playback starts as soon as the first block is written rather than after
+    the whole utterance has been received. With the default device sink,
+    blocks (or text chunks) play back to back on the shared engine's
+    long-lived device stream.
 
+    Args:
+        sample_blocks: Iterable of mono int16 sample arrays.
+        sample_rate: Sample rate of the audio. Default is SAMPLE_RATE (24kHz).
+        sink: Where to send the audio. None uses the default sink (the sound card).
 
-def play_audio(audio_data: np.ndarray) -> None:
+    Returns:
+        int: Number of samples written to the sink.
     """
-    Play audio data using sounddevice.
+    sink = _resolve_sink(sink)
+    frames = 0
+    try:
+        for samples in sample_blocks:
+            frames += sink.write(samples, sample_rate)
+    except BaseException:
+        sink.clear()
+        raise
+    sink.drain()
+    return frames
+
+
+def play_pcm_stream(
+    chunks: Iterable[bytes],
+    sample_rate: int = SAMPLE_RATE,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Play a stream of raw 16-bit PCM bytes as it arrives.
 
     Args:
-        audio_data: Audio data as numpy array of int16 samples
+        chunks: Iterable of raw 16-bit PCM bytes (e.g. `response.iter_bytes()`).
+        sample_rate: Sample rate of the audio. Default is SAMPLE_RATE (24kHz).
+        sink: Where to send the audio. None uses the default sink (the sound card).
+
+    Returns:
+        int: Number of samples written to the sink.
+
+    Example:
+        >>> audio = stream_tts(["Hello"], return_generator=True)
+        >>> play_pcm_stream(audio, sample_rate=24000)
     """
-    if len(audio_data) > 0:
-        # Convert int16 to float32 and normalize to [-1, 1] range
-        # int16 range is [-32768, 32767]
-        audio_float = audio_data.astype(np.float32) / 32768.0
-        sd.play(audio_float, SAMPLE_RATE)
-        sd.wait()
+    return play_pcm_samples(
+        iter_pcm_samples(chunks), sample_rate, sink
+    )
+
+
+async def async_play_pcm_stream(
+    chunks: AsyncIterable[bytes],
+    sample_rate: int = SAMPLE_RATE,
+    sink: Optional[AudioSink] = None,
+) -> int:
+    """
+    Play an async stream of raw 16-bit PCM bytes as it arrives.
+
+    Writes to the sink (which may block, e.g. while the output engine's ring
+    buffer is full) run in the default executor, so the event loop keeps
+    serving other tasks while audio plays.
+
+    Args:
+        chunks: Async iterable of raw 16-bit PCM bytes (e.g. from `async_stream_tts`).
+        sample_rate: Sample rate of the audio. Default is SAMPLE_RATE (24kHz).
+        sink: Where to send the audio. None uses the default sink (the sound card).
+
+    Returns:
+        int: Number of samples written to the sink.
+
+    Example:
+        >>> audio = async_stream_tts(["Hello"], model="openai/tts-1")
+        >>> await async_play_pcm_stream(audio, sample_rate=24000)
+    """
+    loop = asyncio.get_running_loop()
+    aligner = _PCMSampleAligner()
+    sink = _resolve_sink(sink)
+    frames = 0
+    try:
+        async for chunk in chunks:
+            samples = aligner.push(chunk)
+            if samples is not None:
+                frames += await loop.run_in_executor(
+                    None, sink.write, samples, sample_rate
+                )
+    except BaseException:
+        sink.clear()
+        raise
+    await loop.run_in_executor(None, sink.drain)
+    return frames
 
 
 def get_api_key(env_var_name: str, api_key_url: str) -> str:
@@ -156,6 +275,7 @@ def process_and_play_audio_buffer(
     buffer: bytearray,
     response_format: str,
     warn_on_empty: bool = False,
+    sink: Optional[AudioSink] = None,
 ) -> None:
     """
     Process and play audio buffer based on the response format.
@@ -167,6 +287,7 @@ def process_and_play_audio_buffer(
         buffer: Audio data buffer as bytearray
         response_format: Audio format string (e.g., "pcm", "mp3", "opus", "aac", "flac")
         warn_on_empty: If True, print warning and return instead of raising error when buffer is empty
+        sink: Where to send the audio. None uses the default sink (the sound card).
 
     Raises:
         ValueError: If format is unsupported, dependencies are missing, or decoding fails
@@ -177,7 +298,7 @@ def process_and_play_audio_buffer(
         complete_samples_size = (len(buffer) // 2) * 2
         complete_buffer = bytes(buffer[:complete_samples_size])
         audio = np.frombuffer(complete_buffer, dtype=np.int16)
-        play_audio(audio)
+        play_audio(audio, sink)
         return
 
     # Handle compressed audio formats
@@ -198,7 +319,6 @@ def process_and_play_audio_buffer(
         try:
             import io
             from pydub import AudioSegment
-            from pydub.playback import play
 
             # Create a BytesIO object from the buffer
             audio_bytes = bytes(buffer)
@@ -231,15 +351,19 @@ def process_and_play_audio_buffer(
 
             # Play the audio
             if len(audio_segment) > 0:
-                play(audio_segment)
+                _play_samples(
+                    _audio_segment_samples(audio_segment),
+                    audio_segment.frame_rate,
+                    sink,
+                )
             else:
                 print(
                     f"Warning: Decoded {response_format.upper()} audio is empty. Skipping playback."
                 )
         except ImportError:
             raise ValueError(
-                f"To play {response_format.upper()} format, install pydub and simpleaudio:\n"
-                "  pip install pydub simpleaudio\n"
+                f"To play {response_format.upper()} format, install pydub:\n"
+                "  pip install pydub\n"
                 "Or use return_generator=True to get raw audio bytes, or use response_format='pcm'."
             )
         except Exception as e:
@@ -267,7 +391,7 @@ def process_and_play_audio_buffer(
         raise ValueError(
             f"Unsupported response_format: {response_format}. "
             "Supported formats: pcm, mp3, opus, aac, flac. "
-            "For non-PCM formats, you may need to install pydub and simpleaudio."
+            "For non-PCM formats, you may need to install pydub."
         )
 
 
@@ -324,6 +448,14 @@ def record_audio(
         >>> audio = record_audio(duration=3.0)
         >>> text = speech_to_text(audio_data=audio, sample_rate=16000)
     """
+    try:
+        import sounddevice as sd
+    except (ImportError, OSError):
+        raise ValueError(
+            "Recording requires sounddevice and the PortAudio library. "
+            "Install them with: pip install sounddevice"
+        )
+
     print(f"Recording for {duration} seconds...")
     recording = sd.rec(
         int(duration * sample_rate),
@@ -337,7 +469,10 @@ def record_audio(
 
 
 def process_audio_buffer(
-    buffer: bytearray, output_format: str, sample_rate: int
+    buffer: bytearray,
+    output_format: str,
+    sample_rate: int,
+    sink: Optional[AudioSink] = None,
 ) -> None:
     """
     Process audio buffer and play it.
@@ -346,6 +481,7 @@ def process_audio_buffer(
         buffer: Audio data buffer as bytearray
         output_format: Audio format string (e.g., "pcm_44100", "ulaw_8000", "alaw_8000")
         sample_rate: Sample rate for audio playback
+        sink: Where to send the audio. None uses the default sink (the sound card).
 
     Raises:
         ValueError: If format is unsupported or dependencies are missing
@@ -363,88 +499,36 @@ def process_audio_buffer(
 
                 # Play audio with the appropriate sample rate
                 if len(audio) > 0:
-                    audio_float = audio.astype(np.float32) / 32768.0
-                    sd.play(audio_float, sample_rate)
-                    sd.wait()
+                    _play_samples(audio, sample_rate, sink)
         elif output_format.startswith(
             "ulaw_"
         ) or output_format.startswith("alaw_"):
-            # For μ-law and A-law formats, we need to decode them
-            # These are 8-bit per sample formats
-            try:
-                import audioop
-
-                if output_format.startswith("ulaw_"):
-                    decoded = audioop.ulaw2lin(bytes(buffer), 2)
-                else:  # alaw
-                    decoded = audioop.alaw2lin(bytes(buffer), 2)
-                audio = np.frombuffer(decoded, dtype=np.int16)
-                if len(audio) > 0:
-                    audio_float = audio.astype(np.float32) / 32768.0
-                    sd.play(audio_float, sample_rate)
-                    sd.wait()
-            except ImportError:
-                raise ValueError(
-                    f"Format '{output_format}' requires the 'audioop' module for decoding. "
-                    "Please use PCM format instead (e.g., 'pcm_44100')."
-                )
+            # μ-law and A-law are 8-bit G.711, decoded with lookup tables
+            if output_format.startswith("ulaw_"):
+                audio = ulaw_to_pcm(buffer)
+            else:  # alaw
+                audio = alaw_to_pcm(buffer)
+            if len(audio) > 0:
+                _play_samples(audio, sample_rate, sink)
         elif output_format.startswith("mp3_"):
-            # For MP3 format, decode using pydub
+            # Decode in-process with PyAV when available, else pydub/ffmpeg
             try:
-                from pydub import AudioSegment
-                import io
-
-                # Create AudioSegment from MP3 bytes
-                audio_segment = AudioSegment.from_mp3(
-                    io.BytesIO(bytes(buffer))
-                )
-
-                # Convert to numpy array
-                audio_data = np.array(
-                    audio_segment.get_array_of_samples()
-                )
-
-                # Handle stereo to mono conversion if needed
-                if audio_segment.channels == 2:
-                    audio_data = audio_data.reshape((-1, 2)).mean(
-                        axis=1
-                    )
-
-                # Normalize to float32
-                if audio_segment.sample_width == 1:
-                    # 8-bit audio
-                    audio_float = (
-                        audio_data.astype(np.float32) / 128.0 - 1.0
-                    )
-                elif audio_segment.sample_width == 2:
-                    # 16-bit audio
-                    audio_float = (
-                        audio_data.astype(np.float32) / 32768.0
-                    )
-                elif audio_segment.sample_width == 4:
-                    # 32-bit audio
-                    audio_float = (
-                        audio_data.astype(np.float32) / 2147483648.0
-                    )
-                else:
-                    audio_float = (
-                        audio_data.astype(np.float32) / 32768.0
-                    )
-
-                # Play audio
-                if len(audio_float) > 0:
-                    sd.play(audio_float, audio_segment.frame_rate)
-                    sd.wait()
-            except ImportError:
-                raise ValueError(
-                    f"MP3 format '{output_format}' requires 'pydub' library for decoding. "
-                    "Install it with: pip install pydub\n"
-                    "Note: pydub also requires ffmpeg to be installed on your system."
+                samples = list(
+                    iter_mp3_samples([bytes(buffer)], sample_rate)
                 )
+            except ValueError:
+                # Missing decoder dependencies
+                raise
             except Exception as e:
                 raise ValueError(
                     f"Error decoding MP3 format '{output_format}': {str(e)}. "
-                    "Please ensure pydub and ffmpeg are properly installed."
+                    "Install PyAV (pip install av), or pydub and ffmpeg."
+                )
+
+            # Play audio
+            if samples:
+                _play_samples(
+                    np.concatenate(samples), sample_rate, sink
                 )
         elif output_format.startswith("opus_"):
             # For Opus formats, we'd need to decode first (not implemented)
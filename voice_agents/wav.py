@@ -0,0 +1,196 @@
+import struct
+from typing import Generator, Iterable, Optional
+
+import numpy as np
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Streaming servers write 0 or 0xFFFFFFFF (or 0x7FFFFFFF-ish) sizes because the
+# length is unknown when the header is sent; such data runs to end of stream
+_PLACEHOLDER_SIZE = 0x7FFFF000
+
+
+class WAVStreamParser:
+    """
+    Incremental RIFF/WAV parser that turns a byte stream into mono int16 PCM.
+
+    The header is read from the first bytes of the stream, so samples come
+    out while the rest of the file is still downloading. Unknown chunks (LIST,
+    fact, ...) are skipped. RIFF and data sizes that are 0, 0xFFFFFFFF or
+    otherwise placeholders are ignored and the data runs to end of stream.
+    Frames split across network chunks are carried over to the next push.
+
+    8/16/24/32-bit integer PCM and 32-bit float are supported. Multi-channel
+    audio is reduced to its first channel.
+
+    Attributes:
+        sample_rate (Optional[int]): Sample rate, once the header has been parsed.
+        channels (Optional[int]): Channel count, once the header has been parsed.
+        sample_width (Optional[int]): Bytes per sample, once the header has been parsed.
+
+    Example:
+        >>> parser = WAVStreamParser()
+        >>> for chunk in response.iter_bytes():
+        ...     samples = parser.push(chunk)
+        ...     if samples is not None:
+        ...         engine.write(samples)
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._in_data = False
+        self._data_remaining: Optional[int] = None
+        self._format_tag: Optional[int] = None
+        self._block_align = 0
+        self.sample_rate: Optional[int] = None
+        self.channels: Optional[int] = None
+        self.sample_width: Optional[int] = None
+
+    def _parse_fmt(self, body: bytes) -> None:
+        if len(body) < 16:
+            raise ValueError(
+                "Invalid WAV header: fmt chunk too short."
+            )
+        (
+            format_tag,
+            self.channels,
+            self.sample_rate,
+            _,
+            self._block_align,
+            bits,
+        ) = struct.unpack_from("<HHIIHH", body)
+        if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+            # The real format is the first two bytes of the SubFormat GUID
+            format_tag = struct.unpack_from("<H", body, 24)[0]
+        if format_tag not in (
+            _WAVE_FORMAT_PCM,
+            _WAVE_FORMAT_IEEE_FLOAT,
+        ):
+            raise ValueError(
+                f"Unsupported WAV format tag: {format_tag:#06x}. Only PCM and float WAV can be played."
+            )
+        self._format_tag = format_tag
+        self.sample_width = bits // 8
+        if self.sample_width not in (1, 2, 3, 4) or (
+            format_tag == _WAVE_FORMAT_IEEE_FLOAT
+            and self.sample_width != 4
+        ):
+            raise ValueError(f"Unsupported sample width: {bits} bits")
+        if not self._block_align:
+            self._block_align = self.sample_width * self.channels
+
+    def _parse_header(self) -> bool:
+        """Consume header chunks from the buffer. Returns True once the data chunk starts."""
+        buffer = self._buffer
+        if self._format_tag is None and len(buffer) >= 12:
+            if buffer[:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+                raise ValueError(
+                    "Invalid WAV data: missing RIFF/WAVE header."
+                )
+        offset = 12
+        while len(buffer) >= offset + 8:
+            chunk_id = bytes(buffer[offset : offset + 4])
+            size = struct.unpack_from("<I", buffer, offset + 4)[0]
+            if chunk_id == b"data":
+                if self._format_tag is None:
+                    raise ValueError(
+                        "Invalid WAV data: data chunk before fmt chunk."
+                    )
+                self._data_remaining = (
+                    None
+                    if size == 0 or size >= _PLACEHOLDER_SIZE
+                    else size
+                )
+                del buffer[: offset + 8]
+                self._in_data = True
+                return True
+            # Chunks are word-aligned
+            end = offset + 8 + size + (size & 1)
+            if len(buffer) < end:
+                return False
+            if chunk_id == b"fmt ":
+                self._parse_fmt(
+                    bytes(buffer[offset + 8 : offset + 8 + size])
+                )
+            del buffer[offset + 8 : end]
+            del buffer[offset : offset + 8]
+        return False
+
+    def _to_mono_int16(self, frames: bytes) -> np.ndarray:
+        width = self.sample_width
+        if width == 1:
+            samples = (
+                np.frombuffer(frames, dtype=np.uint8).astype(np.int16)
+                - 128
+            ) << 8
+        elif width == 2:
+            samples = np.frombuffer(frames, dtype="<i2")
+        elif width == 3:
+            # Keep the two most significant bytes of each 24-bit sample
+            raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+            samples = raw[:, 1:].copy().view("<i2").reshape(-1)
+        elif self._format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+            samples = (
+                np.clip(np.frombuffer(frames, dtype="<f4"), -1.0, 1.0)
+                * 32767.0
+            ).astype(np.int16)
+        else:
+            samples = (
+                np.frombuffer(frames, dtype="<i4") >> 16
+            ).astype(np.int16)
+        if self.channels > 1:
+            samples = samples[:: self.channels]
+        return samples.astype(np.int16, copy=False)
+
+    def push(self, chunk: bytes) -> Optional[np.ndarray]:
+        """
+        Add bytes from the stream and return the samples completed by them, if any.
+
+        Raises:
+            ValueError: If the stream is not a playable WAV file.
+        """
+        if not chunk:
+            return None
+        if self._data_remaining == 0:
+            # Declared data length reached; ignore trailing chunks
+            return None
+        self._buffer.extend(chunk)
+        if not self._in_data and not self._parse_header():
+            return None
+
+        usable = len(self._buffer)
+        if self._data_remaining is not None:
+            usable = min(usable, self._data_remaining)
+        usable -= usable % self._block_align
+        if not usable:
+            return None
+        frames = bytes(self._buffer[:usable])
+        del self._buffer[:usable]
+        if self._data_remaining is not None:
+            self._data_remaining -= usable
+        return self._to_mono_int16(frames)
+
+
+def iter_wav_samples(
+    chunks: Iterable[bytes],
+) -> Generator[np.ndarray, None, None]:
+    """
+    Turn a stream of WAV bytes into mono int16 sample arrays as it arrives.
+
+    Args:
+        chunks: Iterable of WAV file bytes (e.g. `stream_tts_groq(..., return_generator=True)`).
+
+    Yields:
+        np.ndarray: int16 samples. The sample rate is the header's; use
+            `WAVStreamParser` directly to read it.
+
+    Raises:
+        ValueError: If the stream is not a playable WAV file.
+    """
+    parser = WAVStreamParser()
+    for chunk in chunks:
+        samples = parser.push(chunk)
+        if samples is not None:
+            yield samples